@@ -178,6 +178,15 @@ KAKAO_CLIENT_ID = secrets["kakao"]["client_id"]
 KAKAO_SECRET = secrets["kakao"]["secret"]
 KAKAO_REDIRECT_URL = secrets["kakao"]["redirect_url"]
 
+# 주소 → 좌표 변환 제공자 (운영: search.geocoding.KakaoLocalProvider)
+GEOCODING_PROVIDER = os.environ.get(
+    "GEOCODING_PROVIDER", "search.geocoding.DistrictCentroidProvider"
+)
+
+# 앱 앞단에서 X-Forwarded-For 에 접속 IP 를 덧붙이는 신뢰할 수 있는 프록시 수
+# (0 이면 헤더를 무시하고 REMOTE_ADDR 사용)
+TRUSTED_PROXY_COUNT = int(os.environ.get("TRUSTED_PROXY_COUNT", "0"))
+
 aligo_api_key = secrets["aligo"]["api_key"]
 aligo_user_id = secrets["aligo"]["user_id"]
 aligo_sender = secrets["aligo"]["sender"]
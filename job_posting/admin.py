@@ -20,6 +20,7 @@ class JobPostingAdmin(admin.ModelAdmin):
     )
     search_fields = ("job_posting_title", "company_id__company_name")
     list_filter = (
+        "is_active",
         "posting_type",
         "employment_type",
         "education",
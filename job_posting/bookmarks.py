@@ -0,0 +1,129 @@
+from typing import Iterable, cast
+from uuid import UUID
+
+from django.db import transaction
+from redis import RedisError
+
+from job_posting.models import JobPostingBookmark
+from user.redis import r
+
+BOOKMARK_CACHE_TTL = 60 * 60 * 24  # 북마크 집합 유지 시간 (초)
+WARM_MARKER = "__warm__"  # DB 에서 전체 북마크를 채웠음을 표시하는 멤버
+
+
+def _bookmark_key(common_user_id: UUID) -> str:
+    return f"bookmark:user:{common_user_id}"
+
+
+def _warm_bookmarks(common_user_id: UUID) -> set[UUID]:
+    """
+    DB 의 북마크 전체를 Redis 집합으로 채우고 북마크한 공고 ID 집합 반환
+    """
+    bookmarked = set(
+        JobPostingBookmark.objects.filter(user_id=common_user_id).values_list(
+            "job_posting_id", flat=True
+        )
+    )
+    key = _bookmark_key(common_user_id)
+    try:
+        pipe = r.pipeline()
+        pipe.sadd(key, WARM_MARKER, *[str(pk) for pk in bookmarked])
+        pipe.expire(key, BOOKMARK_CACHE_TTL)
+        pipe.execute()
+    except RedisError:
+        pass
+    return bookmarked
+
+
+def get_bookmarked_ids(
+    common_user_id: UUID, job_posting_ids: Iterable[UUID]
+) -> set[UUID]:
+    """
+    주어진 공고 중 유저가 북마크한 공고 ID 집합 (SMISMEMBER 한 번)
+    """
+    job_posting_ids = list(job_posting_ids)
+    if not job_posting_ids:
+        return set()
+    try:
+        flags = cast(
+            list[int],
+            r.smismember(
+                _bookmark_key(common_user_id),
+                [WARM_MARKER, *[str(pk) for pk in job_posting_ids]],
+            ),
+        )
+    except RedisError:
+        return set(
+            JobPostingBookmark.objects.filter(
+                user_id=common_user_id, job_posting_id__in=job_posting_ids
+            ).values_list("job_posting_id", flat=True)
+        )
+    if flags[0]:
+        return {pk for pk, flag in zip(job_posting_ids, flags[1:]) if flag}
+    bookmarked = _warm_bookmarks(common_user_id)
+    return {pk for pk in job_posting_ids if pk in bookmarked}
+
+
+def is_job_posting_bookmarked(
+    common_user_id: UUID, job_posting_id: UUID
+) -> bool:
+    return job_posting_id in get_bookmarked_ids(
+        common_user_id, [job_posting_id]
+    )
+
+
+def get_all_bookmarked_ids(common_user_id: UUID) -> set[UUID]:
+    """
+    유저가 북마크한 전체 공고 ID 집합
+    """
+    try:
+        members = cast(set[str], r.smembers(_bookmark_key(common_user_id)))
+    except RedisError:
+        members = set()
+    if WARM_MARKER not in members:
+        return _warm_bookmarks(common_user_id)
+    return {UUID(member) for member in members if member != WARM_MARKER}
+
+
+def _write_through(
+    common_user_id: UUID, job_posting_ids: Iterable[str], added: bool
+) -> None:
+    key = _bookmark_key(common_user_id)
+    members = list(job_posting_ids)
+    if not members:
+        return
+    try:
+        if added:
+            r.sadd(key, *members)
+        else:
+            r.srem(key, *members)
+    except RedisError:
+        # 반영하지 못한 캐시는 버려서 다음 조회 때 DB 에서 다시 채움
+        try:
+            r.delete(key)
+        except RedisError:
+            pass
+
+
+def cache_bookmarks_added(
+    common_user_id: UUID, job_posting_ids: Iterable[UUID]
+) -> None:
+    """
+    북마크 등록을 트랜잭션 커밋 후 Redis 집합에 반영
+    """
+    members = [str(pk) for pk in job_posting_ids]
+    transaction.on_commit(
+        lambda: _write_through(common_user_id, members, added=True)
+    )
+
+
+def cache_bookmarks_removed(
+    common_user_id: UUID, job_posting_ids: Iterable[UUID]
+) -> None:
+    """
+    북마크 삭제를 트랜잭션 커밋 후 Redis 집합에 반영
+    """
+    members = [str(pk) for pk in job_posting_ids]
+    transaction.on_commit(
+        lambda: _write_through(common_user_id, members, added=False)
+    )
@@ -0,0 +1,205 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Optional, cast
+from uuid import UUID
+
+from django.utils.http import parse_etags
+from redis import RedisError
+
+from job_posting.models import JobPosting
+from job_posting.schemas import JobPostingResponseModel
+from user.redis import r
+
+DETAIL_CACHE_TTL = 60 * 10  # 공고 상세 캐시 유지 시간 (초)
+DELETED_MIN_VERSION = 2**31  # 삭제된 공고는 어떤 버전도 다시 캐시하지 않음
+
+# 무효화 이후의 버전만 저장 (무효화 전에 DB 에서 읽은 상세가 늦게 덮어쓰지 않도록)
+# KEYS[1] 공고 상세 캐시 해시, ARGV[1] 상세 JSON, ARGV[2] 수정 시각,
+# ARGV[3] 공고 version, ARGV[4] 유지 시간
+_STORE_IF_CURRENT_SCRIPT = r.register_script(
+    """
+    local floor = redis.call("HGET", KEYS[1], "min_version")
+    if floor and tonumber(ARGV[3]) < tonumber(floor) then
+        return 0
+    end
+    redis.call(
+        "HSET", KEYS[1], "payload", ARGV[1], "updated_at", ARGV[2],
+        "version", ARGV[3]
+    )
+    redis.call("EXPIRE", KEYS[1], ARGV[4])
+    return 1
+    """
+)
+
+# 캐시된 상세를 지우고 저장 가능한 최소 버전만 남김 (기존 값보다 낮추지 않음)
+# KEYS[1] 공고 상세 캐시 해시, ARGV[1] 최소 version, ARGV[2] 유지 시간
+_INVALIDATE_SCRIPT = r.register_script(
+    """
+    local floor = tonumber(redis.call("HGET", KEYS[1], "min_version") or 0)
+    redis.call("DEL", KEYS[1])
+    redis.call(
+        "HSET", KEYS[1], "min_version", math.max(floor, tonumber(ARGV[1]))
+    )
+    redis.call("EXPIRE", KEYS[1], ARGV[2])
+    return 1
+    """
+)
+
+
+def _detail_cache_key(job_posting_id: UUID) -> str:
+    return f"job_posting:detail:{job_posting_id}"
+
+
+def get_job_posting_version(job_posting_id: UUID) -> Optional[datetime]:
+    """
+    공고의 마지막 수정 시각만 읽는 가벼운 조회 (없으면 None)
+    """
+    return (
+        JobPosting.objects.filter(job_posting_id=job_posting_id)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+
+
+def make_job_posting_etag(
+    job_posting_id: UUID, updated_at: datetime, is_bookmarked: bool
+) -> str:
+    """
+    공고 상세 응답용 strong ETag
+
+    공고 수정 시각과 조회자의 북마크 여부가 같으면 응답 본문도 같다.
+    """
+    raw = f"{job_posting_id}:{updated_at.isoformat()}:{int(is_bookmarked)}"
+    return '"%s"' % hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def job_posting_etag_matches(
+    if_match: str, job_posting_id: UUID, updated_at: datetime
+) -> bool:
+    """
+    If-Match 헤더가 현재 공고 상태의 ETag 중 하나와 일치하는지 확인
+
+    ETag 는 조회자의 북마크 여부에 따라 두 가지이므로 둘 다 허용한다.
+    """
+    etags = parse_etags(if_match)
+    if "*" in etags:
+        return True
+    return any(
+        make_job_posting_etag(job_posting_id, updated_at, is_bookmarked)
+        in etags
+        for is_bookmarked in (False, True)
+    )
+
+
+def serialize_job_posting_detail(post: JobPosting) -> str:
+    """
+    조회자와 무관한 공고 상세 정보를 JSON 으로 직렬화 (is_bookmarked 제외)
+    """
+    detail = JobPostingResponseModel(
+        job_posting_id=post.job_posting_id,
+        company_id=post.company_id_id,
+        job_posting_title=post.job_posting_title,
+        address=post.address,
+        city=post.city,
+        district=post.district,
+        location=(post.location.x, post.location.y),
+        work_time_start=post.work_time_start,
+        work_time_end=post.work_time_end,
+        posting_type=post.posting_type,
+        employment_type=post.employment_type,
+        job_keyword_main=post.job_keyword_main,
+        job_keyword_sub=post.job_keyword_sub,
+        number_of_positions=post.number_of_positions,
+        education=post.education,
+        deadline=post.deadline,
+        time_discussion=post.time_discussion,
+        day_discussion=post.day_discussion,
+        work_day=post.work_day,
+        salary_type=post.salary_type,
+        salary=post.salary,
+        summary=post.summary,
+        content=post.content,
+        version=post.version,
+        is_bookmarked=False,
+    )
+    return detail.model_dump_json(exclude={"is_bookmarked"})
+
+
+def get_cached_job_posting(
+    job_posting_id: UUID,
+) -> Optional[tuple[str, datetime]]:
+    """
+    캐시된 (공고 상세 JSON, 수정 시각) 을 조회, 없거나 Redis 장애 시 None
+    """
+    try:
+        payload, updated_at = cast(
+            list[Optional[str]],
+            r.hmget(
+                _detail_cache_key(job_posting_id), ["payload", "updated_at"]
+            ),
+        )
+    except RedisError:
+        return None
+    if payload is None or updated_at is None:
+        return None
+    return payload, datetime.fromisoformat(updated_at)
+
+
+def cache_job_posting(post: JobPosting) -> tuple[str, datetime]:
+    """
+    공고 상세 JSON 을 만들어 캐시에 저장하고 (JSON, 수정 시각) 을 반환
+
+    무효화 이후 더 낮은 버전이면 저장하지 않고 JSON 만 반환한다.
+    """
+    payload = serialize_job_posting_detail(post)
+    try:
+        _STORE_IF_CURRENT_SCRIPT(
+            keys=[_detail_cache_key(post.job_posting_id)],
+            args=[
+                payload,
+                post.updated_at.isoformat(),
+                post.version,
+                DETAIL_CACHE_TTL,
+            ],
+        )
+    except RedisError:
+        pass
+    return payload, post.updated_at
+
+
+def invalidate_job_posting_cache(
+    job_posting_id: UUID, version: Optional[int] = None
+) -> None:
+    """
+    공고 상세 캐시 무효화
+
+    version 은 수정 후 공고 버전으로, 이보다 낮은 버전은 유지 시간 동안 다시
+    캐시되지 않는다. 삭제된 공고는 version 을 생략해 재캐시를 막는다.
+    """
+    try:
+        _INVALIDATE_SCRIPT(
+            keys=[_detail_cache_key(job_posting_id)],
+            args=[
+                DELETED_MIN_VERSION if version is None else version,
+                DETAIL_CACHE_TTL,
+            ],
+        )
+    except RedisError:
+        pass
+
+
+def render_job_posting_detail(
+    message: str, payload: str, is_bookmarked: bool
+) -> str:
+    """
+    캐시된 공고 JSON 끝에 조회자별 is_bookmarked 를 붙여 응답 본문 생성
+    """
+    job_posting = "%s,%s}" % (
+        payload[:-1],
+        '"is_bookmarked":%s' % json.dumps(is_bookmarked),
+    )
+    return '{"message":%s,"job_posting":%s}' % (
+        json.dumps(message),
+        job_posting,
+    )
@@ -0,0 +1,78 @@
+from typing import Iterable
+from uuid import UUID
+
+from django.db.models import F
+
+from job_posting.models import JobPosting, JobPostingCard
+from user.models import CompanyInfo
+
+# 공고 테이블에서 그대로 복사하는 카드 컬럼
+POSTING_CARD_FIELDS = (
+    "job_posting_title",
+    "summary",
+    "deadline",
+    "city",
+    "district",
+    "town",
+)
+# 기업 테이블에서 복사하는 카드 컬럼
+COMPANY_CARD_FIELDS = ("company_name", "company_address")
+
+
+def refresh_job_posting_cards(
+    job_posting_ids: Iterable[UUID],
+) -> dict[UUID, JobPostingCard]:
+    """
+    주어진 공고들의 카드를 원본 테이블에서 다시 만들어 upsert
+    """
+    rows = JobPosting.objects.filter(job_posting_id__in=job_posting_ids).values(
+        "job_posting_id",
+        "company_id",
+        *POSTING_CARD_FIELDS,
+        company_name=F("company_id__company_name"),
+        company_address=F("company_id__company_address"),
+    )
+    cards = [
+        JobPostingCard(
+            job_posting_id=row.pop("job_posting_id"),
+            company_id=row.pop("company_id"),
+            **row,
+        )
+        for row in rows
+    ]
+    if cards:
+        JobPostingCard.objects.bulk_create(
+            cards,
+            update_conflicts=True,
+            unique_fields=["job_posting"],
+            update_fields=[*POSTING_CARD_FIELDS, *COMPANY_CARD_FIELDS],
+        )
+    return {card.job_posting_id: card for card in cards}
+
+
+def refresh_company_cards(company: CompanyInfo) -> int:
+    """
+    기업명 / 주소 변경 시 해당 기업의 모든 카드를 한 번에 갱신
+    """
+    return JobPostingCard.objects.filter(company=company).update(
+        company_name=company.company_name,
+        company_address=company.company_address,
+    )
+
+
+def get_job_posting_cards(
+    job_posting_ids: Iterable[UUID],
+) -> dict[UUID, JobPostingCard]:
+    """
+    공고 ID 목록으로 카드를 한 번에 조회
+
+    아직 카드가 없는 공고는 즉시 만들어 채운다.
+    """
+    job_posting_ids = list(job_posting_ids)
+    cards: dict[UUID, JobPostingCard] = JobPostingCard.objects.in_bulk(
+        job_posting_ids
+    )
+    missing = [pk for pk in job_posting_ids if pk not in cards]
+    if missing:
+        cards.update(refresh_job_posting_cards(missing))
+    return cards
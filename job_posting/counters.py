@@ -0,0 +1,65 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+from job_posting.models import JobPosting, JobPostingBookmark
+from resume.models import Submission
+
+
+def adjust_bookmark_count(job_posting_ids: Iterable[UUID], delta: int) -> None:
+    """
+    북마크 수 증감 (북마크 생성 / 삭제와 같은 트랜잭션에서 호출)
+    """
+    JobPosting.objects.filter(job_posting_id__in=list(job_posting_ids)).update(
+        bookmark_count=Greatest(F("bookmark_count") + delta, 0)
+    )
+
+
+def adjust_submission_count(job_posting_id: UUID, delta: int) -> None:
+    """
+    지원자 수 증감 (지원 생성 / 삭제와 같은 트랜잭션에서 호출)
+    """
+    JobPosting.objects.filter(job_posting_id=job_posting_id).update(
+        submission_count=Greatest(F("submission_count") + delta, 0)
+    )
+
+
+def _count_subquery(model, field: str) -> Coalesce:
+    counts = (
+        model.objects.filter(**{field: OuterRef("job_posting_id")})
+        .order_by()
+        .values(field)
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def reconcile_posting_counters(
+    batch_size: int = 1000, job_posting_ids: Optional[list[UUID]] = None
+) -> int:
+    """
+    북마크 / 지원자 수를 실제 행 수로 다시 계산해 누적 오차를 바로잡음
+
+    공고 ID 순으로 batch_size 씩 끊어 UPDATE 하며, 갱신된 공고 수를 반환한다.
+    """
+    postings = JobPosting.objects.order_by("job_posting_id")
+    if job_posting_ids is not None:
+        postings = postings.filter(job_posting_id__in=job_posting_ids)
+
+    total = 0
+    last_id = None
+    while True:
+        batch = postings
+        if last_id is not None:
+            batch = batch.filter(job_posting_id__gt=last_id)
+        ids = list(batch.values_list("job_posting_id", flat=True)[:batch_size])
+        if not ids:
+            return total
+        total += JobPosting.objects.filter(job_posting_id__in=ids).update(
+            bookmark_count=_count_subquery(JobPostingBookmark, "job_posting"),
+            submission_count=_count_subquery(Submission, "job_posting"),
+        )
+        last_id = ids[-1]
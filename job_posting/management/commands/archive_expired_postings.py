@@ -0,0 +1,107 @@
+import json
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+
+from job_posting.cache import invalidate_job_posting_cache
+from job_posting.models import JobPosting, JobPostingArchive
+from job_posting.recommend import remove_job_postings
+
+
+class Command(BaseCommand):
+    """
+    마감된 공고 비활성화 및 보관 처리 (cron 등으로 매일 실행)
+
+    1. 마감일이 지난 공고를 is_active=False 로 바꿔 부분 인덱스에서 제외
+    2. 마감 후 보관 기간이 지났고 지원 내역이 없는 공고를
+       JobPostingArchive 로 옮기고 원본 테이블에서 삭제
+    """
+
+    help = "마감된 공고를 배치 단위로 비활성화하고 보관 테이블로 옮깁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 처리할 공고 수",
+        )
+        parser.add_argument(
+            "--retention-days",
+            type=int,
+            default=90,
+            help="마감 후 원본 테이블에 남겨 둘 일수",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        today = timezone.localdate()
+
+        deactivated = self.deactivate_expired(today, batch_size)
+        archived = self.archive_expired(
+            today - timedelta(days=options["retention_days"]), batch_size
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"비활성화 {deactivated}건, 보관 처리 {archived}건 완료"
+            )
+        )
+
+    def deactivate_expired(self, today, batch_size: int) -> int:
+        total = 0
+        while True:
+            ids = list(
+                JobPosting.objects.filter(
+                    is_active=True, deadline__lt=today
+                ).values_list("job_posting_id", flat=True)[:batch_size]
+            )
+            if not ids:
+                return total
+            total += JobPosting.objects.filter(job_posting_id__in=ids).update(
+                is_active=False
+            )
+            remove_job_postings(ids)
+
+    def archive_expired(self, cutoff, batch_size: int) -> int:
+        total = 0
+        while True:
+            # 지원 내역이 남아 있는 공고는 지원서 보존을 위해 옮기지 않음
+            rows = list(
+                JobPosting.objects.filter(
+                    is_active=False,
+                    deadline__lt=cutoff,
+                    submissions_job_posting__isnull=True,
+                ).values()[:batch_size]
+            )
+            if not rows:
+                return total
+
+            archives = []
+            for row in rows:
+                archives.append(
+                    JobPostingArchive(
+                        job_posting_id=row["job_posting_id"],
+                        company_id=row["company_id_id"],
+                        job_posting_title=row["job_posting_title"],
+                        deadline=row["deadline"],
+                        posted_at=row["created_at"],
+                        data=json.loads(
+                            json.dumps(
+                                {**row, "location": row["location"].wkt},
+                                cls=DjangoJSONEncoder,
+                            )
+                        ),
+                    )
+                )
+            ids = [row["job_posting_id"] for row in rows]
+            with transaction.atomic():
+                JobPostingArchive.objects.bulk_create(
+                    archives, ignore_conflicts=True
+                )
+                JobPosting.objects.filter(job_posting_id__in=ids).delete()
+            for job_posting_id in ids:
+                invalidate_job_posting_cache(job_posting_id)
+            total += len(ids)
@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from job_posting.view_counts import flush_view_counts
+
+
+class Command(BaseCommand):
+    """
+    Redis 에 쌓인 공고 조회수를 DB 에 일괄 반영
+
+    --interval 을 주면 해당 주기(초)마다 계속 반영하는 워커로 동작한다.
+    """
+
+    help = "Redis 에 누적된 공고 조회수를 DB 에 일괄 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="반복 주기(초), 0 이면 한 번만 실행",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="UPDATE 한 번에 반영할 공고 수",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            total = 0
+            while True:
+                flushed = flush_view_counts(options["batch_size"])
+                if not flushed:
+                    break
+                total += flushed
+            self.stdout.write(f"조회수 반영 공고 {total}건")
+
+            if not options["interval"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from job_posting.recommend import rebuild_recommendations
+
+
+class Command(BaseCommand):
+    """
+    관심 키워드별 추천 후보 전체 재구성 (배포 직후 / cron 으로 주기 실행)
+
+    평소에는 공고 등록 / 수정 / 조회수 반영 시 후보가 점진적으로 갱신되며,
+    북마크 / 지원자 수 변화처럼 점진 갱신에서 빠지는 인기도를 맞추는 용도다.
+    """
+
+    help = "모집 중인 공고로 관심 키워드별 추천 후보를 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 색인할 공고 수",
+        )
+
+    def handle(self, *args, **options):
+        total = rebuild_recommendations(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"공고 {total}건 색인 완료"))
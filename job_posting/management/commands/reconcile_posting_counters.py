@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from job_posting.counters import reconcile_posting_counters
+
+
+class Command(BaseCommand):
+    """
+    공고별 북마크 / 지원자 수 재계산 (cron 등으로 주기 실행)
+    """
+
+    help = "공고별 북마크 수와 지원자 수를 실제 데이터 기준으로 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="UPDATE 한 번에 처리할 공고 수",
+        )
+
+    def handle(self, *args, **options):
+        total = reconcile_posting_counters(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"공고 {total}건 재계산 완료"))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2 on 2025-05-02 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "job_posting",
+            "0003_jobposting_town_alter_jobposting_address_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                fields=["-created_at", "-job_posting_id"],
+                name="job_posting_newest_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                fields=["deadline", "job_posting_id"],
+                name="job_posting_deadline_idx",
+            ),
+        ),
+    ]
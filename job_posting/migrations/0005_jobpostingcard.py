@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_job_posting_cards(apps, schema_editor):
+    JobPosting = apps.get_model("job_posting", "JobPosting")
+    JobPostingCard = apps.get_model("job_posting", "JobPostingCard")
+
+    cards = [
+        JobPostingCard(
+            job_posting_id=post.job_posting_id,
+            company_id=post.company_id_id,
+            job_posting_title=post.job_posting_title,
+            summary=post.summary,
+            deadline=post.deadline,
+            company_name=post.company_id.company_name,
+            company_address=post.company_id.company_address,
+            city=post.city,
+            district=post.district,
+            town=post.town,
+        )
+        for post in JobPosting.objects.select_related("company_id").iterator()
+    ]
+    JobPostingCard.objects.bulk_create(cards, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_posting", "0004_jobposting_job_posting_newest_idx_and_more"),
+        ("user", "0006_alter_companyinfo_certificate_image_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobPostingCard",
+            fields=[
+                (
+                    "job_posting",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="card",
+                        serialize=False,
+                        to="job_posting.jobposting",
+                    ),
+                ),
+                ("job_posting_title", models.CharField(max_length=50)),
+                ("summary", models.CharField(max_length=50)),
+                ("deadline", models.DateField()),
+                ("company_name", models.CharField(max_length=50)),
+                ("company_address", models.CharField(max_length=100)),
+                ("city", models.CharField(max_length=10)),
+                ("district", models.CharField(max_length=10)),
+                ("town", models.CharField(max_length=10)),
+                (
+                    "company",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="job_posting_cards",
+                        to="user.companyinfo",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "공고 카드",
+                "verbose_name_plural": "공고 카드 목록",
+            },
+        ),
+        migrations.RunPython(fill_job_posting_cards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:56
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def deactivate_expired_postings(apps, schema_editor):
+    JobPosting = apps.get_model("job_posting", "JobPosting")
+    JobPosting.objects.filter(deadline__lt=timezone.localdate()).update(
+        is_active=False
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_posting", "0005_jobpostingcard"),
+        ("user", "0006_alter_companyinfo_certificate_image_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobPostingArchive",
+            fields=[
+                (
+                    "job_posting_id",
+                    models.UUIDField(primary_key=True, serialize=False),
+                ),
+                ("company_id", models.UUIDField(db_index=True)),
+                ("job_posting_title", models.CharField(max_length=50)),
+                ("deadline", models.DateField()),
+                ("posted_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+                ("data", models.JSONField()),
+            ],
+            options={
+                "verbose_name": "보관된 공고",
+                "verbose_name_plural": "보관된 공고 목록",
+            },
+        ),
+        migrations.AddField(
+            model_name="jobposting",
+            name="is_active",
+            field=models.BooleanField(default=True),
+        ),
+        migrations.RunPython(
+            deactivate_expired_postings, migrations.RunPython.noop
+        ),
+        # 아래 부분 인덱스로 대체되는 전체 테이블 인덱스
+        migrations.RemoveIndex(
+            model_name="jobposting",
+            name="job_posting_newest_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="jobposting",
+            name="job_posting_deadline_idx",
+        ),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-created_at", "-job_posting_id"],
+                name="jp_active_newest_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["deadline", "job_posting_id"],
+                name="jp_active_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["city", "district", "town"],
+                name="jp_active_region_idx",
+            ),
+        ),
+    ]
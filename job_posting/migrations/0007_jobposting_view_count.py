@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_posting", "0006_jobposting_is_active_jobpostingarchive"),
+        ("user", "0006_alter_companyinfo_certificate_image_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobposting",
+            name="unique_viewer_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="jobposting",
+            name="view_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-view_count", "-job_posting_id"],
+                name="jp_active_popular_idx",
+            ),
+        ),
+    ]
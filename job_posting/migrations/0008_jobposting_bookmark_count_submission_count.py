@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:58
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_posting_counters(apps, schema_editor):
+    JobPosting = apps.get_model("job_posting", "JobPosting")
+    JobPostingBookmark = apps.get_model("job_posting", "JobPostingBookmark")
+    Submission = apps.get_model("resume", "Submission")
+
+    def count_subquery(model):
+        counts = (
+            model.objects.filter(job_posting=OuterRef("job_posting_id"))
+            .order_by()
+            .values("job_posting")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    JobPosting.objects.update(
+        bookmark_count=count_subquery(JobPostingBookmark),
+        submission_count=count_subquery(Submission),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_posting", "0007_jobposting_view_count"),
+        ("resume", "0011_alter_submission_memo"),
+        ("user", "0006_alter_companyinfo_certificate_image_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobposting",
+            name="bookmark_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="jobposting",
+            name="submission_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_posting_counters, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-bookmark_count", "-job_posting_id"],
+                name="jp_active_bookmarks_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobposting",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-submission_count", "-job_posting_id"],
+                name="jp_active_submissions_idx",
+            ),
+        ),
+    ]
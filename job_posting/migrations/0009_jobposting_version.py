@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_posting", "0008_jobposting_bookmark_count_submission_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobposting",
+            name="version",
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_posting", "0009_jobposting_version"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobpostingbookmark",
+            index=models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="bookmark_user_newest_idx",
+            ),
+        ),
+    ]
@@ -51,6 +51,71 @@ class JobPosting(TimestampModel):
     salary = models.IntegerField()  # 급여 금액
     summary = models.CharField(max_length=50)  # 공고 요약
     content = models.TextField(null=True)  # 공고 상세 내용
+    is_active = models.BooleanField(default=True)  # 모집 중 여부 (마감 전)
+    view_count = models.PositiveIntegerField(default=0)  # 조회수
+    unique_viewer_count = models.PositiveIntegerField(
+        default=0
+    )  # 순 방문자 수 (추정치)
+    bookmark_count = models.PositiveIntegerField(default=0)  # 북마크 수
+    submission_count = models.PositiveIntegerField(default=0)  # 지원자 수
+    version = models.PositiveIntegerField(default=1)  # 수정 버전 (낙관적 잠금)
+
+    class Meta:
+        indexes = [
+            # 모집 중인 공고만 담는 부분 인덱스 (리스트 / 검색 기본 대상)
+            # 공고 리스트 최신순 / 마감임박순 keyset 페이지네이션
+            models.Index(
+                fields=["-created_at", "-job_posting_id"],
+                condition=models.Q(is_active=True),
+                name="jp_active_newest_idx",
+            ),
+            models.Index(
+                fields=["deadline", "job_posting_id"],
+                condition=models.Q(is_active=True),
+                name="jp_active_deadline_idx",
+            ),
+            models.Index(
+                fields=["-view_count", "-job_posting_id"],
+                condition=models.Q(is_active=True),
+                name="jp_active_popular_idx",
+            ),
+            models.Index(
+                fields=["-bookmark_count", "-job_posting_id"],
+                condition=models.Q(is_active=True),
+                name="jp_active_bookmarks_idx",
+            ),
+            models.Index(
+                fields=["-submission_count", "-job_posting_id"],
+                condition=models.Q(is_active=True),
+                name="jp_active_submissions_idx",
+            ),
+            models.Index(
+                fields=["city", "district", "town"],
+                condition=models.Q(is_active=True),
+                name="jp_active_region_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return self.job_posting_title
+
+
+class JobPostingArchive(models.Model):
+    """
+    마감 후 보관 기간이 지난 공고를 옮겨 두는 보관 테이블
+    """
+
+    job_posting_id = models.UUIDField(primary_key=True)  # 원본 공고글 ID
+    company_id = models.UUIDField(db_index=True)  # 등록 기업 ID
+    job_posting_title = models.CharField(max_length=50)  # 공고글 제목
+    deadline = models.DateField()  # 지원 마감일
+    posted_at = models.DateTimeField()  # 원본 공고 작성일자
+    archived_at = models.DateTimeField(auto_now_add=True)  # 보관 처리 일자
+    data = models.JSONField()  # 원본 공고 전체 컬럼
+
+    class Meta:
+        verbose_name = "보관된 공고"
+        verbose_name_plural = "보관된 공고 목록"
 
     def __str__(self):
         return self.job_posting_title
@@ -74,8 +139,51 @@ class JobPostingBookmark(TimestampModel):
 
     class Meta:
         unique_together = ("user", "job_posting")  # 북마크 중복 방지
+        indexes = [
+            # 유저별 북마크 목록 최신순 keyset 페이지네이션
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="bookmark_user_newest_idx",
+            ),
+        ]
         verbose_name = "공고 북마크"
         verbose_name_plural = "공고 북마크 목록"
 
     def __str__(self):
         return f"{self.user}_{self.job_posting.job_posting_title}"
+
+
+class JobPostingCard(models.Model):
+    """
+    공고 카드 조회용 비정규화 테이블
+
+    리스트형 응답에서 공고 - 기업 조인 없이 카드를 바로 읽기 위해 사용하며
+    공고 또는 기업 정보가 변경될 때 job_posting.cards 에서 갱신한다.
+    """
+
+    job_posting = models.OneToOneField(
+        "job_posting.JobPosting",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="card",
+    )
+    company = models.ForeignKey(
+        "user.CompanyInfo",
+        on_delete=models.CASCADE,
+        related_name="job_posting_cards",
+    )
+    job_posting_title = models.CharField(max_length=50)  # 공고글 제목
+    summary = models.CharField(max_length=50)  # 공고 요약
+    deadline = models.DateField()  # 지원 마감일
+    company_name = models.CharField(max_length=50)  # 회사명
+    company_address = models.CharField(max_length=100)  # 회사 주소
+    city = models.CharField(max_length=10)  # 시,도
+    district = models.CharField(max_length=10)  # 시,군,구
+    town = models.CharField(max_length=10)  # 읍,면,동
+
+    class Meta:
+        verbose_name = "공고 카드"
+        verbose_name_plural = "공고 카드 목록"
+
+    def __str__(self):
+        return self.job_posting_title
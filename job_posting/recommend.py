@@ -0,0 +1,331 @@
+import math
+import uuid
+from typing import Any, Iterable, Optional, cast
+from uuid import UUID
+
+from django.db import transaction
+from redis import RedisError
+
+from job_posting.bookmarks import get_all_bookmarked_ids
+from job_posting.models import JobPosting
+from resume.models import Submission
+from user.models import UserInfo
+from user.redis import r
+
+KEYWORD_KEY_PREFIX = "recommend:keyword:"  # 관심 키워드별 후보 공고 ZSET
+POSTING_KEYWORDS_KEY = "recommend:posting_keywords"  # 공고별 색인 키워드
+GEO_KEY = "recommend:geo"  # 공고 근무지 좌표 (GEO)
+REBUILD_KEY_PREFIX = "recommend:rebuild:"  # 전체 재구성 중 임시로 쓰는 키
+
+MAX_CANDIDATES_PER_KEYWORD = 1000  # 키워드별로 유지할 후보 수
+CANDIDATE_POOL_SIZE = 200  # 요청 시 키워드별로 읽는 후보 수
+RECENCY_SCALE_SECONDS = 60 * 60 * 24 * 3  # 3일 최신이면 인기 점수 1 만큼 가산
+DISTANCE_SCALE_KM = 10.0  # 10km 멀어질 때마다 점수 1 만큼 감산
+SCORE_FIELDS = (
+    "job_posting_id",
+    "job_keyword_main",
+    "job_keyword_sub",
+    "location",
+    "created_at",
+    "view_count",
+    "bookmark_count",
+    "submission_count",
+    "is_active",
+)
+
+
+def _keyword_key(keyword: str) -> str:
+    return f"{KEYWORD_KEY_PREFIX}{keyword}"
+
+
+def score_job_posting(row: dict[str, Any]) -> float:
+    """
+    최신성 + 인기도 점수
+
+    등록 시각을 RECENCY_SCALE_SECONDS 로 나눈 값에 인기도의 로그를 더한다.
+    시간이 흘러도 공고 간 상대 순서가 유지되므로 점수를 주기적으로
+    감쇠시킬 필요 없이 인기도가 바뀐 공고만 다시 계산하면 된다.
+    """
+    popularity = (
+        row["view_count"]
+        + 5 * row["bookmark_count"]
+        + 10 * row["submission_count"]
+    )
+    return row["created_at"].timestamp() / RECENCY_SCALE_SECONDS + math.log1p(
+        popularity
+    )
+
+
+def _posting_keywords(row: dict[str, Any]) -> list[str]:
+    keywords = [row["job_keyword_main"], *row["job_keyword_sub"]]
+    return sorted({keyword for keyword in keywords if keyword})
+
+
+def _index_rows(rows: list[dict[str, Any]]) -> None:
+    """
+    공고 행을 키워드별 ZSET 에 반영 (키워드가 빠진 ZSET 에서는 제거)
+    """
+    if not rows:
+        return
+    ids = [str(row["job_posting_id"]) for row in rows]
+    previous = cast(list[Optional[str]], r.hmget(POSTING_KEYWORDS_KEY, ids))
+
+    pipe = r.pipeline()
+    touched = set()
+    for row, job_posting_id, old in zip(rows, ids, previous):
+        keywords = _posting_keywords(row) if row["is_active"] else []
+        for keyword in set(old.split("|") if old else []) - set(keywords):
+            pipe.zrem(_keyword_key(keyword), job_posting_id)
+        if not keywords:
+            pipe.hdel(POSTING_KEYWORDS_KEY, job_posting_id)
+            pipe.zrem(GEO_KEY, job_posting_id)
+            continue
+
+        score = score_job_posting(row)
+        for keyword in keywords:
+            pipe.zadd(_keyword_key(keyword), {job_posting_id: score})
+            touched.add(keyword)
+        pipe.hset(POSTING_KEYWORDS_KEY, job_posting_id, "|".join(keywords))
+        location = row["location"]
+        pipe.geoadd(GEO_KEY, (location.x, location.y, job_posting_id))
+
+    # 키워드별 상위 후보만 유지
+    for keyword in touched:
+        pipe.zremrangebyrank(
+            _keyword_key(keyword), 0, -(MAX_CANDIDATES_PER_KEYWORD + 1)
+        )
+    pipe.execute()
+
+
+def index_job_postings(job_posting_ids: Iterable[UUID]) -> None:
+    """
+    공고 등록 / 수정 / 인기도 변경 시 추천 후보를 점진적으로 갱신
+    """
+    job_posting_ids = list(job_posting_ids)
+    if not job_posting_ids:
+        return
+    rows = list(
+        JobPosting.objects.filter(job_posting_id__in=job_posting_ids).values(
+            *SCORE_FIELDS
+        )
+    )
+    # 삭제되어 조회되지 않는 공고는 후보에서 제거
+    found = {row["job_posting_id"] for row in rows}
+    missing = [pk for pk in job_posting_ids if pk not in found]
+    try:
+        _index_rows(rows)
+        if missing:
+            remove_job_postings(missing)
+    except RedisError:
+        # 다음 rebuild_recommendations 실행 때 다시 반영됨
+        pass
+
+
+def remove_job_postings(job_posting_ids: Iterable[UUID]) -> None:
+    """
+    삭제 / 마감된 공고를 추천 후보에서 제거
+    """
+    ids = [str(pk) for pk in job_posting_ids]
+    if not ids:
+        return
+    try:
+        previous = cast(list[Optional[str]], r.hmget(POSTING_KEYWORDS_KEY, ids))
+        pipe = r.pipeline()
+        for job_posting_id, old in zip(ids, previous):
+            for keyword in old.split("|") if old else []:
+                pipe.zrem(_keyword_key(keyword), job_posting_id)
+        pipe.hdel(POSTING_KEYWORDS_KEY, *ids)
+        pipe.zrem(GEO_KEY, *ids)
+        pipe.execute()
+    except RedisError:
+        pass
+
+
+def schedule_index_job_postings(job_posting_ids: Iterable[UUID]) -> None:
+    """
+    트랜잭션 커밋 후 추천 후보 갱신
+    """
+    ids = list(job_posting_ids)
+    transaction.on_commit(lambda: index_job_postings(ids))
+
+
+def schedule_remove_job_postings(job_posting_ids: Iterable[UUID]) -> None:
+    """
+    트랜잭션 커밋 후 추천 후보에서 제거
+    """
+    ids = list(job_posting_ids)
+    transaction.on_commit(lambda: remove_job_postings(ids))
+
+
+def _stage_rows(
+    rows: list[dict[str, Any]], prefix: str, keywords: set[str]
+) -> None:
+    """
+    재구성 중인 임시 키에 공고 행을 색인 (색인한 키워드는 keywords 에 추가)
+    """
+    pipe = r.pipeline()
+    touched = set()
+    for row in rows:
+        job_posting_id = str(row["job_posting_id"])
+        posting_keywords = _posting_keywords(row)
+        if not posting_keywords:
+            continue
+        score = score_job_posting(row)
+        for keyword in posting_keywords:
+            pipe.zadd(
+                f"{prefix}{_keyword_key(keyword)}", {job_posting_id: score}
+            )
+            touched.add(keyword)
+        pipe.hset(
+            f"{prefix}{POSTING_KEYWORDS_KEY}",
+            job_posting_id,
+            "|".join(posting_keywords),
+        )
+        location = row["location"]
+        pipe.geoadd(
+            f"{prefix}{GEO_KEY}", (location.x, location.y, job_posting_id)
+        )
+    for keyword in touched:
+        pipe.zremrangebyrank(
+            f"{prefix}{_keyword_key(keyword)}",
+            0,
+            -(MAX_CANDIDATES_PER_KEYWORD + 1),
+        )
+    pipe.execute()
+    keywords |= touched
+
+
+def rebuild_recommendations(batch_size: int = 1000) -> int:
+    """
+    모집 중인 전체 공고로 추천 후보를 다시 만듦
+
+    재구성하는 동안에도 기존 후보로 추천할 수 있도록 임시 키에 색인한 뒤,
+    마지막에 하나의 MULTI 로 기존 키를 RENAME 해 교체한다.
+    새 후보에 없는 키워드의 기존 ZSET 은 같은 MULTI 에서 삭제한다.
+    """
+    prefix = f"{REBUILD_KEY_PREFIX}{uuid.uuid4().hex}:"
+    keywords: set[str] = set()
+    postings = JobPosting.objects.filter(is_active=True).order_by(
+        "job_posting_id"
+    )
+    total = 0
+    last_id = None
+    try:
+        while True:
+            batch = postings
+            if last_id is not None:
+                batch = batch.filter(job_posting_id__gt=last_id)
+            rows = list(batch.values(*SCORE_FIELDS)[:batch_size])
+            if not rows:
+                break
+            _stage_rows(rows, prefix, keywords)
+            total += len(rows)
+            last_id = rows[-1]["job_posting_id"]
+    except Exception:
+        staged = list(r.scan_iter(match=f"{prefix}*", count=1000))
+        if staged:
+            r.delete(*staged)
+        raise
+
+    live_keys = set(r.scan_iter(match=f"{KEYWORD_KEY_PREFIX}*", count=1000))
+    new_keys = {_keyword_key(keyword) for keyword in keywords}
+    pipe = r.pipeline(transaction=True)
+    for key in new_keys:
+        pipe.rename(f"{prefix}{key}", key)
+    stale = live_keys - new_keys
+    if stale:
+        pipe.delete(*stale)
+    if keywords:
+        pipe.rename(f"{prefix}{POSTING_KEYWORDS_KEY}", POSTING_KEYWORDS_KEY)
+        pipe.rename(f"{prefix}{GEO_KEY}", GEO_KEY)
+    else:
+        pipe.delete(POSTING_KEYWORDS_KEY, GEO_KEY)
+    pipe.execute()
+    return total
+
+
+def _haversine_km(lng1: float, lat1: float, lng2: float, lat2: float) -> float:
+    lng1, lat1, lng2, lat2 = map(math.radians, (lng1, lat1, lng2, lat2))
+    a = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 6371.0 * 2 * math.asin(math.sqrt(a))
+
+
+def _excluded_ids(user: UserInfo) -> set[UUID]:
+    """
+    이미 북마크했거나 지원한 공고
+    """
+    applied = set(
+        Submission.objects.filter(user=user).values_list(
+            "job_posting_id", flat=True
+        )
+    )
+    return applied | get_all_bookmarked_ids(user.common_user_id)
+
+
+def _fallback_recommendations(
+    keywords: list[str], excluded: set[UUID], size: int
+) -> list[UUID]:
+    """
+    Redis 장애 시 관심 직종의 최신 공고로 대체
+    """
+    return list(
+        JobPosting.objects.filter(is_active=True, job_keyword_main__in=keywords)
+        .exclude(job_posting_id__in=excluded)
+        .order_by("-created_at", "-job_posting_id")
+        .values_list("job_posting_id", flat=True)[:size]
+    )
+
+
+def recommend_job_postings(
+    user: UserInfo,
+    size: int,
+    location: Optional[tuple[float, float]] = None,
+) -> list[UUID]:
+    """
+    관심 분야별 후보를 합쳐 추천 공고 ID 를 점수순으로 반환
+
+    location (경도, 위도) 이 주어지면 거리만큼 점수를 깎아 재정렬한다.
+    """
+    keywords = [keyword for keyword in user.interest if keyword]
+    if not keywords:
+        return []
+    excluded = _excluded_ids(user)
+
+    try:
+        pipe = r.pipeline(transaction=False)
+        for keyword in keywords:
+            pipe.zrevrange(
+                _keyword_key(keyword),
+                0,
+                CANDIDATE_POOL_SIZE - 1,
+                withscores=True,
+            )
+        # 여러 관심 분야에 걸친 공고는 가장 높은 점수를 사용
+        scores: dict[str, float] = {}
+        for members in pipe.execute():
+            for member, score in members:
+                if UUID(member) not in excluded:
+                    scores[member] = max(score, scores.get(member, score))
+
+        if location is not None and scores:
+            members = list(scores)
+            positions = cast(
+                list[Optional[tuple[float, float]]],
+                r.geopos(GEO_KEY, *members),
+            )
+            for member, position in zip(members, positions):
+                if position is not None:
+                    scores[member] -= (
+                        _haversine_km(
+                            location[0], location[1], position[0], position[1]
+                        )
+                        / DISTANCE_SCALE_KM
+                    )
+    except RedisError:
+        return _fallback_recommendations(keywords, excluded, size)
+
+    ranked = sorted(scores, key=lambda member: (-scores[member], member))
+    return [UUID(member) for member in ranked[:size]]
@@ -1,8 +1,8 @@
 from datetime import date, time
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from utils.schemas import MY_CONFIG
 
@@ -17,7 +17,8 @@ class JobPostingCreateModel(BaseModel):
     address: str
     city: str
     district: str
-    location: tuple[float, float]  # (경도, 위도)
+    # (경도, 위도), 생략하면 address 를 서버에서 좌표로 변환
+    location: Optional[tuple[float, float]] = None
     work_time_start: time
     work_time_end: time
     posting_type: str
@@ -65,6 +66,7 @@ class JobPostingResponseModel(BaseModel):
     salary: int
     summary: str
     content: Optional[str]
+    version: int = 1
     is_bookmarked: bool
 
 
@@ -91,6 +93,8 @@ class JobPostingListModel(BaseModel):
     summary: str
     deadline: date
     is_bookmarked: bool
+    bookmark_count: int = 0
+    submission_count: int = 0
 
 
 class JobPostingListResponseModel(BaseModel):
@@ -101,35 +105,37 @@ class JobPostingListResponseModel(BaseModel):
     model_config = MY_CONFIG
     message: str
     data: List[JobPostingListModel]
+    next_cursor: Optional[str] = None
 
 
 class JobPostingUpdateModel(BaseModel):
     """
-    공고 수정 스키마
+    공고 수정 스키마 (보낸 필드만 수정, version 은 낙관적 잠금용)
     """
 
     model_config = MY_CONFIG
-    job_posting_title: Optional[str]
-    address: Optional[str]
-    city: Optional[str]
-    district: Optional[str]
-    location: Optional[tuple[float, float]]
-    work_time_start: Optional[time]
-    work_time_end: Optional[time]
-    posting_type: Optional[str]
-    employment_type: Optional[str]
-    job_keyword_main: Optional[str]
-    job_keyword_sub: Optional[List[str]]
-    number_of_positions: Optional[int]
-    education: Optional[str]
-    deadline: Optional[date]
-    time_discussion: Optional[bool]
-    day_discussion: Optional[bool]
-    work_day: Optional[List[str]]
-    salary_type: Optional[str]
-    salary: Optional[int]
-    summary: Optional[str]
-    content: Optional[str]
+    job_posting_title: Optional[str] = None
+    address: Optional[str] = None
+    city: Optional[str] = None
+    district: Optional[str] = None
+    location: Optional[tuple[float, float]] = None
+    work_time_start: Optional[time] = None
+    work_time_end: Optional[time] = None
+    posting_type: Optional[str] = None
+    employment_type: Optional[str] = None
+    job_keyword_main: Optional[str] = None
+    job_keyword_sub: Optional[List[str]] = None
+    number_of_positions: Optional[int] = None
+    education: Optional[str] = None
+    deadline: Optional[date] = None
+    time_discussion: Optional[bool] = None
+    day_discussion: Optional[bool] = None
+    work_day: Optional[List[str]] = None
+    salary_type: Optional[str] = None
+    salary: Optional[int] = None
+    summary: Optional[str] = None
+    content: Optional[str] = None
+    version: Optional[int] = None
 
 
 class BookmarkResponseModel(BaseModel):
@@ -159,3 +165,105 @@ class JobPostingBookmarkListResponseModel(BaseModel):
 
     message: str
     data: List[JobPostingBookmarkListItemModel]
+    next_cursor: Optional[str] = None
+
+
+class BookmarkSyncOperationModel(BaseModel):
+    """
+    북마크 동기화 단위 작업 (오프라인에서 쌓인 토글 1건)
+    """
+
+    job_posting_id: UUID
+    action: Literal["add", "remove"]
+
+
+class BookmarkSyncRequestModel(BaseModel):
+    """
+    북마크 일괄 동기화 요청 스키마 (순서대로 적용, 같은 공고는 마지막 작업 우선)
+    """
+
+    operations: List[BookmarkSyncOperationModel] = Field(max_length=500)
+
+
+class BookmarkSyncResponseModel(BaseModel):
+    """
+    북마크 일괄 동기화 응답 스키마
+    """
+
+    message: str
+    added_count: int
+    removed_count: int
+    invalid_job_posting_ids: List[UUID]
+    bookmarked_job_posting_ids: List[UUID]
+
+
+class JobPostingImportRowResultModel(BaseModel):
+    """
+    공고 일괄 등록 행별 처리 결과
+    """
+
+    row: int
+    status: str  # "created" | "error"
+    job_posting_id: Optional[UUID] = None
+    errors: List[str] = []
+
+
+class JobPostingBulkImportResponseModel(BaseModel):
+    """
+    공고 일괄 등록 응답 스키마
+    """
+
+    message: str
+    created_count: int
+    failed_count: int
+    results: List[JobPostingImportRowResultModel]
+
+
+class CompanyJobPostingStatsModel(BaseModel):
+    """
+    기업 대시보드 공고별 통계
+    """
+
+    job_posting_id: UUID
+    job_posting_title: str
+    deadline: date
+    is_active: bool
+    submission_count: int
+    unread_count: int
+    bookmark_count: int
+    days_to_deadline: int
+
+
+class CompanyStatsResponseModel(BaseModel):
+    """
+    기업 대시보드 통계 응답 스키마
+    """
+
+    message: str
+    total_submission_count: int
+    total_unread_count: int
+    job_postings: List[CompanyJobPostingStatsModel]
+
+
+class RecommendedJobPostingModel(BaseModel):
+    """
+    추천 공고 항목 스키마
+    """
+
+    job_posting_id: UUID
+    job_posting_title: str
+    company_name: str
+    company_address: str
+    city: str
+    district: str
+    summary: str
+    deadline: date
+
+
+class JobPostingRecommendationResponseModel(BaseModel):
+    """
+    추천 공고 조회 응답 스키마
+    """
+
+    message: str
+    data: List[RecommendedJobPostingModel]
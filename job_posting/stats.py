@@ -0,0 +1,134 @@
+import json
+from datetime import date
+from typing import Any, Iterable, Optional, cast
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+from redis import RedisError
+
+from job_posting.models import JobPosting
+from job_posting.schemas import (
+    CompanyJobPostingStatsModel,
+    CompanyStatsResponseModel,
+)
+from user.redis import r
+
+STATS_CACHE_TTL = 60 * 5  # 기업 대시보드 집계 캐시 유지 시간 (초)
+
+
+def _stats_cache_key(company_id: UUID) -> str:
+    return f"job_posting:stats:{company_id}"
+
+
+def _aggregate_company_postings(company_id: UUID) -> list[dict[str, Any]]:
+    """
+    기업의 공고별 지원자 수 / 미열람 수를 GROUP BY 한 번으로 집계
+
+    북마크 수는 공고에 유지되는 bookmark_count 를 그대로 읽어
+    지원서와 북마크를 함께 JOIN 할 때의 행 곱셈을 피한다.
+    """
+    rows = (
+        JobPosting.objects.filter(company_id=company_id)
+        .values(
+            "job_posting_id",
+            "job_posting_title",
+            "deadline",
+            "is_active",
+            "bookmark_count",
+        )
+        .annotate(
+            submission_total=Count("submissions_job_posting"),
+            unread_total=Count(
+                "submissions_job_posting",
+                filter=Q(submissions_job_posting__is_read=False),
+            ),
+        )
+        .order_by("deadline", "job_posting_id")
+    )
+    return [
+        {
+            "job_posting_id": str(row["job_posting_id"]),
+            "job_posting_title": row["job_posting_title"],
+            "deadline": row["deadline"].isoformat(),
+            "is_active": row["is_active"],
+            "bookmark_count": row["bookmark_count"],
+            "submission_count": row["submission_total"],
+            "unread_count": row["unread_total"],
+        }
+        for row in rows
+    ]
+
+
+def _get_cached_rows(company_id: UUID) -> Optional[list[dict[str, Any]]]:
+    try:
+        payload = cast(Optional[str], r.get(_stats_cache_key(company_id)))
+    except RedisError:
+        return None
+    if payload is None:
+        return None
+    return json.loads(payload)
+
+
+def _cache_rows(company_id: UUID, rows: list[dict[str, Any]]) -> None:
+    try:
+        r.set(
+            _stats_cache_key(company_id), json.dumps(rows), ex=STATS_CACHE_TTL
+        )
+    except RedisError:
+        pass
+
+
+def get_company_stats(company_id: UUID) -> CompanyStatsResponseModel:
+    """
+    기업 대시보드 통계 (캐시 우선, 없으면 집계 후 캐시)
+
+    남은 일수는 날짜가 바뀌면 달라지므로 캐시하지 않고 응답 시점에 계산한다.
+    """
+    rows = _get_cached_rows(company_id)
+    if rows is None:
+        rows = _aggregate_company_postings(company_id)
+        _cache_rows(company_id, rows)
+
+    today = timezone.localdate()
+    job_postings = [
+        CompanyJobPostingStatsModel(
+            **row,
+            days_to_deadline=(date.fromisoformat(row["deadline"]) - today).days,
+        )
+        for row in rows
+    ]
+    return CompanyStatsResponseModel(
+        message="Successfully loaded company stats",
+        total_submission_count=sum(p.submission_count for p in job_postings),
+        total_unread_count=sum(p.unread_count for p in job_postings),
+        job_postings=job_postings,
+    )
+
+
+def _delete_stats(company_id: UUID) -> None:
+    try:
+        r.delete(_stats_cache_key(company_id))
+    except RedisError:
+        pass
+
+
+def invalidate_company_stats(company_id: UUID) -> None:
+    """
+    지원 / 열람 / 공고 변경 시 기업 통계 캐시 무효화 (트랜잭션 커밋 후)
+    """
+    transaction.on_commit(lambda: _delete_stats(company_id))
+
+
+def invalidate_posting_company_stats(job_posting_ids: Iterable[UUID]) -> None:
+    """
+    공고들이 속한 기업의 통계 캐시 무효화 (기업별 한 번씩, 북마크 변경 등)
+    """
+    company_ids = set(
+        JobPosting.objects.filter(
+            job_posting_id__in=list(job_posting_ids)
+        ).values_list("company_id", flat=True)
+    )
+    for company_id in company_ids:
+        invalidate_company_stats(company_id)
@@ -0,0 +1,84 @@
+import pytest
+from django.contrib.gis.geos import Point
+from django.test.client import Client
+from django.utils import timezone
+
+from job_posting.models import JobPosting
+from user.models import CommonUser, CompanyInfo
+
+
+@pytest.fixture
+def client():
+    """Django 테스트 Client 객체 생성"""
+    return Client()
+
+
+# mock 기업 common_user 생성
+@pytest.fixture
+def mock_common_company_user(db):
+    return CommonUser.objects.create(
+        email="company@test.com",
+        password="1q2w3e4r",
+        join_type="company",
+        is_active=True,
+        last_login=None,
+    )
+
+
+# mock 기업 유저 생성
+@pytest.fixture
+def mock_company_user(db, mock_common_company_user):
+    return CompanyInfo.objects.create(
+        common_user=mock_common_company_user,
+        company_name="테스트 기업",
+        establishment="2024-02-01",
+        company_address="인천광역시 미추홀구 주안동",
+        business_registration_number="13231321312",
+        company_introduction="안녕하세요 테스트 기업입니다.",
+        ceo_name="덕배최강짱",
+        manager_name="김휘수",
+        manager_email="test@treqwe.com",
+        manager_phone_number="123123",
+    )
+
+
+def _create_job_posting(company, title, deadline_days):
+    return JobPosting.objects.create(
+        job_posting_title=title,
+        location=Point(127.0276, 37.4979, srid=4326),
+        work_time_start=timezone.now(),
+        work_time_end=timezone.now() + timezone.timedelta(hours=8),
+        posting_type="정규직",
+        employment_type="경력",
+        city="인천광역시",
+        district="부평구",
+        town="부평동",
+        job_keyword_main="개발",
+        job_keyword_sub=["백엔드"],
+        number_of_positions=1,
+        company_id=company,
+        education="대학교 졸업",
+        deadline=timezone.now() + timezone.timedelta(days=deadline_days),
+        time_discussion=True,
+        day_discussion=True,
+        work_day=["월", "화", "수", "목", "금"],
+        salary_type="연봉",
+        salary=50000000,
+        summary=f"{title} 요약",
+        content="주요 업무: 백엔드 개발",
+    )
+
+
+# 공고 생성 함수 (기업, 제목, 오늘 기준 마감까지 남은 일수)
+@pytest.fixture
+def create_job_posting(db):
+    return _create_job_posting
+
+
+# mock 공고 5개 생성 (마감일이 서로 다름)
+@pytest.fixture
+def mock_job_postings(db, mock_company_user):
+    return [
+        _create_job_posting(mock_company_user, f"공고 {index}", 10 - index)
+        for index in range(5)
+    ]
@@ -0,0 +1,112 @@
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+
+from job_posting.models import JobPosting, JobPostingArchive, JobPostingBookmark
+from job_posting.recommend import KEYWORD_KEY_PREFIX, REBUILD_KEY_PREFIX
+from job_posting.view_counts import record_job_posting_view
+from user.models import CommonUser, UserInfo
+from user.redis import r
+
+
+@pytest.mark.django_db
+def test_archive_expired_postings(mock_company_user, create_job_posting):
+    """
+    마감된 공고는 비활성화되고, 보관 기간이 지나면 보관 테이블로 이동
+    """
+    active = create_job_posting(mock_company_user, "모집 중 공고", 10)
+    expired = create_job_posting(mock_company_user, "마감 공고", -3)
+    old = create_job_posting(mock_company_user, "오래된 공고", -30)
+
+    call_command("archive_expired_postings", "--retention-days", "7")
+
+    active.refresh_from_db()
+    expired.refresh_from_db()
+    assert active.is_active is True
+    assert expired.is_active is False
+    assert not JobPosting.objects.filter(
+        job_posting_id=old.job_posting_id
+    ).exists()
+    archive = JobPostingArchive.objects.get(job_posting_id=old.job_posting_id)
+    assert archive.job_posting_title == "오래된 공고"
+    assert archive.data["summary"] == old.summary
+
+
+@pytest.mark.django_db
+def test_flush_view_counts(mock_company_user, create_job_posting):
+    """
+    Redis 에 누적된 조회수 / 순 방문자 수가 DB 에 반영되는지 확인
+    """
+    posting = create_job_posting(mock_company_user, "조회수 공고", 10)
+    for viewer_id in ["ip:1.1.1.1", "ip:1.1.1.1", "ip:2.2.2.2"]:
+        record_job_posting_view(posting.job_posting_id, viewer_id)
+
+    call_command("flush_view_counts")
+
+    posting.refresh_from_db()
+    assert posting.view_count == 3
+    assert posting.unique_viewer_count == 2
+
+
+@pytest.mark.django_db
+def test_reconcile_posting_counters(mock_company_user, create_job_posting):
+    """
+    어긋난 북마크 / 지원자 수를 실제 행 수로 바로잡음
+    """
+    posting = create_job_posting(mock_company_user, "카운터 공고", 10)
+    user = CommonUser.objects.create(
+        email="user@test.com", password="1q2w3e4r", join_type="user"
+    )
+    JobPostingBookmark.objects.create(user=user, job_posting=posting)
+    JobPosting.objects.filter(job_posting_id=posting.job_posting_id).update(
+        bookmark_count=5, submission_count=3
+    )
+
+    call_command("reconcile_posting_counters")
+
+    posting.refresh_from_db()
+    assert posting.bookmark_count == 1
+    assert posting.submission_count == 0
+
+
+@pytest.mark.django_db
+def test_rebuild_recommendations(client, mock_company_user, create_job_posting):
+    """
+    관심 분야가 같은 공고를 추천하고 북마크한 공고는 제외하며,
+    더 이상 쓰이지 않는 키워드의 기존 후보는 교체 시 삭제
+    """
+    newer = create_job_posting(mock_company_user, "최신 공고", 10)
+    older = create_job_posting(mock_company_user, "이전 공고", 10)
+    bookmarked = create_job_posting(mock_company_user, "북마크 공고", 10)
+    JobPosting.objects.filter(job_posting_id=older.job_posting_id).update(
+        created_at=newer.created_at - timedelta(days=30)
+    )
+    common_user = CommonUser.objects.create(
+        email="normal@test.com", password="1q2w3e4r", join_type="normal"
+    )
+    UserInfo.objects.create(
+        common_user=common_user,
+        name="테스트",
+        phone_number="01012341234",
+        gender="male",
+        interest=["개발"],
+    )
+    JobPostingBookmark.objects.create(user=common_user, job_posting=bookmarked)
+
+    stale_key = f"{KEYWORD_KEY_PREFIX}없어진 분야"
+    r.zadd(stale_key, {str(older.job_posting_id): 1})
+
+    call_command("rebuild_recommendations")
+    assert not r.exists(stale_key)
+    assert not list(r.scan_iter(match=f"{REBUILD_KEY_PREFIX}*"))
+    client.force_login(common_user)
+    response = client.get("/api/job-postings/job-postings/recommendations/")
+    data = json.loads(response.content)
+
+    assert response.status_code == 200
+    assert [item["job_posting_id"] for item in data["data"]] == [
+        str(newer.job_posting_id),
+        str(older.job_posting_id),
+    ]
@@ -0,0 +1,505 @@
+import json
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.gis.geos import Point
+from django.test import RequestFactory
+
+from job_posting.cache import (
+    cache_job_posting,
+    get_cached_job_posting,
+    invalidate_job_posting_cache,
+)
+from job_posting.cards import get_job_posting_cards, refresh_company_cards
+from job_posting.models import JobPosting, JobPostingBookmark, JobPostingCard
+from job_posting.view_counts import get_viewer_id
+from search.geocoding import GeocodingError, GeocodingProvider
+from search.models import GeocodeCache
+
+
+@pytest.mark.django_db
+def test_job_posting_list_cursor_pagination(client, mock_job_postings):
+    """
+    공고 리스트 커서 페이지네이션으로 전체 공고를 중복 없이 순회
+    """
+    url = "/api/job-postings/job-postings/"
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"size": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params)
+        assert response.status_code == 200
+        body = json.loads(response.content)
+        assert len(body["data"]) <= 2
+        seen.extend(item["job_posting_id"] for item in body["data"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(
+        str(posting.job_posting_id) for posting in mock_job_postings
+    )
+    # 최신순 기본 정렬
+    assert seen[0] == str(mock_job_postings[-1].job_posting_id)
+
+
+@pytest.mark.django_db
+def test_job_posting_list_deadline_sort(client, mock_job_postings):
+    """
+    마감임박순 정렬
+    """
+    url = "/api/job-postings/job-postings/"
+
+    response = client.get(url, {"sort": "deadline", "size": 3})
+    body = json.loads(response.content)
+
+    assert response.status_code == 200
+    deadlines = [item["deadline"] for item in body["data"]]
+    assert deadlines == sorted(deadlines)
+    assert body["next_cursor"] is not None
+
+
+@pytest.mark.django_db
+def test_job_posting_list_invalid_sort(client, mock_job_postings):
+    url = "/api/job-postings/job-postings/"
+
+    response = client.get(url, {"sort": "unknown"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_job_posting_cards_follow_company_update(
+    mock_company_user, mock_job_postings
+):
+    """
+    카드가 없으면 조회 시 생성되고, 기업명 변경이 카드에 반영되는지 확인
+    """
+    JobPostingCard.objects.all().delete()
+    job_posting_ids = [p.job_posting_id for p in mock_job_postings]
+
+    cards = get_job_posting_cards(job_posting_ids)
+    assert set(cards) == set(job_posting_ids)
+
+    mock_company_user.company_name = "바뀐 기업"
+    mock_company_user.save()
+    refresh_company_cards(mock_company_user)
+
+    cards = get_job_posting_cards(job_posting_ids)
+    assert all(card.company_name == "바뀐 기업" for card in cards.values())
+
+
+@pytest.mark.django_db
+def test_job_posting_detail_conditional_get(client, mock_job_postings):
+    """
+    ETag / Last-Modified 를 이용한 조건부 요청은 304 응답
+    """
+    posting = mock_job_postings[0]
+    url = f"/api/job-postings/job-postings/{posting.job_posting_id}/"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    last_modified = response["Last-Modified"]
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == 304
+
+    posting.summary = "수정된 요약"
+    posting.save()
+    invalidate_job_posting_cache(posting.job_posting_id)
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_job_posting_cache_ignores_stale_write_back(mock_job_postings):
+    """
+    무효화 전에 읽은 이전 버전 공고는 무효화 이후 다시 캐시되지 않음
+    """
+    stale = JobPosting.objects.get(
+        job_posting_id=mock_job_postings[0].job_posting_id
+    )
+    current = JobPosting.objects.get(job_posting_id=stale.job_posting_id)
+    current.summary = "수정된 요약"
+    current.version += 1
+    current.save()
+    invalidate_job_posting_cache(current.job_posting_id, current.version)
+
+    cache_job_posting(stale)
+    assert get_cached_job_posting(current.job_posting_id) is None
+
+    cache_job_posting(current)
+    payload, _ = get_cached_job_posting(current.job_posting_id)
+    assert json.loads(payload)["summary"] == "수정된 요약"
+
+    invalidate_job_posting_cache(current.job_posting_id)
+    cache_job_posting(current)
+    assert get_cached_job_posting(current.job_posting_id) is None
+
+
+@pytest.mark.django_db
+def test_job_posting_detail_served_from_cache(client, mock_job_postings):
+    """
+    캐시된 공고 상세는 DB 조회 없이 응답하고 is_bookmarked 를 덧붙임
+    """
+    posting = mock_job_postings[0]
+    url = f"/api/job-postings/job-postings/{posting.job_posting_id}/"
+
+    first = json.loads(client.get(url).content)
+
+    JobPosting.objects.filter(job_posting_id=posting.job_posting_id).update(
+        summary="캐시 밖에서 바뀐 요약"
+    )
+    second = json.loads(client.get(url).content)
+
+    assert second == first
+    assert second["job_posting"]["is_bookmarked"] is False
+
+
+@pytest.mark.django_db
+def test_job_posting_bulk_import_jsonl(
+    client, mock_common_company_user, mock_company_user
+):
+    """
+    JSON Lines 일괄 등록 시 행별 결과를 반환하고 유효한 행만 등록
+    """
+    row = {
+        "job_posting_title": "일괄 등록 공고",
+        "address": "인천광역시 부평구 부평동 1-1",
+        "city": "인천광역시",
+        "district": "부평구",
+        "location": [126.72, 37.49],
+        "work_time_start": "09:00:00",
+        "work_time_end": "18:00:00",
+        "posting_type": "정규직",
+        "employment_type": "신입",
+        "job_keyword_main": "개발",
+        "job_keyword_sub": ["백엔드"],
+        "number_of_positions": 1,
+        "education": "학력무관",
+        "deadline": "2030-01-01",
+        "time_discussion": False,
+        "day_discussion": False,
+        "work_day": ["월", "화"],
+        "salary_type": "월급",
+        "salary": 3000000,
+        "summary": "일괄 등록 요약",
+        "content": None,
+    }
+    body = "\n".join(
+        [json.dumps(row), json.dumps({"job_posting_title": "누락"}), "{bad"]
+    )
+    client.force_login(mock_common_company_user)
+
+    response = client.post(
+        "/api/job-postings/job-postings/bulk/",
+        body,
+        content_type="application/x-ndjson",
+    )
+    data = json.loads(response.content)
+
+    assert response.status_code == 201
+    assert data["created_count"] == 1
+    assert data["failed_count"] == 2
+    assert [result["status"] for result in data["results"]] == [
+        "created",
+        "error",
+        "error",
+    ]
+    assert JobPosting.objects.filter(
+        job_posting_id=data["results"][0]["job_posting_id"]
+    ).exists()
+
+
+class FailingGeocodingProvider(GeocodingProvider):
+    name = "failing"
+
+    def geocode_many(self, addresses):
+        raise GeocodingError("provider unavailable")
+
+
+@pytest.mark.django_db
+def test_job_posting_bulk_import_geocoding_outage(
+    client, mock_common_company_user, mock_company_user, monkeypatch
+):
+    """
+    좌표 변환 제공자 장애 시 주소 변환 행만 오류로 보고하고 나머지는 등록
+    """
+    monkeypatch.setattr(
+        "search.geocoding.get_geocoding_provider",
+        lambda: FailingGeocodingProvider(),
+    )
+    row = {
+        "job_posting_title": "일괄 등록 공고",
+        "address": "인천광역시 부평구 부평동 1-1",
+        "city": "인천광역시",
+        "district": "부평구",
+        "location": [126.72, 37.49],
+        "work_time_start": "09:00:00",
+        "work_time_end": "18:00:00",
+        "posting_type": "정규직",
+        "employment_type": "신입",
+        "job_keyword_main": "개발",
+        "job_keyword_sub": ["백엔드"],
+        "number_of_positions": 1,
+        "education": "학력무관",
+        "deadline": "2030-01-01",
+        "time_discussion": False,
+        "day_discussion": False,
+        "work_day": ["월", "화"],
+        "salary_type": "월급",
+        "salary": 3000000,
+        "summary": "일괄 등록 요약",
+        "content": None,
+    }
+    body = "\n".join([json.dumps(row), json.dumps({**row, "location": None})])
+    client.force_login(mock_common_company_user)
+
+    response = client.post(
+        "/api/job-postings/job-postings/bulk/",
+        body,
+        content_type="application/x-ndjson",
+    )
+    data = json.loads(response.content)
+
+    assert response.status_code == 201
+    assert [result["status"] for result in data["results"]] == [
+        "created",
+        "error",
+    ]
+    assert "좌표 변환 서비스 오류" in data["results"][1]["errors"][0]
+    assert not GeocodeCache.objects.exists()
+
+
+@pytest.mark.django_db
+def test_company_stats(client, mock_common_company_user, mock_job_postings):
+    """
+    기업 대시보드 통계는 공고별 지원자 / 북마크 / 남은 일수를 반환
+    """
+    client.force_login(mock_common_company_user)
+
+    response = client.get("/api/job-postings/company/stats/")
+    data = json.loads(response.content)
+
+    assert response.status_code == 200
+    assert data["total_submission_count"] == 0
+    assert len(data["job_postings"]) == len(mock_job_postings)
+    assert [p["days_to_deadline"] for p in data["job_postings"]] == sorted(
+        p["days_to_deadline"] for p in data["job_postings"]
+    )
+
+
+@pytest.mark.django_db
+def test_company_stats_follow_bookmarks(
+    client,
+    mock_common_company_user,
+    mock_job_postings,
+    django_capture_on_commit_callbacks,
+):
+    """
+    북마크 등록 / 삭제 시 캐시된 기업 통계가 바로 무효화됨
+    """
+    posting = mock_job_postings[0]
+    stats_url = "/api/job-postings/company/stats/"
+    bookmark_url = (
+        f"/api/job-postings/job-postings/bookmark/{posting.job_posting_id}/"
+    )
+    client.force_login(mock_common_company_user)
+
+    def bookmark_count():
+        data = json.loads(client.get(stats_url).content)
+        return next(
+            p["bookmark_count"]
+            for p in data["job_postings"]
+            if p["job_posting_id"] == str(posting.job_posting_id)
+        )
+
+    assert bookmark_count() == 0
+    with django_capture_on_commit_callbacks(execute=True):
+        assert client.post(bookmark_url).status_code == 201
+    assert bookmark_count() == 1
+    with django_capture_on_commit_callbacks(execute=True):
+        assert client.delete(bookmark_url).status_code == 200
+    assert bookmark_count() == 0
+
+
+@pytest.mark.django_db
+def test_company_stats_requires_company_user(client):
+    response = client.get("/api/job-postings/company/stats/")
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_job_posting_patch_optimistic_lock(
+    client, mock_common_company_user, mock_job_postings
+):
+    """
+    바뀐 필드만 수정하고 버전을 올리며, 이전 버전으로 수정하면 412 응답
+    """
+    posting = mock_job_postings[0]
+    url = f"/api/job-postings/job-postings/{posting.job_posting_id}/"
+    client.force_login(mock_common_company_user)
+
+    response = client.patch(
+        url,
+        json.dumps({"summary": "새 요약", "version": 1}),
+        content_type="application/json",
+    )
+    data = json.loads(response.content)
+    assert response.status_code == 200
+    assert data["job_posting"]["version"] == 2
+    assert data["job_posting"]["summary"] == "새 요약"
+
+    response = client.patch(
+        url,
+        json.dumps({"summary": "늦은 요약", "version": 1}),
+        content_type="application/json",
+    )
+    assert response.status_code == 412
+
+    posting.refresh_from_db()
+    assert posting.summary == "새 요약"
+    assert posting.version == 2
+
+
+class FixedGeocodingProvider(GeocodingProvider):
+    name = "fixed"
+
+    def geocode_many(self, addresses):
+        return {
+            address: Point(126.72, 37.49, srid=4326) for address in addresses
+        }
+
+
+@pytest.mark.django_db
+def test_job_posting_patch_address_regeocodes(
+    client, mock_common_company_user, mock_job_postings, monkeypatch
+):
+    """
+    좌표 없이 주소만 수정하면 새 주소로 좌표를 다시 조회하고,
+    제공자 장애 시에는 수정하지 않고 503 응답
+    """
+    posting = mock_job_postings[0]
+    url = f"/api/job-postings/job-postings/{posting.job_posting_id}/"
+    client.force_login(mock_common_company_user)
+    monkeypatch.setattr(
+        "search.geocoding.get_geocoding_provider",
+        lambda: FailingGeocodingProvider(),
+    )
+
+    response = client.patch(
+        url,
+        json.dumps({"address": "인천광역시 부평구 부평동 1"}),
+        content_type="application/json",
+    )
+    assert response.status_code == 503
+    posting.refresh_from_db()
+    assert posting.version == 1
+
+    monkeypatch.setattr(
+        "search.geocoding.get_geocoding_provider",
+        lambda: FixedGeocodingProvider(),
+    )
+    response = client.patch(
+        url,
+        json.dumps({"address": "인천광역시 부평구 부평동 1"}),
+        content_type="application/json",
+    )
+    data = json.loads(response.content)
+
+    assert response.status_code == 200
+    assert data["job_posting"]["location"] == [126.72, 37.49]
+    posting.refresh_from_db()
+    assert posting.address == "인천광역시 부평구 부평동 1"
+    assert (posting.location.x, posting.location.y) == (126.72, 37.49)
+
+
+@pytest.mark.django_db
+def test_job_posting_bookmark_sync(
+    client, mock_common_company_user, mock_job_postings
+):
+    """
+    오프라인 토글을 한 번에 반영하고 최종 북마크 목록을 반환
+    """
+    first, second, third = mock_job_postings[:3]
+    JobPostingBookmark.objects.create(
+        user=mock_common_company_user, job_posting=third
+    )
+    client.force_login(mock_common_company_user)
+    unknown = "00000000-0000-0000-0000-000000000000"
+    operations = [
+        {"job_posting_id": str(first.job_posting_id), "action": "add"},
+        {"job_posting_id": str(second.job_posting_id), "action": "add"},
+        {"job_posting_id": str(second.job_posting_id), "action": "remove"},
+        {"job_posting_id": str(third.job_posting_id), "action": "remove"},
+        {"job_posting_id": unknown, "action": "add"},
+    ]
+
+    response = client.post(
+        "/api/job-postings/job-postings/bookmark/sync/",
+        json.dumps({"operations": operations}),
+        content_type="application/json",
+    )
+    data = json.loads(response.content)
+
+    assert response.status_code == 200
+    assert data["added_count"] == 1
+    assert data["removed_count"] == 1
+    assert data["invalid_job_posting_ids"] == [unknown]
+    assert data["bookmarked_job_posting_ids"] == [str(first.job_posting_id)]
+    first.refresh_from_db()
+    assert first.bookmark_count == 1
+
+
+@pytest.mark.django_db
+def test_job_posting_bookmark_list_cursor(
+    client, mock_common_company_user, mock_job_postings
+):
+    """
+    북마크 목록은 북마크한 순서의 최신순으로 커서 페이지네이션
+    """
+    for posting in mock_job_postings:
+        JobPostingBookmark.objects.create(
+            user=mock_common_company_user, job_posting=posting
+        )
+    client.force_login(mock_common_company_user)
+    url = "/api/job-postings/job-postings/bookmark/"
+
+    first = json.loads(client.get(url, {"size": 3}).content)
+    second = json.loads(
+        client.get(url, {"size": 3, "cursor": first["next_cursor"]}).content
+    )
+
+    seen = [item["job_posting_id"] for item in first["data"] + second["data"]]
+    assert seen == [
+        str(posting.job_posting_id) for posting in reversed(mock_job_postings)
+    ]
+    assert second["next_cursor"] is None
+
+
+def test_viewer_id_ignores_spoofed_forwarded_for(settings):
+    """
+    신뢰하는 프록시가 없으면 X-Forwarded-For 를 무시하고,
+    있으면 그 프록시가 덧붙인 항목만 사용
+    """
+    request = RequestFactory().get(
+        "/", HTTP_X_FORWARDED_FOR="1.1.1.1, 2.2.2.2", REMOTE_ADDR="10.0.0.1"
+    )
+    request.user = AnonymousUser()
+
+    settings.TRUSTED_PROXY_COUNT = 0
+    assert get_viewer_id(request) == "ip:10.0.0.1"
+    settings.TRUSTED_PROXY_COUNT = 1
+    assert get_viewer_id(request) == "ip:2.2.2.2"
+    settings.TRUSTED_PROXY_COUNT = 3
+    assert get_viewer_id(request) == "ip:10.0.0.1"
@@ -1,6 +1,10 @@
 from django.urls import path
 
+from ..views.import_views import JobPostingBulkImportView
+from ..views.recommend_views import JobPostingRecommendationView
+from ..views.stats_views import CompanyStatsView
 from ..views.views import (
+    JobPostingBookmarkSyncView,
     JobPostingBookmarkView,
     JobPostingDetailView,
     JobPostingListView,
@@ -11,6 +15,18 @@ urlpatterns = [
     path(
         "job-postings/", JobPostingListView.as_view(), name="job_posting_list"
     ),
+    # 공고 일괄 등록 API (JSON Lines / CSV)
+    path(
+        "job-postings/bulk/",
+        JobPostingBulkImportView.as_view(),
+        name="job_posting_bulk_import",
+    ),
+    # 관심 분야 기반 추천 공고 API
+    path(
+        "job-postings/recommendations/",
+        JobPostingRecommendationView.as_view(),
+        name="job_posting_recommendations",
+    ),
     # 공고 상세 조회, 생성, 수정, 삭제 API
     path(
         "job-postings/<uuid:job_posting_id>/",
@@ -23,9 +39,21 @@ urlpatterns = [
         JobPostingBookmarkView.as_view(),
         name="job_posting_bookmark_list",
     ),
+    # 북마크 일괄 동기화 API (오프라인 토글 재생)
+    path(
+        "job-postings/bookmark/sync/",
+        JobPostingBookmarkSyncView.as_view(),
+        name="job_posting_bookmark_sync",
+    ),
     path(
         "job-postings/bookmark/<uuid:job_posting_id>/",
         JobPostingBookmarkView.as_view(),
         name="job_posting_bookmark",
     ),
+    # 기업 대시보드 통계 API
+    path(
+        "company/stats/",
+        CompanyStatsView.as_view(),
+        name="company_stats",
+    ),
 ]
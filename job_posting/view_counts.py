@@ -0,0 +1,121 @@
+from typing import Optional, cast
+from uuid import UUID
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.db.models import Case, F, Value, When
+from django.http import HttpRequest
+from redis import RedisError
+
+from job_posting.models import JobPosting
+from job_posting.recommend import index_job_postings
+from user.models import CommonUser
+from user.redis import r
+
+DIRTY_KEY = "job_posting:views:dirty"  # 반영 대기 중인 공고 ID 집합
+
+
+def _view_count_key(job_posting_id: str) -> str:
+    return f"job_posting:views:{job_posting_id}"
+
+
+def _viewer_key(job_posting_id: str) -> str:
+    return f"job_posting:viewers:{job_posting_id}"
+
+
+def get_client_ip(request: HttpRequest) -> str:
+    """
+    접속 IP (신뢰하는 프록시 뒤에서만 X-Forwarded-For 사용)
+
+    클라이언트가 보낸 앞쪽 값은 위조할 수 있으므로, 신뢰하는 프록시 중
+    가장 바깥 프록시가 덧붙인 항목(뒤에서 TRUSTED_PROXY_COUNT 번째)을 읽는다.
+    """
+    proxy_count = getattr(settings, "TRUSTED_PROXY_COUNT", 0)
+    forwarded_for: Optional[str] = request.META.get("HTTP_X_FORWARDED_FOR")
+    if proxy_count > 0 and forwarded_for:
+        hops = [hop.strip() for hop in forwarded_for.split(",")]
+        if len(hops) >= proxy_count:
+            return hops[-proxy_count]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def get_viewer_id(request: HttpRequest) -> str:
+    """
+    순 방문자 집계용 조회자 식별값 (로그인 유저 ID 또는 접속 IP)
+    """
+    user = request.user
+    if isinstance(user, CommonUser):
+        return f"user:{user.common_user_id}"
+    return f"ip:{get_client_ip(request)}"
+
+
+def record_job_posting_view(job_posting_id: UUID, viewer_id: str) -> None:
+    """
+    공고 조회를 Redis 에 누적 (조회수 INCR + 순 방문자 HyperLogLog)
+
+    DB 는 flush_view_counts 가 주기적으로 한 번에 갱신한다.
+    """
+    key = str(job_posting_id)
+    try:
+        pipe = r.pipeline(transaction=False)
+        pipe.incr(_view_count_key(key))
+        pipe.pfadd(_viewer_key(key), viewer_id)
+        pipe.sadd(DIRTY_KEY, key)
+        pipe.execute()
+    except RedisError:
+        pass
+
+
+def flush_view_counts(batch_size: int = 1000) -> int:
+    """
+    누적된 조회수 증분을 UPDATE 한 번으로 DB 에 반영하고 처리한 공고 수 반환
+    """
+    job_posting_ids = cast(list[str], r.spop(DIRTY_KEY, batch_size) or [])
+    if not job_posting_ids:
+        return 0
+
+    pipe = r.pipeline()
+    for job_posting_id in job_posting_ids:
+        pipe.getdel(_view_count_key(job_posting_id))
+        pipe.pfcount(_viewer_key(job_posting_id))
+    values = pipe.execute()
+    deltas = {
+        job_posting_id: int(values[index * 2] or 0)
+        for index, job_posting_id in enumerate(job_posting_ids)
+    }
+    uniques = {
+        job_posting_id: int(values[index * 2 + 1])
+        for index, job_posting_id in enumerate(job_posting_ids)
+    }
+
+    try:
+        JobPosting.objects.filter(job_posting_id__in=job_posting_ids).update(
+            view_count=Case(
+                *[
+                    When(
+                        job_posting_id=job_posting_id,
+                        then=F("view_count") + delta,
+                    )
+                    for job_posting_id, delta in deltas.items()
+                ],
+                default=F("view_count"),
+            ),
+            unique_viewer_count=Case(
+                *[
+                    When(job_posting_id=job_posting_id, then=Value(count))
+                    for job_posting_id, count in uniques.items()
+                ],
+                default=F("unique_viewer_count"),
+            ),
+        )
+    except DatabaseError:
+        # DB 반영 실패 시 증분을 되돌려 다음 주기에 다시 반영
+        pipe = r.pipeline()
+        for job_posting_id, delta in deltas.items():
+            pipe.incrby(_view_count_key(job_posting_id), delta)
+            pipe.sadd(DIRTY_KEY, job_posting_id)
+        pipe.execute()
+        raise
+    # 인기도가 바뀐 공고의 추천 점수 갱신
+    index_job_postings([UUID(pk) for pk in job_posting_ids])
+    return len(job_posting_ids)
@@ -0,0 +1,232 @@
+import codecs
+import csv
+import json
+from typing import Any, Iterator, Union
+
+from django.contrib.gis.geos import Point
+from django.db import DatabaseError, transaction
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+from pydantic import ValidationError
+
+from job_posting.cards import refresh_job_posting_cards
+from job_posting.models import JobPosting
+from job_posting.recommend import schedule_index_job_postings
+from job_posting.schemas import (
+    JobPostingBulkImportResponseModel,
+    JobPostingCreateModel,
+    JobPostingImportRowResultModel,
+)
+from search.geocoding import GeocodingError, geocode_addresses
+from user.models import CompanyInfo
+
+IMPORT_CHUNK_SIZE = 500  # bulk_create 한 번에 넣는 공고 수
+MAX_IMPORT_ROWS = 10000  # 요청 하나로 처리하는 최대 행 수
+JSONL_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+CSV_CONTENT_TYPE = "text/csv"
+CSV_LIST_FIELDS = ("job_keyword_sub", "work_day")  # "|" 로 구분된 컬럼
+
+
+def iter_import_records(
+    request: HttpRequest,
+) -> Iterator[Union[str, dict[str, Any]]]:
+    """
+    요청 본문을 한 줄씩 읽어 JSON Lines 문자열 또는 CSV 행(dict)을 반환
+
+    request.body 를 읽지 않고 스트림을 그대로 순회하므로
+    본문 크기와 관계없이 메모리 사용량이 일정하다.
+    """
+    lines = codecs.iterdecode(request, "utf-8")
+    if request.content_type == CSV_CONTENT_TYPE:
+        yield from csv.DictReader(lines)
+        return
+    for line in lines:
+        if line.strip():
+            yield line
+
+
+def parse_csv_record(record: dict[str, Any]) -> dict[str, Any]:
+    """
+    CSV 문자열 컬럼을 JobPostingCreateModel 입력 형태로 변환
+    """
+    data = {key: value for key, value in record.items() if key}
+    for field in CSV_LIST_FIELDS:
+        value = data.get(field) or ""
+        data[field] = [item.strip() for item in value.split("|") if item]
+    if data.get("location"):
+        data["location"] = data["location"].split(",")
+    if not data.get("content"):
+        data["content"] = None
+    return data
+
+
+def build_job_posting(
+    company: CompanyInfo, payload: JobPostingCreateModel
+) -> JobPosting:
+    fields = payload.model_dump(exclude={"location", "content"})
+    post = JobPosting(
+        company_id=company, content=payload.content or "", **fields
+    )
+    # 좌표가 없는 행은 insert_chunk 에서 주소로 일괄 변환
+    if payload.location:
+        post.location = Point(
+            payload.location[0], payload.location[1], srid=4326
+        )
+    return post
+
+
+def geocode_chunk(
+    chunk: list[tuple[int, JobPosting]],
+) -> tuple[list[tuple[int, JobPosting]], list[JobPostingImportRowResultModel]]:
+    """
+    좌표가 없는 공고의 주소를 한 번에 변환하고, 변환하지 못한 행은 오류 처리
+
+    제공자 장애가 나면 이 묶음의 주소 변환 행만 오류로 보고하고
+    나머지 묶음은 계속 처리한다.
+    """
+    addresses = [post.address for _, post in chunk if post.location is None]
+    if not addresses:
+        return chunk, []
+    try:
+        points = geocode_addresses(addresses)
+        error = "address: 주소의 좌표를 찾을 수 없습니다."
+    except GeocodingError:
+        points = {}
+        error = "address: 좌표 변환 서비스 오류로 등록하지 못했습니다. 다시 시도해 주세요."
+
+    resolved: list[tuple[int, JobPosting]] = []
+    failed: list[JobPostingImportRowResultModel] = []
+    for row, post in chunk:
+        if post.location is None:
+            post.location = points.get(post.address)
+        if post.location is None:
+            failed.append(
+                JobPostingImportRowResultModel(
+                    row=row, status="error", errors=[error]
+                )
+            )
+        else:
+            resolved.append((row, post))
+    return resolved, failed
+
+
+def insert_chunk(
+    chunk: list[tuple[int, JobPosting]],
+) -> list[JobPostingImportRowResultModel]:
+    """
+    검증을 통과한 공고 묶음을 한 트랜잭션에서 bulk_create
+    """
+    chunk, failed = geocode_chunk(chunk)
+    if not chunk:
+        return failed
+    try:
+        with transaction.atomic():
+            posts = JobPosting.objects.bulk_create([post for _, post in chunk])
+            refresh_job_posting_cards([post.job_posting_id for post in posts])
+            schedule_index_job_postings([post.job_posting_id for post in posts])
+    except DatabaseError as e:
+        return [
+            JobPostingImportRowResultModel(
+                row=row, status="error", errors=[str(e)]
+            )
+            for row, _ in chunk
+        ] + failed
+    return [
+        JobPostingImportRowResultModel(
+            row=row, status="created", job_posting_id=post.job_posting_id
+        )
+        for row, post in chunk
+    ] + failed
+
+
+def format_validation_error(e: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        for error in e.errors()
+    ]
+
+
+class JobPostingBulkImportView(View):
+    """
+    공고 일괄 등록 API (JSON Lines / CSV)
+    """
+
+    def post(self, request: HttpRequest) -> JsonResponse:
+        try:
+            user = request.user
+            if not hasattr(user, "companyinfo"):
+                return JsonResponse(
+                    {"error": "기업 사용자만 공고를 등록할 수 있습니다."},
+                    status=403,
+                )
+            company = user.companyinfo
+
+            if request.content_type not in (
+                *JSONL_CONTENT_TYPES,
+                CSV_CONTENT_TYPE,
+            ):
+                return JsonResponse(
+                    {"error": "JSON Lines 또는 CSV 형식만 지원합니다."},
+                    status=415,
+                )
+
+            results: list[JobPostingImportRowResultModel] = []
+            chunk: list[tuple[int, JobPosting]] = []
+            for row, record in enumerate(iter_import_records(request), 1):
+                if row > MAX_IMPORT_ROWS:
+                    results.append(
+                        JobPostingImportRowResultModel(
+                            row=row,
+                            status="error",
+                            errors=[
+                                f"한 번에 최대 {MAX_IMPORT_ROWS}건까지 등록할 수 있습니다."
+                            ],
+                        )
+                    )
+                    break
+                try:
+                    data = (
+                        json.loads(record)
+                        if isinstance(record, str)
+                        else parse_csv_record(record)
+                    )
+                    payload = JobPostingCreateModel(**data)
+                except ValidationError as e:
+                    results.append(
+                        JobPostingImportRowResultModel(
+                            row=row,
+                            status="error",
+                            errors=format_validation_error(e),
+                        )
+                    )
+                    continue
+                except (ValueError, TypeError) as e:
+                    results.append(
+                        JobPostingImportRowResultModel(
+                            row=row, status="error", errors=[str(e)]
+                        )
+                    )
+                    continue
+
+                chunk.append((row, build_job_posting(company, payload)))
+                if len(chunk) >= IMPORT_CHUNK_SIZE:
+                    results.extend(insert_chunk(chunk))
+                    chunk = []
+            if chunk:
+                results.extend(insert_chunk(chunk))
+
+            results.sort(key=lambda result: result.row)
+            created_count = sum(
+                1 for result in results if result.status == "created"
+            )
+            response = JobPostingBulkImportResponseModel(
+                message="공고 일괄 등록을 완료했습니다.",
+                created_count=created_count,
+                failed_count=len(results) - created_count,
+                results=results,
+            )
+            return JsonResponse(
+                response.model_dump(), status=201 if created_count else 400
+            )
+        except Exception as e:
+            return JsonResponse({"error": str(e)}, status=400)
@@ -0,0 +1,49 @@
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from job_posting.cards import get_job_posting_cards
+from job_posting.recommend import recommend_job_postings
+from job_posting.schemas import (
+    JobPostingRecommendationResponseModel,
+    RecommendedJobPostingModel,
+)
+from utils.common import get_valid_normal_user
+from utils.pagination import parse_page_size
+
+
+class JobPostingRecommendationView(View):
+    """
+    관심 분야 기반 추천 공고 조회 API
+
+    lng / lat 쿼리를 주면 가까운 공고를 우선한다.
+    """
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        try:
+            user = get_valid_normal_user(request.user)
+            size = parse_page_size(request.GET.get("size"))
+            location = None
+            if request.GET.get("lng") and request.GET.get("lat"):
+                location = (
+                    float(request.GET["lng"]),
+                    float(request.GET["lat"]),
+                )
+
+            job_posting_ids = recommend_job_postings(user, size, location)
+            cards = get_job_posting_cards(job_posting_ids)
+            response = JobPostingRecommendationResponseModel(
+                message="추천 공고를 성공적으로 불러왔습니다.",
+                data=[
+                    RecommendedJobPostingModel.model_validate(
+                        cards[pk], from_attributes=True
+                    )
+                    for pk in job_posting_ids
+                    if pk in cards
+                ],
+            )
+            return JsonResponse(response.model_dump(), status=200)
+        except PermissionDenied as e:
+            return JsonResponse({"error": str(e)}, status=403)
+        except Exception as e:
+            return JsonResponse({"error": str(e)}, status=400)
@@ -0,0 +1,22 @@
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from job_posting.stats import get_company_stats
+from utils.common import get_valid_company_user
+
+
+class CompanyStatsView(View):
+    """
+    기업 대시보드 공고별 지원 / 북마크 통계 조회 API
+    """
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        try:
+            company = get_valid_company_user(request.user)
+            response = get_company_stats(company.company_id)
+            return JsonResponse(response.model_dump(mode="json"), status=200)
+        except PermissionDenied as e:
+            return JsonResponse({"error": str(e)}, status=403)
+        except Exception as e:
+            return JsonResponse({"error": str(e)}, status=400)
@@ -1,15 +1,50 @@
 import json
 import uuid
-from typing import List
+from typing import List, Optional
 
 from django.contrib.gis.geos import Point
-from django.db import transaction
-from django.http import HttpRequest, JsonResponse
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from django.views import View
 
+from job_posting.bookmarks import (
+    cache_bookmarks_added,
+    cache_bookmarks_removed,
+    get_all_bookmarked_ids,
+    get_bookmarked_ids,
+    is_job_posting_bookmarked,
+)
+from job_posting.cache import (
+    cache_job_posting,
+    get_cached_job_posting,
+    get_job_posting_version,
+    invalidate_job_posting_cache,
+    job_posting_etag_matches,
+    make_job_posting_etag,
+    render_job_posting_detail,
+)
+from job_posting.cards import (
+    POSTING_CARD_FIELDS,
+    get_job_posting_cards,
+    refresh_job_posting_cards,
+)
+from job_posting.counters import (
+    adjust_bookmark_count,
+    reconcile_posting_counters,
+)
 from job_posting.models import JobPosting, JobPostingBookmark
+from job_posting.recommend import (
+    schedule_index_job_postings,
+    schedule_remove_job_postings,
+)
 from job_posting.schemas import (
     BookmarkResponseModel,
+    BookmarkSyncRequestModel,
+    BookmarkSyncResponseModel,
     JobPostingBookmarkListItemModel,
     JobPostingBookmarkListResponseModel,
     JobPostingCreateModel,
@@ -19,7 +54,15 @@ from job_posting.schemas import (
     JobPostingResponseModel,
     JobPostingUpdateModel,
 )
+from job_posting.stats import (
+    invalidate_company_stats,
+    invalidate_posting_company_stats,
+)
+from job_posting.view_counts import get_viewer_id, record_job_posting_view
+from resume.scoring import POSTING_SCORE_FIELDS, schedule_rescore_submissions
+from search.geocoding import GeocodingError, geocode_address
 from user.models import CommonUser
+from utils.pagination import keyset_page, parse_page_size
 
 
 class JobPostingListView(View):
@@ -27,34 +70,74 @@ class JobPostingListView(View):
     공고 리스트 조회 API
     """
 
+    # 정렬 기준별 keyset 정렬 키 (JobPosting.Meta.indexes 와 짝을 이룸)
+    SORT_ORDERINGS = {
+        "newest": ("-created_at", "-job_posting_id"),
+        "deadline": ("deadline", "job_posting_id"),
+        "popular": ("-view_count", "-job_posting_id"),
+        "bookmarks": ("-bookmark_count", "-job_posting_id"),
+        "submissions": ("-submission_count", "-job_posting_id"),
+    }
+
     def get(self, request: HttpRequest) -> JsonResponse:
         try:
             user = request.user
-            postings = JobPosting.objects.select_related("company_id").all()
+            sort = request.GET.get("sort", "newest")
+            if sort not in self.SORT_ORDERINGS:
+                return JsonResponse(
+                    {"error": "지원하지 않는 정렬 기준입니다."}, status=400
+                )
+            size = parse_page_size(request.GET.get("size"))
+
+            # 정렬 키만 인덱스로 읽고, 카드 내용은 카드 테이블에서 한 번에 조회
+            postings = JobPosting.objects.values(
+                "job_posting_id",
+                "created_at",
+                "deadline",
+                "view_count",
+                "bookmark_count",
+                "submission_count",
+            )
+            # 기본은 모집 중인 공고만 (부분 인덱스 사용)
+            if request.GET.get("include_expired") != "true":
+                postings = postings.filter(is_active=True)
+            rows, next_cursor = keyset_page(
+                postings,
+                self.SORT_ORDERINGS[sort],
+                request.GET.get("cursor"),
+                size,
+            )
+            job_posting_ids = [row["job_posting_id"] for row in rows]
+            cards = get_job_posting_cards(job_posting_ids)
 
             bookmarked_ids = set()
             if isinstance(user, CommonUser):
-                bookmarked_ids = set(
-                    JobPostingBookmark.objects.filter(user=user).values_list(
-                        "job_posting_id", flat=True
-                    )
+                bookmarked_ids = get_bookmarked_ids(
+                    user.common_user_id, job_posting_ids
                 )
 
             items: List[JobPostingListModel] = [
                 JobPostingListModel(
-                    job_posting_id=post.job_posting_id,
-                    company_name=post.company_id.company_name,
-                    company_address=post.company_id.company_address,
-                    job_posting_title=post.job_posting_title,
-                    summary=post.summary,
-                    deadline=post.deadline,
-                    is_bookmarked=(post.job_posting_id in bookmarked_ids),
+                    job_posting_id=card.job_posting_id,
+                    company_name=card.company_name,
+                    company_address=card.company_address,
+                    job_posting_title=card.job_posting_title,
+                    summary=card.summary,
+                    deadline=card.deadline,
+                    is_bookmarked=(card.job_posting_id in bookmarked_ids),
+                    bookmark_count=row["bookmark_count"],
+                    submission_count=row["submission_count"],
+                )
+                for row, card in (
+                    (row, cards[row["job_posting_id"]])
+                    for row in rows
+                    if row["job_posting_id"] in cards
                 )
-                for post in postings
             ]
             response = JobPostingListResponseModel(
                 message="공고 리스트를 성공적으로 불러왔습니다.",
                 data=items,
+                next_cursor=next_cursor,
             )
             return JsonResponse(response.model_dump(), status=200)
         except Exception as e:
@@ -68,56 +151,71 @@ class JobPostingDetailView(View):
 
     def get(
         self, request: HttpRequest, job_posting_id: uuid.UUID
-    ) -> JsonResponse:
+    ) -> HttpResponse:
         try:
-            post = (
-                JobPosting.objects.select_related("company_id")
-                .filter(job_posting_id=job_posting_id)
-                .first()
+            # 캐시된 공고(및 수정 시각)가 있으면 DB 를 거치지 않고 응답
+            cached = get_cached_job_posting(job_posting_id)
+            updated_at = (
+                cached[1]
+                if cached is not None
+                else get_job_posting_version(job_posting_id)
             )
-            if not post:
+            if updated_at is None:
                 return JsonResponse(
                     {"error": "공고를 찾을 수 없습니다."}, status=404
                 )
+            record_job_posting_view(job_posting_id, get_viewer_id(request))
 
             user = request.user
             is_bookmarked = False
             if isinstance(user, CommonUser):
-                is_bookmarked = JobPostingBookmark.objects.filter(
-                    user=user, job_posting=post
-                ).exists()
+                is_bookmarked = is_job_posting_bookmarked(
+                    user.common_user_id, job_posting_id
+                )
 
-            detail = JobPostingResponseModel(
-                job_posting_id=post.job_posting_id,
-                company_id=post.company_id.company_id,
-                job_posting_title=post.job_posting_title,
-                address=post.address,
-                city=post.city,
-                district=post.district,
-                location=(post.location.x, post.location.y),
-                work_time_start=post.work_time_start,
-                work_time_end=post.work_time_end,
-                posting_type=post.posting_type,
-                employment_type=post.employment_type,
-                job_keyword_main=post.job_keyword_main,
-                job_keyword_sub=post.job_keyword_sub,
-                number_of_positions=post.number_of_positions,
-                education=post.education,
-                deadline=post.deadline,
-                time_discussion=post.time_discussion,
-                day_discussion=post.day_discussion,
-                work_day=post.work_day,
-                salary_type=post.salary_type,
-                salary=post.salary,
-                summary=post.summary,
-                content=post.content,
-                is_bookmarked=is_bookmarked,
+            etag = make_job_posting_etag(
+                job_posting_id, updated_at, is_bookmarked
             )
-            response = JobPostingDetailResponseModel(
-                message="공고를 성공적으로 불러왔습니다.",
-                job_posting=detail,
+            last_modified = int(updated_at.timestamp())
+            # 북마크 여부는 수정 시각에 반영되지 않으므로
+            # If-Modified-Since 는 비로그인 조회에만 적용
+            not_modified = get_conditional_response(
+                request,
+                etag=etag,
+                last_modified=(
+                    None if isinstance(user, CommonUser) else last_modified
+                ),
             )
-            return JsonResponse(response.model_dump(), status=200)
+            if not_modified is not None:
+                not_modified["ETag"] = etag
+                not_modified["Last-Modified"] = http_date(last_modified)
+                return not_modified
+
+            if cached is None:
+                post = JobPosting.objects.filter(
+                    job_posting_id=job_posting_id
+                ).first()
+                if not post:
+                    return JsonResponse(
+                        {"error": "공고를 찾을 수 없습니다."}, status=404
+                    )
+                cached = cache_job_posting(post)
+            payload, updated_at = cached
+
+            http_response = HttpResponse(
+                render_job_posting_detail(
+                    "공고를 성공적으로 불러왔습니다.", payload, is_bookmarked
+                ),
+                content_type="application/json",
+                status=200,
+            )
+            http_response["ETag"] = make_job_posting_etag(
+                job_posting_id, updated_at, is_bookmarked
+            )
+            http_response["Last-Modified"] = http_date(
+                int(updated_at.timestamp())
+            )
+            return http_response
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=400)
 
@@ -134,8 +232,25 @@ class JobPostingDetailView(View):
             data = json.loads(request.body)
             payload = JobPostingCreateModel(**data)
 
-            # location을 Point로 변환
-            location = Point(payload.location[0], payload.location[1])
+            # location을 Point로 변환 (없으면 주소로 좌표 조회)
+            location: Optional[Point]
+            if payload.location:
+                location = Point(payload.location[0], payload.location[1])
+            else:
+                try:
+                    location = geocode_address(payload.address)
+                except GeocodingError:
+                    return JsonResponse(
+                        {
+                            "error": "좌표 변환 서비스 오류입니다. 잠시 후 다시 시도해 주세요."
+                        },
+                        status=503,
+                    )
+                if location is None:
+                    return JsonResponse(
+                        {"error": "주소의 좌표를 찾을 수 없습니다."},
+                        status=400,
+                    )
 
             with transaction.atomic():
                 post = JobPosting.objects.create(
@@ -162,6 +277,9 @@ class JobPostingDetailView(View):
                     summary=payload.summary,
                     content=payload.content or "",
                 )
+                refresh_job_posting_cards([post.job_posting_id])
+                invalidate_company_stats(company.company_id)
+                schedule_index_job_postings([post.job_posting_id])
 
             detail = JobPostingResponseModel(
                 job_posting_id=post.job_posting_id,
@@ -187,6 +305,7 @@ class JobPostingDetailView(View):
                 salary=post.salary,
                 summary=post.summary,
                 content=post.content,
+                version=post.version,
                 is_bookmarked=False,
             )
             response = JobPostingDetailResponseModel(
@@ -221,20 +340,99 @@ class JobPostingDetailView(View):
             data = json.loads(request.body)
             payload = JobPostingUpdateModel(**data)
 
-            # location이 있으면 Point로 변환
-            if payload.location:
-                location = Point(payload.location[0], payload.location[1])
-                post.location = location
+            # 클라이언트가 본 버전과 다르면 덮어쓰지 않음 (If-Match / version)
+            if_match = request.headers.get("If-Match")
+            if (
+                if_match
+                and not job_posting_etag_matches(
+                    if_match, post.job_posting_id, post.updated_at
+                )
+            ) or (
+                payload.version is not None and payload.version != post.version
+            ):
+                return JsonResponse(
+                    {
+                        "error": "다른 사용자가 먼저 공고를 수정했습니다.",
+                        "version": post.version,
+                    },
+                    status=412,
+                )
 
-            for field, value in payload.model_dump(exclude_unset=True).items():
-                setattr(post, field, value)
-            post.save()
+            # 보낸 필드 중 실제로 바뀐 컬럼만 UPDATE
+            changes = {}
+            for field, value in payload.model_dump(
+                exclude_unset=True, exclude={"version"}
+            ).items():
+                if value is None and field != "content":
+                    continue
+                if field == "location":
+                    # location이 있으면 Point로 변환
+                    value = Point(value[0], value[1], srid=4326)
+                if getattr(post, field) != value:
+                    changes[field] = value
+            # 좌표 없이 주소만 바뀌면 새 주소로 좌표를 다시 조회
+            if "address" in changes and payload.location is None:
+                try:
+                    location = geocode_address(changes["address"])
+                except GeocodingError:
+                    return JsonResponse(
+                        {
+                            "error": "좌표 변환 서비스 오류입니다. 잠시 후 다시 시도해 주세요."
+                        },
+                        status=503,
+                    )
+                if location is None:
+                    return JsonResponse(
+                        {"error": "주소의 좌표를 찾을 수 없습니다."},
+                        status=400,
+                    )
+                if location != post.location:
+                    changes["location"] = location
+            # 마감일이 바뀌면 모집 중 여부도 다시 계산
+            if "deadline" in changes:
+                changes["is_active"] = (
+                    changes["deadline"] >= timezone.localdate()
+                )
+
+            if changes:
+                updated_at = timezone.now()
+                with transaction.atomic():
+                    updated = JobPosting.objects.filter(
+                        job_posting_id=post.job_posting_id,
+                        version=post.version,
+                    ).update(
+                        **changes,
+                        version=F("version") + 1,
+                        updated_at=updated_at,
+                    )
+                    if not updated:
+                        return JsonResponse(
+                            {
+                                "error": "다른 사용자가 먼저 공고를 수정했습니다."
+                            },
+                            status=412,
+                        )
+                    if changes.keys() & set(POSTING_CARD_FIELDS):
+                        refresh_job_posting_cards([post.job_posting_id])
+                    invalidate_company_stats(company.company_id)
+                    schedule_index_job_postings([post.job_posting_id])
+                    if changes.keys() & set(POSTING_SCORE_FIELDS):
+                        schedule_rescore_submissions(post.job_posting_id)
+                invalidate_job_posting_cache(
+                    post.job_posting_id, post.version + 1
+                )
+
+                # 조건부 UPDATE 가 성공했으므로 다시 읽지 않고 메모리에 반영
+                for field, value in changes.items():
+                    setattr(post, field, value)
+                post.version += 1
+                post.updated_at = updated_at
 
             is_bookmarked = False
             if isinstance(user, CommonUser):
-                is_bookmarked = JobPostingBookmark.objects.filter(
-                    user=user, job_posting=post
-                ).exists()
+                is_bookmarked = is_job_posting_bookmarked(
+                    user.common_user_id, post.job_posting_id
+                )
 
             detail = JobPostingResponseModel(
                 job_posting_id=post.job_posting_id,
@@ -260,13 +458,18 @@ class JobPostingDetailView(View):
                 salary=post.salary,
                 summary=post.summary,
                 content=post.content,
+                version=post.version,
                 is_bookmarked=is_bookmarked,
             )
             response = JobPostingDetailResponseModel(
                 message="공고가 성공적으로 수정되었습니다.",
                 job_posting=detail,
             )
-            return JsonResponse(response.model_dump(), status=200)
+            http_response = JsonResponse(response.model_dump(), status=200)
+            http_response["ETag"] = make_job_posting_etag(
+                post.job_posting_id, post.updated_at, is_bookmarked
+            )
+            return http_response
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=400)
 
@@ -291,7 +494,11 @@ class JobPostingDetailView(View):
                     status=403,
                 )
 
-            post.delete()
+            with transaction.atomic():
+                post.delete()
+                invalidate_company_stats(company.company_id)
+                schedule_remove_job_postings([job_posting_id])
+            invalidate_job_posting_cache(job_posting_id)
             response = BookmarkResponseModel(
                 message="공고가 성공적으로 삭제되었습니다."
             )
@@ -305,6 +512,9 @@ class JobPostingBookmarkView(View):
     공고 북마크 등록 / 삭제 / 조회 API
     """
 
+    # 북마크한 순서의 최신순 (마지막 키는 유일한 PK)
+    BOOKMARK_ORDERING = ("-created_at", "-id")
+
     def get(self, request: HttpRequest) -> JsonResponse:
         try:
             user = request.user
@@ -313,23 +523,32 @@ class JobPostingBookmarkView(View):
                     {"error": "인증된 사용자만 접근할 수 있습니다."}, status=403
                 )
 
-            bookmarks = JobPostingBookmark.objects.select_related(
-                "job_posting__company_id"
-            ).filter(user=user)
+            # 북마크 테이블에서는 정렬 키와 공고 ID 만 읽고 표시 정보는 카드에서
+            rows, next_cursor = keyset_page(
+                JobPostingBookmark.objects.filter(user=user).values(
+                    "id", "created_at", "job_posting_id"
+                ),
+                self.BOOKMARK_ORDERING,
+                request.GET.get("cursor"),
+                parse_page_size(request.GET.get("size")),
+            )
+            job_posting_ids = [row["job_posting_id"] for row in rows]
+            cards = get_job_posting_cards(job_posting_ids)
 
             items = [
                 JobPostingBookmarkListItemModel(
-                    job_posting_id=b.job_posting.job_posting_id,
-                    job_posting_title=b.job_posting.job_posting_title,
-                    company_name=b.job_posting.company_id.company_name,
-                    summary=b.job_posting.summary,
-                    deadline=b.job_posting.deadline,
+                    job_posting_id=card.job_posting_id,
+                    job_posting_title=card.job_posting_title,
+                    company_name=card.company_name,
+                    summary=card.summary,
+                    deadline=card.deadline,
                 )
-                for b in bookmarks
+                for card in (cards[pk] for pk in job_posting_ids if pk in cards)
             ]
             response = JobPostingBookmarkListResponseModel(
                 message="북마크 목록을 성공적으로 불러왔습니다.",
                 data=items,
+                next_cursor=next_cursor,
             )
             return JsonResponse(response.model_dump(), status=200)
         except Exception as e:
@@ -353,9 +572,16 @@ class JobPostingBookmarkView(View):
                     {"error": "공고를 찾을 수 없습니다."}, status=404
                 )
 
-            _, created = JobPostingBookmark.objects.get_or_create(
-                user=user, job_posting=post
-            )
+            with transaction.atomic():
+                _, created = JobPostingBookmark.objects.get_or_create(
+                    user=user, job_posting=post
+                )
+                if created:
+                    adjust_bookmark_count([post.job_posting_id], 1)
+                    invalidate_company_stats(post.company_id_id)
+                    cache_bookmarks_added(
+                        user.common_user_id, [post.job_posting_id]
+                    )
             response = BookmarkResponseModel(
                 message=(
                     "북마크가 등록되었습니다."
@@ -388,8 +614,107 @@ class JobPostingBookmarkView(View):
                 )
                 return JsonResponse(response.model_dump(), status=404)
 
-            bookmark.delete()
+            with transaction.atomic():
+                bookmark.delete()
+                adjust_bookmark_count([job_posting_id], -1)
+                invalidate_posting_company_stats([job_posting_id])
+                cache_bookmarks_removed(user.common_user_id, [job_posting_id])
             response = BookmarkResponseModel(message="북마크가 삭제되었습니다.")
             return JsonResponse(response.model_dump(), status=200)
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=400)
+
+
+class JobPostingBookmarkSyncView(View):
+    """
+    오프라인에서 쌓인 북마크 등록 / 삭제를 한 번에 반영하는 API
+    """
+
+    def post(self, request: HttpRequest) -> JsonResponse:
+        try:
+            user = request.user
+            if not isinstance(user, CommonUser):
+                return JsonResponse(
+                    {"error": "인증된 사용자만 접근할 수 있습니다."}, status=403
+                )
+
+            payload = BookmarkSyncRequestModel(**json.loads(request.body))
+
+            # 같은 공고에 대한 작업은 마지막 작업만 남김
+            final_actions = {
+                operation.job_posting_id: operation.action
+                for operation in payload.operations
+            }
+            add_ids = {
+                pk for pk, action in final_actions.items() if action == "add"
+            }
+            remove_ids = set(final_actions) - add_ids
+
+            # 존재하는 공고만 등록 (검증 쿼리 1회)
+            valid_add_ids = set(
+                JobPosting.objects.filter(
+                    job_posting_id__in=add_ids
+                ).values_list("job_posting_id", flat=True)
+            )
+
+            with transaction.atomic():
+                existing = set(
+                    JobPostingBookmark.objects.filter(
+                        user=user, job_posting_id__in=final_actions
+                    ).values_list("job_posting_id", flat=True)
+                )
+                to_add = valid_add_ids - existing
+                to_remove = remove_ids & existing
+
+                added = set(to_add)
+                try:
+                    with transaction.atomic():
+                        JobPostingBookmark.objects.bulk_create(
+                            [
+                                JobPostingBookmark(user=user, job_posting_id=pk)
+                                for pk in to_add
+                            ]
+                        )
+                except IntegrityError:
+                    # 동시에 다른 요청이 등록한 북마크는 건너뛰고
+                    # 실제로 새로 등록한 공고만 집계
+                    added = {
+                        pk
+                        for pk in to_add
+                        if JobPostingBookmark.objects.get_or_create(
+                            user=user, job_posting_id=pk
+                        )[1]
+                    }
+                removed_count = 0
+                if to_remove:
+                    removed_count, _ = JobPostingBookmark.objects.filter(
+                        user=user, job_posting_id__in=to_remove
+                    ).delete()
+
+                if added:
+                    adjust_bookmark_count(added, 1)
+                    cache_bookmarks_added(user.common_user_id, added)
+                if to_remove:
+                    if removed_count == len(to_remove):
+                        adjust_bookmark_count(to_remove, -1)
+                    else:
+                        # 동시에 삭제된 북마크가 있으면 실제 행 수로 다시 계산
+                        reconcile_posting_counters(
+                            job_posting_ids=list(to_remove)
+                        )
+                    cache_bookmarks_removed(user.common_user_id, to_remove)
+                if added or to_remove:
+                    invalidate_posting_company_stats(added | to_remove)
+
+            response = BookmarkSyncResponseModel(
+                message="북마크가 동기화되었습니다.",
+                added_count=len(added),
+                removed_count=removed_count,
+                invalid_job_posting_ids=sorted(add_ids - valid_add_ids),
+                bookmarked_job_posting_ids=sorted(
+                    get_all_bookmarked_ids(user.common_user_id)
+                ),
+            )
+            return JsonResponse(response.model_dump(), status=200)
+        except Exception as e:
+            return JsonResponse({"error": str(e)}, status=400)
@@ -0,0 +1,164 @@
+import csv
+from typing import Any, Iterator, Mapping, Optional
+from uuid import UUID
+
+from django.db.models import F
+from django.utils import timezone
+
+from resume.models import Submission
+from utils.xlsx import stream_xlsx
+
+EXPORT_CHUNK_SIZE = 500  # 서버 사이드 커서로 한 번에 가져오는 행 수
+MAX_EXPORT_CAREERS = 5  # 열로 펼치는 경력 수 (초과분은 생략)
+MAX_EXPORT_CERTIFICATIONS = 5  # 열로 펼치는 자격증 수 (초과분은 생략)
+# 스프레드시트가 수식으로 해석하는 시작 문자
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+BASE_COLUMNS = (
+    ("지원일시", "created_at"),
+    ("공고 제목", "job_posting_title"),
+    ("이름", "name"),
+    ("열람 여부", "is_read"),
+    ("이력서 제목", "resume_title"),
+    ("희망 직종", "job_category"),
+    ("최종 학력", "education_level"),
+    ("학교명", "school_name"),
+    ("학적 상태", "education_state"),
+    ("자기소개", "introduce"),
+)
+CAREER_COLUMNS = (
+    ("회사명", "company_name"),
+    ("직무", "position"),
+    ("시작일", "employment_period_start"),
+    ("종료일", "employment_period_end"),
+)
+CERTIFICATION_COLUMNS = (
+    ("자격증명", "certification_name"),
+    ("발급기관", "issuing_organization"),
+    ("취득일", "date_acquired"),
+)
+
+
+def export_header() -> list[str]:
+    header = [label for label, _ in BASE_COLUMNS]
+    for index in range(1, MAX_EXPORT_CAREERS + 1):
+        header += [f"경력{index} {label}" for label, _ in CAREER_COLUMNS]
+    for index in range(1, MAX_EXPORT_CERTIFICATIONS + 1):
+        header += [
+            f"자격증{index} {label}" for label, _ in CERTIFICATION_COLUMNS
+        ]
+    return header
+
+
+def neutralize_formula(value: Any) -> Any:
+    """
+    수식으로 시작하는 문자열 앞에 ' 를 붙여 일반 텍스트로 취급되게 함
+
+    지원자가 입력한 값이 엑셀에서 열릴 때 수식으로 실행되지 않도록 한다.
+    """
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def _flatten(
+    items: list[dict[str, Any]], columns: tuple, limit: int
+) -> list[Any]:
+    values = []
+    for index in range(limit):
+        item = items[index] if index < len(items) else {}
+        values += [item.get(key) for _, key in columns]
+    return values
+
+
+def flatten_submission(row: Mapping[str, Any]) -> list[Any]:
+    """
+    지원서 한 건을 스프레드시트 한 행으로 펼침 (csv / xlsx 공통)
+    """
+    snapshot = row["payload"] or {}
+    values = {
+        **snapshot,
+        "created_at": timezone.localtime(row["created_at"]).strftime(
+            "%Y-%m-%d %H:%M"
+        ),
+        "job_posting_title": row["job_posting_title"],
+        "name": row["name"],
+        "is_read": row["is_read"],
+    }
+    flattened = (
+        [values.get(key) for _, key in BASE_COLUMNS]
+        + _flatten(
+            snapshot.get("career_list") or [],
+            CAREER_COLUMNS,
+            MAX_EXPORT_CAREERS,
+        )
+        + _flatten(
+            snapshot.get("certification_list") or [],
+            CERTIFICATION_COLUMNS,
+            MAX_EXPORT_CERTIFICATIONS,
+        )
+    )
+    return [neutralize_formula(value) for value in flattened]
+
+
+def iter_export_rows(
+    company_id: UUID, job_posting_id: Optional[UUID] = None
+) -> Iterator[list[Any]]:
+    """
+    기업의 지원서를 서버 사이드 커서로 EXPORT_CHUNK_SIZE 씩 읽어 행 단위로 반환
+
+    지원자 / 공고 / 이력서 스냅샷을 JOIN 한 values() 를 iterator() 로 읽으므로
+    지원자 수와 관계없이 메모리에는 한 청크만 올라간다.
+    """
+    submissions = Submission.objects.filter(job_posting__company_id=company_id)
+    if job_posting_id is not None:
+        submissions = submissions.filter(job_posting_id=job_posting_id)
+    rows = (
+        submissions.order_by("job_posting_id", "-created_at", "-submission_id")
+        .values(
+            "created_at",
+            "is_read",
+            name=F("user__name"),
+            job_posting_title=F("job_posting__job_posting_title"),
+            payload=F("snapshot__payload"),
+        )
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+    for row in rows:
+        yield flatten_submission(row)
+
+
+class _Echo:
+    """
+    csv.writer 가 쓴 한 줄을 그대로 돌려주는 가짜 파일 객체
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "Y" if value else "N"
+    return value
+
+
+def stream_csv(rows: Iterator[list[Any]]) -> Iterator[bytes]:
+    """
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 을 붙인 CSV 스트림
+    """
+    writer = csv.writer(_Echo())
+    yield ("\ufeff" + writer.writerow(export_header())).encode()
+    for row in rows:
+        yield writer.writerow([_csv_value(value) for value in row]).encode()
+
+
+def stream_submissions(
+    export_format: str,
+    company_id: UUID,
+    job_posting_id: Optional[UUID] = None,
+) -> Iterator[bytes]:
+    rows = iter_export_rows(company_id, job_posting_id)
+    if export_format == "xlsx":
+        return stream_xlsx(export_header(), rows, sheet_name="지원자")
+    return stream_csv(rows)
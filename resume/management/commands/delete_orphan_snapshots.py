@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from resume.models import ORPHAN_GRACE_SECONDS, ResumeSnapshot
+
+
+class Command(BaseCommand):
+    """
+    지원서가 모두 삭제되어 참조되지 않는 이력서 스냅샷 정리 (cron 등으로 주기 실행)
+    """
+
+    help = "참조하는 지원서가 없는 이력서 스냅샷을 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 삭제할 스냅샷 수",
+        )
+        parser.add_argument(
+            "--grace-seconds",
+            type=int,
+            default=ORPHAN_GRACE_SECONDS,
+            help="이 시간(초) 동안 지원에 쓰이지 않은 스냅샷만 삭제",
+        )
+
+    def handle(self, *args, **options):
+        total = ResumeSnapshot.delete_orphans(
+            options["batch_size"], options["grace_seconds"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"스냅샷 {total}건 삭제 완료"))
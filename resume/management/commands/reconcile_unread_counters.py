@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from resume.unread import reconcile_unread_counters
+
+
+class Command(BaseCommand):
+    """
+    기업별 미열람 지원자 카운터 재계산 (cron 등으로 주기 실행)
+    """
+
+    help = "Redis 의 기업별 미열람 지원자 수를 DB 기준으로 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="집계 쿼리 한 번에 처리할 기업 수",
+        )
+
+    def handle(self, *args, **options):
+        total = reconcile_unread_counters(options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"기업 {total}곳 재계산 완료"))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from resume.scoring import rescore_submissions
+
+
+class Command(BaseCommand):
+    """
+    지원서 공고 적합도 점수 재계산 (점수 규칙 변경 후 / 백필용으로 실행)
+
+    공고 수정으로 점수 관련 조건이 바뀐 경우에는 커밋 후 자동으로 재계산된다.
+    """
+
+    help = "지원서의 공고 적합도 점수를 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--job-posting",
+            action="append",
+            dest="job_posting_ids",
+            help="재계산할 공고 ID (여러 번 지정 가능, 생략 시 전체)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="한 번에 계산해 저장할 지원서 수",
+        )
+
+    def handle(self, *args, **options):
+        total = rescore_submissions(
+            options["job_posting_ids"], options["batch_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"지원서 {total}건 재계산 완료"))
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_posting", "0010_bookmark_user_newest_idx"),
+        ("resume", "0011_alter_submission_memo"),
+        ("user", "0006_alter_companyinfo_certificate_image_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=["job_posting", "-created_at", "-submission_id"],
+                name="submission_posting_newest_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,106 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:05
+
+import hashlib
+import json
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 1000
+
+
+def make_digest(payload):
+    canonical = json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def fill_resume_snapshots(apps, schema_editor):
+    """
+    기존 지원서의 snapshot_resume 을 내용 주소 스냅샷으로 옮김
+    """
+    ResumeSnapshot = apps.get_model("resume", "ResumeSnapshot")
+    Submission = apps.get_model("resume", "Submission")
+
+    submissions = Submission.objects.filter(snapshot__isnull=True).order_by(
+        "submission_id"
+    )
+    while True:
+        batch = list(
+            submissions.only("submission_id", "snapshot_resume")[:BATCH_SIZE]
+        )
+        if not batch:
+            return
+        snapshots = {}
+        for submission in batch:
+            digest = make_digest(submission.snapshot_resume)
+            snapshots[digest] = submission.snapshot_resume
+            submission.snapshot_id = digest
+        ResumeSnapshot.objects.bulk_create(
+            [
+                ResumeSnapshot(digest=digest, payload=payload)
+                for digest, payload in snapshots.items()
+            ],
+            ignore_conflicts=True,
+        )
+        Submission.objects.bulk_update(batch, ["snapshot"])
+
+
+def restore_snapshot_resume(apps, schema_editor):
+    ResumeSnapshot = apps.get_model("resume", "ResumeSnapshot")
+    Submission = apps.get_model("resume", "Submission")
+    Submission.objects.filter(snapshot__isnull=False).update(
+        snapshot_resume=Subquery(
+            ResumeSnapshot.objects.filter(digest=OuterRef("snapshot")).values(
+                "payload"
+            )[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resume", "0012_submission_posting_newest_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResumeSnapshot",
+            fields=[
+                (
+                    "digest",
+                    models.CharField(
+                        editable=False,
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="스냅샷 해시",
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(verbose_name="지원 시점 이력서 정보"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="작성일자"
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="submission",
+            name="snapshot",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="submissions",
+                to="resume.resumesnapshot",
+            ),
+        ),
+        migrations.RunPython(fill_resume_snapshots, restore_snapshot_resume),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resume", "0013_resumesnapshot"),
+    ]
+
+    operations = [
+        # 되돌릴 때 컬럼을 null 허용으로 다시 만들고 0013 에서 채움
+        migrations.AlterField(
+            model_name="submission",
+            name="snapshot_resume",
+            field=models.JSONField(
+                null=True, verbose_name="지원 시점 이력서 정보"
+            ),
+        ),
+        migrations.RemoveField(
+            model_name="submission",
+            name="snapshot_resume",
+        ),
+        migrations.AlterField(
+            model_name="submission",
+            name="snapshot",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="submissions",
+                to="resume.resumesnapshot",
+                verbose_name="지원 시점 이력서 스냅샷",
+            ),
+        ),
+    ]
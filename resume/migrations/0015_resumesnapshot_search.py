@@ -0,0 +1,102 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:11
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import Value
+
+BATCH_SIZE = 1000
+SEARCH_FIELDS = (
+    "resume_title",
+    "job_category",
+    "education_level",
+    "school_name",
+    "education_state",
+    "introduce",
+)
+
+
+def certification_names(payload):
+    names = [
+        certification.get("certification_name")
+        for certification in payload.get("certification_list") or []
+    ]
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def search_document(payload):
+    words = [payload.get(field) for field in SEARCH_FIELDS]
+    for career in payload.get("career_list") or []:
+        words += [career.get("company_name"), career.get("position")]
+    words += certification_names(payload)
+    return " ".join(word for word in words if word)
+
+
+def fill_search_projection(apps, schema_editor):
+    """
+    기존 스냅샷의 검색 문서 / 자격증 이름 목록을 채움
+    """
+    ResumeSnapshot = apps.get_model("resume", "ResumeSnapshot")
+    snapshots = ResumeSnapshot.objects.order_by("digest")
+    last_digest = ""
+    while True:
+        batch = list(
+            snapshots.filter(digest__gt=last_digest).only("digest", "payload")[
+                :BATCH_SIZE
+            ]
+        )
+        if not batch:
+            return
+        for snapshot in batch:
+            snapshot.search_vector = SearchVector(
+                Value(search_document(snapshot.payload)), config="simple"
+            )
+            snapshot.certification_names = certification_names(snapshot.payload)
+        ResumeSnapshot.objects.bulk_update(
+            batch, ["search_vector", "certification_names"]
+        )
+        last_digest = batch[-1].digest
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resume", "0014_remove_submission_snapshot_resume"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resumesnapshot",
+            name="certification_names",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(max_length=20),
+                blank=True,
+                default=list,
+                size=None,
+                verbose_name="자격증 이름 목록",
+            ),
+        ),
+        migrations.AddField(
+            model_name="resumesnapshot",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="검색용 문서"
+            ),
+        ),
+        migrations.RunPython(fill_search_projection, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="resumesnapshot",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="snapshot_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="resumesnapshot",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["certification_names"],
+                name="snapshot_certification_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job_posting", "0010_bookmark_user_newest_idx"),
+        ("resume", "0015_resumesnapshot_search"),
+        ("user", "0006_alter_companyinfo_certificate_image_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="match_score",
+            field=models.PositiveSmallIntegerField(
+                default=0, verbose_name="공고 적합도 점수"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="submission",
+            index=models.Index(
+                fields=[
+                    "job_posting",
+                    "-match_score",
+                    "-created_at",
+                    "-submission_id",
+                ],
+                name="submission_posting_score_idx",
+            ),
+        ),
+    ]
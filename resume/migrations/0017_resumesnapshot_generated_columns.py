@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:13
+
+import django.db.models.fields.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resume", "0016_submission_match_score"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resumesnapshot",
+            name="education_level",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.fields.json.KeyTextTransform(
+                    "education_level", "payload"
+                ),
+                output_field=models.TextField(),
+                verbose_name="학력 구분",
+            ),
+        ),
+        migrations.AddField(
+            model_name="resumesnapshot",
+            name="job_category",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.fields.json.KeyTextTransform(
+                    "job_category", "payload"
+                ),
+                output_field=models.TextField(),
+                verbose_name="직무 분야",
+            ),
+        ),
+        migrations.AddField(
+            model_name="resumesnapshot",
+            name="resume_title",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.fields.json.KeyTextTransform(
+                    "resume_title", "payload"
+                ),
+                output_field=models.TextField(),
+                verbose_name="이력서 제목",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="resumesnapshot",
+            index=models.Index(
+                fields=["job_category"], name="snapshot_job_category_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:37
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("resume", "0017_resumesnapshot_generated_columns"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resumesnapshot",
+            name="last_used_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                verbose_name="마지막 사용일자",
+            ),
+        ),
+    ]
@@ -1,12 +1,28 @@
+import hashlib
+import json
+from datetime import timedelta
+from typing import Any, Optional
 from uuid import uuid4
 
-from django.db import models
-from django.db.models import CASCADE
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models import CASCADE, Exists, OuterRef
+from django.db.models.fields.json import KT
 from django.db.models.manager import Manager
+from django.utils import timezone
 
+from resume.search import (
+    snapshot_certification_names,
+    snapshot_search_vector,
+)
 from user.models import UserInfo
 from utils.models import TimestampModel
 
+# 참조하는 지원서가 없어도 삭제하지 않는 기간 (지원서 저장 중인 스냅샷 보호)
+ORPHAN_GRACE_SECONDS = 60 * 60
+
 
 # Create your models here.
 class Resume(TimestampModel):
@@ -95,6 +111,131 @@ class Certification(TimestampModel):
         return self.certification_name
 
 
+class ResumeSnapshot(models.Model):
+    """
+    지원 시점 이력서 스냅샷 (내용 주소 저장)
+
+    정규화한 JSON 의 sha256 을 키로 쓰므로 같은 이력서로 여러 공고에
+    지원해도 스냅샷은 한 번만 저장된다. 내용이 바뀌지 않으므로 수정하지 않는다.
+    """
+
+    digest = models.CharField(
+        "스냅샷 해시", max_length=64, primary_key=True, editable=False
+    )
+    payload = models.JSONField(verbose_name="지원 시점 이력서 정보")
+    # 지원자 검색용 투영 (payload 에서 만들어 저장 시 함께 기록)
+    search_vector = SearchVectorField("검색용 문서", null=True, editable=False)
+    certification_names = ArrayField(
+        models.CharField(max_length=20),
+        verbose_name="자격증 이름 목록",
+        default=list,
+        blank=True,
+    )
+    # 목록에서 자주 읽는 키 (payload 전체를 읽지 않도록 저장형 생성 컬럼으로 분리)
+    resume_title = models.GeneratedField(
+        expression=KT("payload__resume_title"),
+        output_field=models.TextField(),
+        db_persist=True,
+        verbose_name="이력서 제목",
+    )
+    job_category = models.GeneratedField(
+        expression=KT("payload__job_category"),
+        output_field=models.TextField(),
+        db_persist=True,
+        verbose_name="직무 분야",
+    )
+    education_level = models.GeneratedField(
+        expression=KT("payload__education_level"),
+        output_field=models.TextField(),
+        db_persist=True,
+        verbose_name="학력 구분",
+    )
+    created_at = models.DateTimeField("작성일자", auto_now_add=True)
+    # 마지막으로 intern 된 시각 (고아 스냅샷 정리 유예 기간의 기준)
+    last_used_at = models.DateTimeField("마지막 사용일자", default=timezone.now)
+
+    objects = Manager()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["job_category"], name="snapshot_job_category_idx"
+            ),
+            GinIndex(fields=["search_vector"], name="snapshot_search_idx"),
+            GinIndex(
+                fields=["certification_names"],
+                name="snapshot_certification_idx",
+            ),
+        ]
+
+    @staticmethod
+    def make_digest(payload: dict[str, Any]) -> str:
+        canonical = json.dumps(
+            payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    @classmethod
+    def intern(cls, payload: dict[str, Any]) -> "ResumeSnapshot":
+        """
+        같은 내용의 스냅샷이 없을 때만 저장하고 스냅샷을 반환
+
+        검색 문서와 자격증 이름 목록도 같은 INSERT 로 기록한다. 이미 있으면
+        last_used_at 만 갱신해, 정리 대상이던 스냅샷을 재사용해도 유예 기간
+        동안 삭제되지 않게 한다 (갱신 중인 행은 정리 쪽에서 잠금으로 건너뜀).
+        """
+        snapshot = ResumeSnapshot(
+            digest=cls.make_digest(payload),
+            payload=payload,
+            search_vector=snapshot_search_vector(payload),
+            certification_names=snapshot_certification_names(payload),
+            last_used_at=timezone.now(),
+        )
+        ResumeSnapshot.objects.bulk_create(
+            [snapshot],
+            update_conflicts=True,
+            update_fields=["last_used_at"],
+            unique_fields=["digest"],
+        )
+        return snapshot
+
+    @classmethod
+    def delete_orphans(
+        cls, batch_size: int = 500, grace_seconds: int = ORPHAN_GRACE_SECONDS
+    ) -> int:
+        """
+        참조하는 지원서가 없는 스냅샷을 batch_size 씩 삭제하고 삭제한 수를 반환
+
+        grace_seconds 동안 intern 되지 않은 스냅샷만 대상으로 하며, 후보 행을
+        SELECT ... FOR UPDATE SKIP LOCKED 로 잠근 뒤 같은 트랜잭션에서 삭제하므로
+        동시에 intern 중인 스냅샷은 건너뛴다.
+        """
+        orphans = cls.objects.filter(
+            ~Exists(Submission.objects.filter(snapshot=OuterRef("pk"))),
+            last_used_at__lt=timezone.now() - timedelta(seconds=grace_seconds),
+        ).order_by("digest")
+        total = 0
+        last_digest = None
+        while True:
+            batch = orphans
+            if last_digest is not None:
+                batch = batch.filter(digest__gt=last_digest)
+            with transaction.atomic():
+                digests = list(
+                    batch.select_for_update(skip_locked=True).values_list(
+                        "digest", flat=True
+                    )[:batch_size]
+                )
+                if not digests:
+                    return total
+                deleted, _ = cls.objects.filter(digest__in=digests).delete()
+            total += deleted
+            last_digest = digests[-1]
+
+    def __str__(self):
+        return self.digest
+
+
 class Submission(TimestampModel):
     """
     지원공고 목록 테이블
@@ -109,14 +250,66 @@ class Submission(TimestampModel):
     user = models.ForeignKey(
         "user.UserInfo", on_delete=CASCADE, related_name="submissions_user"
     )
-    snapshot_resume = models.JSONField(verbose_name="지원 시점 이력서 정보")
+    snapshot = models.ForeignKey(
+        "ResumeSnapshot",
+        on_delete=models.PROTECT,
+        related_name="submissions",
+        verbose_name="지원 시점 이력서 스냅샷",
+    )
 
     memo = models.CharField(
         "지원공고 메모", max_length=50, blank=True, null=True
     )
     is_read = models.BooleanField("기업 담당자 읽음 여부", default=False)
+    match_score = models.PositiveSmallIntegerField(
+        "공고 적합도 점수", default=0
+    )  # resume.scoring 으로 지원 시 계산 (0 ~ 100)
 
     objects = Manager()
 
+    class Meta:
+        indexes = [
+            # 기업 지원자함 공고별 최신 지원순 keyset 페이지네이션
+            models.Index(
+                fields=["job_posting", "-created_at", "-submission_id"],
+                name="submission_posting_newest_idx",
+            ),
+            # 공고별 적합도순 지원자 정렬
+            models.Index(
+                fields=[
+                    "job_posting",
+                    "-match_score",
+                    "-created_at",
+                    "-submission_id",
+                ],
+                name="submission_posting_score_idx",
+            ),
+        ]
+
+    # 저장 전까지 들고 있는 스냅샷 원본 (save 시 ResumeSnapshot 으로 저장)
+    _pending_snapshot: Optional[dict[str, Any]] = None
+
+    @property
+    def snapshot_resume(self) -> dict[str, Any]:
+        """
+        지원 시점 이력서 정보 (스냅샷 테이블에 한 번만 저장된 JSON)
+        """
+        if self._pending_snapshot is not None:
+            return self._pending_snapshot
+        return self.snapshot.payload
+
+    @snapshot_resume.setter
+    def snapshot_resume(self, payload: dict[str, Any]) -> None:
+        self._pending_snapshot = payload
+
+    def save(self, *args, **kwargs):
+        if self._pending_snapshot is not None:
+            self.snapshot = ResumeSnapshot.intern(self._pending_snapshot)
+            self._pending_snapshot = None
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "snapshot"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return str(self.submission_id)
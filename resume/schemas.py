@@ -2,7 +2,7 @@ from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from job_posting.schemas import JobPostingListModel
 from user.models import UserInfo
@@ -174,6 +174,24 @@ class SubmissionMemoUpdateModel(BaseModel):
     memo: Optional[str] = None
 
 
+class SubmissionMarkReadModel(BaseModel):
+    """
+    지원서 일괄 열람 요청 (둘 다 없으면 기업의 모든 미열람 지원서)
+    """
+
+    submission_ids: Optional[List[UUID]] = Field(None, max_length=1000)
+    job_posting_id: Optional[UUID] = None
+
+
+class SubmissionMarkReadResponseModel(BaseModel):
+    """
+    지원서 일괄 열람 응답
+    """
+
+    message: str
+    marked_count: int
+
+
 class JobpostingGetListModel(BaseModel):
     """
     기업 유저 지원자 목록 조회 시 드롭다운 항목
@@ -245,6 +263,9 @@ class SubmissionCompanyGetListInfoModel(BaseModel):
     is_read: bool
     created_at: date
     resume_title: str
+    job_category: Optional[str] = None
+    education_level: Optional[str] = None
+    match_score: int = 0
 
 
 class SubmissionCompanyGetListOutputModel(BaseModel):
@@ -257,6 +278,26 @@ class SubmissionCompanyGetListOutputModel(BaseModel):
     message: str
     job_posting_list: list[JobpostingGetListModel]
     submission_list: list[SubmissionCompanyGetListInfoModel]
+    next_cursor: Optional[str] = None
+
+
+class JobpostingUnreadCountModel(BaseModel):
+    """
+    공고별 미열람 지원자 수
+    """
+
+    job_posting_id: UUID
+    unread_count: int
+
+
+class SubmissionUnreadCountResponseModel(BaseModel):
+    """
+    기업 유저 미열람 지원자 수 조회 응답
+    """
+
+    message: str
+    unread_count: int
+    job_posting_list: list[JobpostingUnreadCountModel]
 
 
 # ------------------------
@@ -0,0 +1,231 @@
+from datetime import date
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from job_posting.models import JobPosting
+from resume.models import Submission
+
+# 항목별 만점 (합계 100)
+KEYWORD_POINTS = 40  # 직종 대분류 / 세부 키워드 일치
+EXPERIENCE_POINTS = 25  # 경력 공고의 경력 연수
+EDUCATION_POINTS = 20  # 요구 학력 충족
+CERTIFICATION_POINTS = 15  # 키워드 관련 자격증
+
+MAIN_KEYWORD_POINTS = 25  # KEYWORD_POINTS 중 직종 대분류 일치 배점
+FULL_EXPERIENCE_YEARS = 5  # 경력 배점을 모두 받는 경력 연수
+POINTS_PER_CERTIFICATION = 10  # 관련 자격증 1개당 배점
+
+# 학력 서열 (앞에 있는 표현이 먼저 일치)
+EDUCATION_RANKS = (
+    ("무관", 0),
+    ("박사", 6),
+    ("석사", 5),
+    ("대학원", 5),
+    ("master", 5),
+    ("doctor", 6),
+    ("phd", 6),
+    ("전문대", 3),
+    ("초대졸", 3),
+    ("2년제", 3),
+    ("associate", 3),
+    ("대학교", 4),
+    ("대졸", 4),
+    ("4년제", 4),
+    ("학사", 4),
+    ("bachelor", 4),
+    ("고등학교", 2),
+    ("고졸", 2),
+    ("high", 2),
+    ("중학교", 1),
+    ("중졸", 1),
+)
+
+POSTING_SCORE_FIELDS = (
+    "job_posting_id",
+    "job_keyword_main",
+    "job_keyword_sub",
+    "education",
+    "employment_type",
+)
+
+
+def education_rank(value: Optional[str]) -> Optional[int]:
+    """
+    학력 표현을 서열 숫자로 변환 (알 수 없으면 None)
+    """
+    text = (value or "").replace(" ", "").lower()
+    if not text:
+        return None
+    for keyword, rank in EDUCATION_RANKS:
+        if keyword in text:
+            return rank
+    return None
+
+
+def posting_profile(row: dict[str, Any]) -> dict[str, Any]:
+    """
+    공고 한 건에서 점수 계산에 필요한 값만 미리 정리
+
+    같은 공고의 지원서를 묶어 계산할 때 한 번만 만든다.
+    """
+    main = (row["job_keyword_main"] or "").lower()
+    subs = [keyword.lower() for keyword in row["job_keyword_sub"] if keyword]
+    employment_type = row["employment_type"] or ""
+    return {
+        "main": main,
+        "subs": subs,
+        "keywords": [keyword for keyword in [main, *subs] if keyword],
+        "education_rank": education_rank(row["education"]),
+        "needs_experience": "경력" in employment_type
+        and "무관" not in employment_type,
+    }
+
+
+def _career_years(careers: list[dict[str, Any]], today: date) -> float:
+    days = 0
+    for career in careers:
+        start = career.get("employment_period_start")
+        if not start:
+            continue
+        end = career.get("employment_period_end")
+        end_date = date.fromisoformat(end) if end else today
+        days += max((end_date - date.fromisoformat(start)).days, 0)
+    return days / 365
+
+
+def score_snapshot(
+    payload: dict[str, Any],
+    profile: dict[str, Any],
+    today: Optional[date] = None,
+) -> int:
+    """
+    지원 시점 이력서와 공고 프로필의 적합도 (0 ~ 100)
+    """
+    today = today or timezone.localdate()
+    careers = payload.get("career_list") or []
+    certifications = [
+        (certification.get("certification_name") or "").lower()
+        for certification in payload.get("certification_list") or []
+    ]
+    roles = [
+        (payload.get("job_category") or "").lower(),
+        *[(career.get("position") or "").lower() for career in careers],
+    ]
+    texts = [*roles, *certifications]
+
+    # 직종 대분류는 희망 직종 / 경력 직무와, 세부 키워드는 자격증까지 포함해 비교
+    score = 0.0
+    if profile["main"] and any(profile["main"] in role for role in roles):
+        score += MAIN_KEYWORD_POINTS
+    if profile["subs"]:
+        matched = sum(
+            any(keyword in text for text in texts)
+            for keyword in profile["subs"]
+        )
+        score += (
+            (KEYWORD_POINTS - MAIN_KEYWORD_POINTS)
+            * matched
+            / len(profile["subs"])
+        )
+
+    if profile["needs_experience"]:
+        years = _career_years(careers, today)
+        score += EXPERIENCE_POINTS * min(years / FULL_EXPERIENCE_YEARS, 1)
+    else:
+        score += EXPERIENCE_POINTS
+
+    required = profile["education_rank"]
+    applicant = education_rank(payload.get("education_level"))
+    if not required or (applicant is not None and applicant >= required):
+        score += EDUCATION_POINTS
+    elif applicant is None:
+        score += EDUCATION_POINTS / 2
+
+    related = sum(
+        any(keyword in name for keyword in profile["keywords"])
+        for name in certifications
+    )
+    score += min(related * POINTS_PER_CERTIFICATION, CERTIFICATION_POINTS)
+    return round(score)
+
+
+def score_job_posting(job_posting: JobPosting, payload: dict[str, Any]) -> int:
+    """
+    지원 생성 시 공고 인스턴스로 바로 점수 계산
+    """
+    return score_snapshot(
+        payload,
+        posting_profile(
+            {
+                field: getattr(job_posting, field)
+                for field in POSTING_SCORE_FIELDS
+            }
+        ),
+    )
+
+
+def rescore_submissions(
+    job_posting_ids: Optional[Iterable[UUID]] = None, batch_size: int = 500
+) -> int:
+    """
+    지원서 점수를 batch_size 씩 묶어 다시 계산해 bulk_update
+
+    공고 조건이 바뀌었거나 점수 규칙을 고쳤을 때 사용한다. 공고 프로필은
+    공고당 한 번만 만들고, 지원서는 (submission_id, 공고 ID, 스냅샷) 만 읽는다.
+    처리한 지원서 수를 반환한다.
+    """
+    postings = JobPosting.objects.all()
+    if job_posting_ids is not None:
+        postings = postings.filter(job_posting_id__in=list(job_posting_ids))
+    profiles = {
+        row["job_posting_id"]: posting_profile(row)
+        for row in postings.values(*POSTING_SCORE_FIELDS)
+    }
+    if not profiles:
+        return 0
+
+    today = timezone.localdate()
+    submissions = (
+        Submission.objects.filter(job_posting_id__in=list(profiles))
+        .order_by("submission_id")
+        .values(
+            "submission_id",
+            "job_posting_id",
+            "match_score",
+            payload=F("snapshot__payload"),
+        )
+    )
+    total = 0
+    last_id = None
+    while True:
+        batch = submissions
+        if last_id is not None:
+            batch = batch.filter(submission_id__gt=last_id)
+        rows = list(batch[:batch_size])
+        if not rows:
+            return total
+        changed = []
+        for row in rows:
+            score = score_snapshot(
+                row["payload"], profiles[row["job_posting_id"]], today
+            )
+            if score != row["match_score"]:
+                changed.append(
+                    Submission(
+                        submission_id=row["submission_id"], match_score=score
+                    )
+                )
+        Submission.objects.bulk_update(changed, ["match_score"])
+        total += len(rows)
+        last_id = rows[-1]["submission_id"]
+
+
+def schedule_rescore_submissions(job_posting_id: UUID) -> None:
+    """
+    공고의 점수 관련 조건이 바뀌었을 때 트랜잭션 커밋 후 지원서 점수 재계산
+    """
+    transaction.on_commit(lambda: rescore_submissions([job_posting_id]))
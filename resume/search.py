@@ -0,0 +1,62 @@
+import re
+from typing import Any
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db.models import Value
+
+SEARCH_CONFIG = "simple"  # 한국어 형태소 사전이 없으므로 공백 단위로 색인
+
+# 검색 문서에 넣는 스냅샷 항목
+SEARCH_FIELDS = (
+    "resume_title",
+    "job_category",
+    "education_level",
+    "school_name",
+    "education_state",
+    "introduce",
+)
+CAREER_SEARCH_FIELDS = ("company_name", "position")
+
+
+def snapshot_certification_names(payload: dict[str, Any]) -> list[str]:
+    """
+    스냅샷의 자격증 이름 목록 (중복 제거, 입력 순서 유지)
+    """
+    names = [
+        certification.get("certification_name")
+        for certification in payload.get("certification_list") or []
+    ]
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def snapshot_search_document(payload: dict[str, Any]) -> str:
+    """
+    학교 / 경력 / 자격증 / 자기소개를 이어 붙인 검색용 문서
+    """
+    words = [payload.get(field) for field in SEARCH_FIELDS]
+    for career in payload.get("career_list") or []:
+        words += [career.get(field) for field in CAREER_SEARCH_FIELDS]
+    words += snapshot_certification_names(payload)
+    return " ".join(word for word in words if word)
+
+
+def snapshot_search_vector(payload: dict[str, Any]) -> SearchVector:
+    return SearchVector(
+        Value(snapshot_search_document(payload)), config=SEARCH_CONFIG
+    )
+
+
+def applicant_search_query(q: str) -> SearchQuery:
+    """
+    검색어의 단어마다 접두어 일치를 AND 로 묶은 tsquery
+
+    "정보처리" 로 "정보처리기사" 를, "pyth" 로 "python" 을 찾을 수 있다.
+    """
+    words = re.findall(r"\w+", q)
+    if not words:
+        raise ValueError("q must contain at least one word")
+    return SearchQuery(
+        " & ".join(f"{word}:*" for word in words),
+        config=SEARCH_CONFIG,
+        search_type="raw",
+    )
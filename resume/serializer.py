@@ -1,6 +1,10 @@
-from typing import List
+from typing import Any, List, cast
+from uuid import UUID
 
-from job_posting.models import JobPostingBookmark
+from django.db.models import F, QuerySet
+
+from job_posting.bookmarks import get_bookmarked_ids
+from job_posting.cards import get_job_posting_cards
 from resume.models import CareerInfo, Certification, Submission
 from resume.schemas import (
     CareerInfoModel,
@@ -35,38 +39,78 @@ def serialize_certifications(
     ]
 
 
+# 지원 목록에 함께 내보내는 공고 카드 컬럼
+SUBMISSION_CARD_FIELDS = (
+    "job_posting_title",
+    "city",
+    "district",
+    "town",
+    "company_name",
+    "company_address",
+    "summary",
+    "deadline",
+)
+
+
 def serialize_submissions(
-    submissions: list[Submission],
+    submissions: QuerySet[Submission],
+    common_user_id: UUID,
 ) -> list[SubmissionModel]:
-    result = []
-    for submission in submissions:
-        is_bookmarked = (
-            True
-            if JobPostingBookmark.objects.filter(
-                job_posting=submission.job_posting
-            ).exists()
-            else False
-        )
-        job_posting = JobpostingListOutputModel(
-            job_posting_id=submission.job_posting.job_posting_id,
-            job_posting_title=submission.job_posting.job_posting_title,
-            city=submission.job_posting.city,
-            district=submission.job_posting.district,
-            town=submission.job_posting.town,
-            company_name=submission.job_posting.company_id.company_name,
-            company_address=submission.job_posting.company_id.company_address,
-            summary=submission.job_posting.summary,
-            deadline=submission.job_posting.deadline,
-            is_bookmarked=is_bookmarked,
-        )
-        result.append(
-            SubmissionModel(
-                submission_id=submission.submission_id,
-                job_posting=job_posting,
-                snapshot_resume=submission.snapshot_resume,
-                memo=submission.memo or "",
-                is_read=submission.is_read,
-                created_at=submission.created_at.date(),
+    """
+    지원 목록 직렬화 파이프라인
+
+    1. 지원서와 공고 카드(공고 + 기업 정보)를 JOIN 한 번으로 조회
+    2. 카드가 아직 없는 공고만 모아서 한 번에 생성
+    3. 페이지 전체의 북마크 여부를 한 번에 확인
+    4. 출력 모델을 일괄 생성
+    """
+    rows = cast(
+        list[dict[str, Any]],
+        list(
+            submissions.values(
+                "submission_id",
+                "job_posting_id",
+                "memo",
+                "is_read",
+                "created_at",
+                snapshot_resume=F("snapshot__payload"),
+                card_id=F("job_posting__card__job_posting"),
+                **{
+                    field: F(f"job_posting__card__{field}")
+                    for field in SUBMISSION_CARD_FIELDS
+                },
             )
+        ),
+    )
+
+    missing_ids = {row["job_posting_id"] for row in rows if not row["card_id"]}
+    if missing_ids:
+        cards = get_job_posting_cards(missing_ids)
+        for row in rows:
+            if not row["card_id"]:
+                card = cards[row["job_posting_id"]]
+                row.update(
+                    {
+                        field: getattr(card, field)
+                        for field in SUBMISSION_CARD_FIELDS
+                    }
+                )
+
+    bookmarked_ids = get_bookmarked_ids(
+        common_user_id, {row["job_posting_id"] for row in rows}
+    )
+    return [
+        SubmissionModel(
+            submission_id=row["submission_id"],
+            job_posting=JobpostingListOutputModel(
+                job_posting_id=row["job_posting_id"],
+                is_bookmarked=row["job_posting_id"] in bookmarked_ids,
+                **{field: row[field] for field in SUBMISSION_CARD_FIELDS},
+            ),
+            snapshot_resume=row["snapshot_resume"],
+            memo=row["memo"] or "",
+            is_read=row["is_read"],
+            created_at=row["created_at"].date(),
         )
-    return result
+        for row in rows
+    ]
@@ -3,7 +3,7 @@ import uuid
 import pytest
 from django.utils import timezone
 
-from resume.models import Resume
+from resume.models import Resume, ResumeSnapshot
 from user.models import CommonUser, UserInfo
 
 
@@ -113,3 +113,23 @@ def test_resume_str_method():
     # Then
     assert str(resume)  # __str__이 정상 동작하는지 확인
     assert isinstance(resume.resume_id, uuid.UUID)
+
+
+@pytest.mark.django_db
+def test_resume_snapshot_is_stored_once():
+    # Given
+    payload = {"resume_title": "스냅샷", "career_list": [], "introduce": "소개"}
+    reordered = {
+        "introduce": "소개",
+        "career_list": [],
+        "resume_title": "스냅샷",
+    }
+
+    # When
+    first = ResumeSnapshot.intern(payload)
+    second = ResumeSnapshot.intern(reordered)
+
+    # Then
+    assert first.digest == second.digest
+    assert ResumeSnapshot.objects.count() == 1
+    assert ResumeSnapshot.objects.get().payload == payload
@@ -293,6 +293,50 @@ def test_my_resume_patch_detail_success(
     assert get_data["career_list"][0]["company_name"] == "경희의료원"
 
 
+@pytest.mark.django_db
+def test_my_resume_patch_keeps_unchanged_careers(
+    client, mock_common_user, mock_resume, mock_careers
+):
+    """
+    그대로 보낸 경력은 다시 만들지 않고, 빠진 경력만 삭제 / 새 경력만 추가
+    """
+    kept = mock_careers[0]
+    patch_data = {
+        "resume_id": str(mock_resume.resume_id),
+        "career_list": [
+            {
+                "company_name": kept.company_name,
+                "position": kept.position,
+                "employment_period_start": str(kept.employment_period_start),
+                "employment_period_end": str(kept.employment_period_end),
+            },
+            {
+                "company_name": "새 회사",
+                "position": "개발",
+                "employment_period_start": "2024-01-01",
+                "employment_period_end": None,
+            },
+        ],
+    }
+    client.force_login(mock_common_user)
+
+    response = client.patch(
+        f"/api/resume/{mock_resume.resume_id}/",
+        json.dumps(patch_data),
+        content_type="application/json",
+    )
+
+    assert response.status_code == 200
+    careers = CareerInfo.objects.filter(resume=mock_resume)
+    assert careers.count() == 2
+    assert careers.filter(pk=kept.pk).exists()
+    assert not careers.filter(pk=mock_careers[1].pk).exists()
+    assert [
+        career["company_name"]
+        for career in json.loads(response.content)["resume"]["career_list"]
+    ] == [kept.company_name, "새 회사"]
+
+
 @pytest.mark.django_db
 def test_my_resume_delete_success(client, mock_user, mock_common_user):
     resume = Resume.objects.create(
@@ -1,13 +1,25 @@
+import csv
+import io
 import json
+import zipfile
 
 import pytest
 from django.contrib.gis.geos import Point
+from django.core.management import call_command
 from django.test.client import Client
 from django.utils import timezone
 
-from job_posting.models import JobPosting
-from resume.models import CareerInfo, Certification, Resume, Submission
+from job_posting.models import JobPosting, JobPostingCard
+from resume.export import export_header, flatten_submission
+from resume.models import (
+    CareerInfo,
+    Certification,
+    Resume,
+    ResumeSnapshot,
+    Submission,
+)
 from resume.schemas import CareerInfoModel, CertificationInfoModel
+from resume.scoring import posting_profile, score_job_posting, score_snapshot
 from user.models import CommonUser, CompanyInfo, UserInfo
 
 
@@ -230,6 +242,32 @@ def test_submission_list_get_success(
     )
 
 
+@pytest.mark.django_db
+def test_submission_list_builds_missing_cards(
+    client,
+    mock_common_user,
+    mock_job_posting,
+    mock_submission,
+    django_assert_max_num_queries,
+):
+    """
+    카드가 없는 공고도 일괄 생성해 지원 목록을 적은 쿼리로 직렬화
+    """
+    JobPostingCard.objects.all().delete()
+    client.force_login(mock_common_user)
+
+    with django_assert_max_num_queries(10):
+        response = client.get("/api/submission/")
+
+    submission_list = json.loads(response.content)["submission_list"]
+    assert response.status_code == 200
+    assert (
+        submission_list[0]["job_posting"]["job_posting_title"]
+        == mock_job_posting.job_posting_title
+    )
+    assert JobPostingCard.objects.filter(job_posting=mock_job_posting).exists()
+
+
 @pytest.mark.django_db
 def test_submiison_company_get_list_success(
     client,
@@ -265,6 +303,376 @@ def test_submiison_company_get_list_success(
     )
 
 
+@pytest.mark.django_db
+def test_submission_company_list_filters(
+    client,
+    mock_common_company_user,
+    mock_company_user,
+    mock_job_posting,
+    mock_submission,
+):
+    """
+    기업 지원자함 열람 여부 / 공고 필터와 커서
+    """
+    url = "/api/submission/company/"
+    client.force_login(mock_common_company_user)
+
+    unread = json.loads(client.get(url, {"is_read": "false"}).content)
+    read = json.loads(client.get(url, {"is_read": "true"}).content)
+    by_posting = json.loads(
+        client.get(
+            url, {"job_posting_id": str(mock_job_posting.job_posting_id)}
+        ).content
+    )
+
+    assert [s["submission_id"] for s in unread["submission_list"]] == [
+        str(mock_submission.submission_id)
+    ]
+    assert read["submission_list"] == []
+    assert len(by_posting["submission_list"]) == 1
+    assert by_posting["next_cursor"] is None
+
+
+@pytest.mark.django_db
+def test_submission_company_list_snapshot_columns(
+    client,
+    mock_common_company_user,
+    mock_company_user,
+    mock_resume,
+    mock_submission,
+):
+    """
+    지원자함은 스냅샷 생성 컬럼(제목 / 직무 / 학력)으로 응답하고 직무로 필터
+    """
+    url = "/api/submission/company/"
+    client.force_login(mock_common_company_user)
+
+    matched = json.loads(
+        client.get(url, {"job_category": mock_resume.job_category}).content
+    )["submission_list"]
+    other = json.loads(client.get(url, {"job_category": "영업"}).content)
+
+    assert matched[0]["resume_title"] == mock_resume.resume_title
+    assert matched[0]["job_category"] == mock_resume.job_category
+    assert matched[0]["education_level"] == mock_resume.education_level
+    assert other["submission_list"] == []
+
+
+@pytest.mark.django_db
+def test_submission_company_list_search(
+    client,
+    mock_common_company_user,
+    mock_company_user,
+    mock_job_posting,
+    mock_submission,
+):
+    """
+    스냅샷 검색어 / 자격증 이름으로 지원자 검색
+    """
+    url = "/api/submission/company/"
+    client.force_login(mock_common_company_user)
+
+    def found(params):
+        response = client.get(url, params)
+        return [
+            s["submission_id"]
+            for s in json.loads(response.content)["submission_list"]
+        ]
+
+    expected = [str(mock_submission.submission_id)]
+    assert found({"q": "startup"}) == expected
+    assert found({"q": "test univ"}) == expected
+    assert found({"q": "kotlin"}) == []
+    assert found({"certification": "OCJP"}) == expected
+    assert found({"certification": "OCP"}) == []
+
+
+@pytest.mark.django_db
+def test_submission_company_unread_count(
+    client,
+    mock_common_company_user,
+    mock_company_user,
+    mock_job_posting,
+    mock_submission,
+    django_capture_on_commit_callbacks,
+):
+    """
+    미열람 지원자 수는 처음 조회 때 채워지고 열람하면 줄어듦
+    """
+    url = "/api/submission/company/unread/"
+    client.force_login(mock_common_company_user)
+
+    before = json.loads(client.get(url).content)
+    # 카운터 감소는 커밋 후 콜백으로 반영됨
+    with django_capture_on_commit_callbacks(execute=True):
+        client.get(f"/api/submission/company/{mock_submission.submission_id}/")
+    after = json.loads(client.get(url).content)
+
+    assert before["unread_count"] == 1
+    assert before["job_posting_list"] == [
+        {
+            "job_posting_id": str(mock_job_posting.job_posting_id),
+            "unread_count": 1,
+        }
+    ]
+    assert after["unread_count"] == 0
+    assert after["job_posting_list"] == []
+
+
+@pytest.mark.django_db
+def test_submission_company_mark_read(
+    client,
+    mock_common_company_user,
+    mock_company_user,
+    mock_job_posting,
+    mock_submission,
+    django_capture_on_commit_callbacks,
+):
+    """
+    공고 단위 일괄 열람은 미열람 지원서만 UPDATE 하고 카운터를 비움
+    """
+    url = "/api/submission/company/read/"
+    unread_url = "/api/submission/company/unread/"
+    client.force_login(mock_common_company_user)
+    body = json.dumps({"job_posting_id": str(mock_job_posting.job_posting_id)})
+
+    before = json.loads(client.get(unread_url).content)
+    # 카운터 초기화는 커밋 후 콜백으로 반영됨
+    with django_capture_on_commit_callbacks(execute=True):
+        first = client.post(url, body, content_type="application/json")
+        second = client.post(url, body, content_type="application/json")
+
+    assert json.loads(first.content)["marked_count"] == 1
+    assert json.loads(second.content)["marked_count"] == 0
+    mock_submission.refresh_from_db()
+    assert mock_submission.is_read is True
+    assert before["unread_count"] == 1
+    assert json.loads(client.get(unread_url).content)["unread_count"] == 0
+
+
+def test_score_snapshot_prefers_matching_resume():
+    """
+    직종 / 키워드 / 경력 / 학력이 맞는 이력서가 더 높은 점수
+    """
+    profile = posting_profile(
+        {
+            "job_posting_id": None,
+            "job_keyword_main": "개발",
+            "job_keyword_sub": ["백엔드", "Python"],
+            "education": "대학교 졸업",
+            "employment_type": "경력",
+        }
+    )
+    strong = {
+        "job_category": "개발",
+        "education_level": "대학교 졸업",
+        "career_list": [
+            {
+                "position": "백엔드",
+                "employment_period_start": "2018-01-01",
+                "employment_period_end": "2024-01-01",
+            }
+        ],
+        "certification_list": [{"certification_name": "Python 자격증"}],
+    }
+    weak = {
+        "job_category": "영업",
+        "education_level": "고졸",
+        "career_list": [],
+        "certification_list": [],
+    }
+
+    assert score_snapshot(strong, profile) == 95
+    assert score_snapshot(weak, profile) == 0
+
+
+@pytest.mark.django_db
+def test_submission_company_list_sort_by_score(
+    client,
+    mock_common_company_user,
+    mock_company_user,
+    mock_job_posting,
+    mock_submission,
+):
+    """
+    rescore 후 공고 적합도순으로 지원자 정렬
+    """
+    call_command("rescore_submissions")
+    mock_submission.refresh_from_db()
+    expected = score_job_posting(
+        mock_job_posting, mock_submission.snapshot_resume
+    )
+    client.force_login(mock_common_company_user)
+
+    response = client.get(
+        "/api/submission/company/",
+        {
+            "job_posting_id": str(mock_job_posting.job_posting_id),
+            "sort": "score",
+        },
+    )
+
+    assert expected > 0
+    assert mock_submission.match_score == expected
+    assert (
+        json.loads(response.content)["submission_list"][0]["match_score"]
+        == expected
+    )
+
+
+@pytest.mark.django_db
+def test_job_posting_patch_rescores_submissions(
+    client,
+    mock_common_company_user,
+    mock_company_user,
+    mock_job_posting,
+    mock_submission,
+    django_capture_on_commit_callbacks,
+):
+    """
+    공고의 직종 / 키워드를 수정하면 커밋 후 지원서 점수를 다시 계산해
+    적합도순 정렬이 새 조건을 따름
+    """
+    designer_common_user = CommonUser.objects.create(
+        email="designer@test.com", password="1q2w3e4r", join_type="normal"
+    )
+    designer = Submission.objects.create(
+        job_posting=mock_job_posting,
+        user=UserInfo.objects.create(
+            common_user=designer_common_user,
+            name="디자이너",
+            phone_number="010456456",
+            gender="female",
+        ),
+        snapshot=ResumeSnapshot.intern(
+            {
+                "resume_title": "디자인 이력서",
+                "job_category": "디자인",
+                "career_list": [{"position": "디자이너"}],
+                "certification_list": [],
+            }
+        ),
+    )
+    call_command("rescore_submissions")
+    client.force_login(mock_common_company_user)
+    inbox = {
+        "job_posting_id": str(mock_job_posting.job_posting_id),
+        "sort": "score",
+    }
+
+    before = json.loads(client.get("/api/submission/company/", inbox).content)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.patch(
+            f"/api/job-postings/job-postings/{mock_job_posting.job_posting_id}/",
+            json.dumps(
+                {"job_keyword_main": "디자인", "job_keyword_sub": ["디자이너"]}
+            ),
+            content_type="application/json",
+        )
+    after = json.loads(client.get("/api/submission/company/", inbox).content)
+
+    assert response.status_code == 200
+    assert [item["submission_id"] for item in before["submission_list"]] == [
+        str(mock_submission.submission_id),
+        str(designer.submission_id),
+    ]
+    assert [item["submission_id"] for item in after["submission_list"]] == [
+        str(designer.submission_id),
+        str(mock_submission.submission_id),
+    ]
+
+
+@pytest.mark.django_db
+def test_submission_company_export(
+    client,
+    mock_common_company_user,
+    mock_company_user,
+    mock_job_posting,
+    mock_careers,
+    mock_submission,
+):
+    """
+    지원자 목록을 csv / xlsx 로 스트리밍 내보내기
+    """
+    url = "/api/submission/company/export/"
+    client.force_login(mock_common_company_user)
+
+    response = client.get(
+        url, {"job_posting_id": str(mock_job_posting.job_posting_id)}
+    )
+    lines = (
+        b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+    )
+    header, row = next(csv.reader(lines[:1])), next(csv.reader(lines[1:]))
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/csv")
+    assert len(lines) == 2
+    assert len(header) == len(row)
+    assert row[header.index("이름")] == mock_submission.user.name
+    assert row[header.index("경력1 회사명")] == mock_careers[0].company_name
+
+    xlsx = client.get(url, {"format": "xlsx"})
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(xlsx.streaming_content)))
+    assert xlsx.status_code == 200
+    assert "xl/worksheets/sheet1.xml" in archive.namelist()
+    assert client.get(url, {"format": "pdf"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_delete_orphan_snapshots(mock_submission):
+    """
+    지원서가 참조하지 않는 스냅샷 중 유예 기간 동안 쓰이지 않은 것만 삭제하고,
+    오래된 고아 스냅샷이라도 다시 intern 되면 유예 기간 동안 보존
+    """
+    old_orphan = ResumeSnapshot.intern({"resume_title": "삭제된 지원서"})
+    reused = ResumeSnapshot.intern({"resume_title": "다시 지원한 이력서"})
+    new_orphan = ResumeSnapshot.intern({"resume_title": "저장 중인 지원서"})
+    ResumeSnapshot.objects.filter(
+        digest__in=[
+            old_orphan.digest,
+            reused.digest,
+            mock_submission.snapshot_id,
+        ]
+    ).update(last_used_at=timezone.now() - timezone.timedelta(days=1))
+    ResumeSnapshot.intern({"resume_title": "다시 지원한 이력서"})
+
+    call_command("delete_orphan_snapshots")
+
+    assert set(ResumeSnapshot.objects.values_list("digest", flat=True)) == {
+        mock_submission.snapshot_id,
+        reused.digest,
+        new_orphan.digest,
+    }
+
+
+def test_flatten_submission_neutralizes_formulas():
+    """
+    수식으로 시작하는 지원자 입력값은 ' 를 붙여 텍스트로 내보냄
+    """
+    header = export_header()
+    row = flatten_submission(
+        {
+            "created_at": timezone.now(),
+            "is_read": False,
+            "name": '=HYPERLINK("http://evil")',
+            "job_posting_title": "공고",
+            "payload": {
+                "introduce": "@SUM(A1)",
+                "school_name": "-1+2",
+                "career_list": [{"company_name": "\t=1", "position": "개발"}],
+            },
+        }
+    )
+
+    assert row[header.index("이름")] == '\'=HYPERLINK("http://evil")'
+    assert row[header.index("자기소개")] == "'@SUM(A1)"
+    assert row[header.index("학교명")] == "'-1+2"
+    assert row[header.index("경력1 회사명")] == "'\t=1"
+    assert row[header.index("경력1 직무")] == "개발"
+    assert row[header.index("열람 여부")] is False
+
+
 @pytest.mark.django_db
 def test_update_memo_success(
     client,
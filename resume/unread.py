@@ -0,0 +1,174 @@
+from typing import Iterable, Optional, Union, cast
+from uuid import UUID
+
+from django.db import transaction
+from django.db.models import Count
+from redis import RedisError
+
+from resume.models import Submission
+from user.redis import r
+
+UNREAD_CACHE_TTL = (
+    60 * 60 * 24
+)  # 카운터 유지 시간 (초), 만료되면 DB 에서 다시 채움
+UNREAD_KEY_PREFIX = "unread:company:"  # 기업(common_user_id)별 카운터 해시
+TOTAL_FIELD = "__total__"  # 기업 전체 미열람 수 (해시가 채워졌음을 겸해서 표시)
+
+# 카운터가 채워진 경우에만 증감 (없으면 다음 조회 때 DB 에서 채움)
+# KEYS[1] 기업 카운터 해시, ARGV[1] 공고 ID, ARGV[2] 증감값
+_ADJUST_SCRIPT = r.register_script(
+    """
+    if redis.call("EXISTS", KEYS[1]) == 0 then
+        return nil
+    end
+    local total = redis.call("HINCRBY", KEYS[1], "__total__", ARGV[2])
+    if total < 0 then
+        redis.call("HSET", KEYS[1], "__total__", 0)
+    end
+    local count = redis.call("HINCRBY", KEYS[1], ARGV[1], ARGV[2])
+    if count <= 0 then
+        redis.call("HDEL", KEYS[1], ARGV[1])
+    end
+    return total
+    """
+)
+
+# 카운터가 비어 있을 때만 DB 집계값으로 채움
+# (집계 도중 반영된 증감이 덮어써지지 않도록 이미 채워졌으면 건너뜀)
+# KEYS[1] 기업 카운터 해시, ARGV[1] 유지 시간, ARGV[2..] 필드 / 값 쌍
+_STORE_IF_ABSENT_SCRIPT = r.register_script(
+    """
+    if redis.call("EXISTS", KEYS[1]) == 1 then
+        return 0
+    end
+    redis.call("HSET", KEYS[1], unpack(ARGV, 2))
+    redis.call("EXPIRE", KEYS[1], ARGV[1])
+    return 1
+    """
+)
+
+
+def _unread_key(company_common_user_id: UUID) -> str:
+    return f"{UNREAD_KEY_PREFIX}{company_common_user_id}"
+
+
+def _count_unread(
+    company_common_user_ids: Optional[Iterable[UUID]] = None,
+) -> dict[UUID, dict[str, int]]:
+    """
+    기업(common_user_id)별 {공고 ID: 미열람 수} 를 GROUP BY 한 번으로 집계
+    """
+    submissions = Submission.objects.filter(is_read=False)
+    if company_common_user_ids is not None:
+        submissions = submissions.filter(
+            job_posting__company_id__common_user_id__in=list(
+                company_common_user_ids
+            )
+        )
+    counts: dict[UUID, dict[str, int]] = {}
+    for row in (
+        submissions.order_by()
+        .values("job_posting__company_id__common_user_id", "job_posting_id")
+        .annotate(count=Count("*"))
+    ):
+        company = row["job_posting__company_id__common_user_id"]
+        counts.setdefault(company, {})[str(row["job_posting_id"])] = row[
+            "count"
+        ]
+    return counts
+
+
+def _store_counters(
+    pipe, company_common_user_id: UUID, postings: dict[str, int]
+) -> None:
+    key = _unread_key(company_common_user_id)
+    pipe.delete(key)
+    pipe.hset(key, mapping={TOTAL_FIELD: sum(postings.values()), **postings})
+    pipe.expire(key, UNREAD_CACHE_TTL)
+
+
+def get_unread_counts(
+    company_common_user_id: UUID,
+) -> tuple[int, dict[str, int]]:
+    """
+    (기업 전체 미열람 수, {공고 ID: 미열람 수})
+
+    Redis 해시 하나를 읽어 응답하며, 비어 있을 때만 DB 에서 채운다.
+    """
+    key = _unread_key(company_common_user_id)
+    try:
+        counters = cast(dict[str, str], r.hgetall(key))
+    except RedisError:
+        counters = {}
+    if TOTAL_FIELD in counters:
+        total = int(counters.pop(TOTAL_FIELD))
+        return total, {pk: int(count) for pk, count in counters.items()}
+
+    postings = _count_unread([company_common_user_id]).get(
+        company_common_user_id, {}
+    )
+    total = sum(postings.values())
+    fields: list[Union[str, int]] = [TOTAL_FIELD, total]
+    for job_posting_id, count in postings.items():
+        fields += [job_posting_id, count]
+    try:
+        _STORE_IF_ABSENT_SCRIPT(keys=[key], args=[UNREAD_CACHE_TTL, *fields])
+    except RedisError:
+        pass
+    return total, postings
+
+
+def _adjust(company_common_user_id: UUID, job_posting_id: UUID, delta: int):
+    try:
+        _ADJUST_SCRIPT(
+            keys=[_unread_key(company_common_user_id)],
+            args=[str(job_posting_id), delta],
+        )
+    except RedisError:
+        # 반영하지 못한 카운터는 버려서 다음 조회 때 DB 에서 다시 채움
+        _reset(company_common_user_id)
+
+
+def adjust_unread_count(
+    company_common_user_id: UUID, job_posting_id: UUID, delta: int
+) -> None:
+    """
+    새 지원(+1) / 열람(-1) 을 트랜잭션 커밋 후 카운터에 반영
+    """
+    transaction.on_commit(
+        lambda: _adjust(company_common_user_id, job_posting_id, delta)
+    )
+
+
+def _reset(company_common_user_id: UUID) -> None:
+    try:
+        r.delete(_unread_key(company_common_user_id))
+    except RedisError:
+        pass
+
+
+def reset_unread_counts(company_common_user_id: UUID) -> None:
+    """
+    일괄 열람 후 기업 카운터를 비워 다음 조회 때 DB 에서 다시 채움
+    """
+    transaction.on_commit(lambda: _reset(company_common_user_id))
+
+
+def reconcile_unread_counters(batch_size: int = 500) -> int:
+    """
+    채워져 있는 기업 카운터를 DB 집계값으로 덮어써 누적 오차를 바로잡음
+
+    Redis 에 카운터가 있는 기업만 batch_size 씩 묶어 집계하고,
+    처리한 기업 수를 반환한다.
+    """
+    keys = list(r.scan_iter(match=f"{UNREAD_KEY_PREFIX}*", count=1000))
+    companies = [UUID(key.rsplit(":", 1)[1]) for key in keys]
+
+    for start in range(0, len(companies), batch_size):
+        batch = companies[start : start + batch_size]
+        counts = _count_unread(batch)
+        pipe = r.pipeline()
+        for company in batch:
+            _store_counters(pipe, company, counts.get(company, {}))
+        pipe.execute()
+    return len(companies)
@@ -3,7 +3,10 @@ from django.urls.conf import path
 from resume.views.resume_views import MyResumeDetailView, MyResumeListView
 from resume.views.submission_views import (
     SubmissionCompanyDetialView,
+    SubmissionCompanyExportView,
     SubmissionCompanyListView,
+    SubmissionCompanyReadView,
+    SubmissionCompanyUnreadView,
     SubmissionDetailView,
     SubmissionListView,
     SubmissionMemoView,
@@ -24,6 +27,21 @@ urlpatterns = [
         SubmissionCompanyListView.as_view(),
         name="company_submissions",
     ),
+    path(
+        "company/export/",
+        SubmissionCompanyExportView.as_view(),
+        name="company_submissions_export",
+    ),
+    path(
+        "company/read/",
+        SubmissionCompanyReadView.as_view(),
+        name="company_submissions_read",
+    ),
+    path(
+        "company/unread/",
+        SubmissionCompanyUnreadView.as_view(),
+        name="company_unread",
+    ),
     path(
         "company/<uuid:submission_id>/",
         SubmissionCompanyDetialView.as_view(),
@@ -1,13 +1,16 @@
 import json
 import uuid
-from typing import List
+from collections import defaultdict
+from typing import List, Sequence
 
 from django.core.exceptions import PermissionDenied
 from django.db import transaction
+from django.db.models import Model
 from django.http import HttpRequest, JsonResponse
 from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_protect
+from pydantic import BaseModel
 
 from resume.models import CareerInfo, Certification, Resume
 from resume.schemas import (
@@ -191,6 +194,7 @@ class MyResumeDetailView(View):
 
             resume_to_update = (
                 Resume.objects.filter(user=user, resume_id=resume_id)
+                .select_related("user")
                 .prefetch_related("careers", "certifications")
                 .first()
             )
@@ -230,6 +234,27 @@ class MyResumeDetailView(View):
             return JsonResponse({"errors": str(e)}, status=400)
 
 
+RESUME_FIELDS = (
+    "job_category",
+    "resume_title",
+    "education_level",
+    "school_name",
+    "education_state",
+    "introduce",
+)
+CAREER_FIELDS = (
+    "company_name",
+    "position",
+    "employment_period_start",
+    "employment_period_end",
+)
+CERTIFICATION_FIELDS = (
+    "certification_name",
+    "issuing_organization",
+    "date_acquired",
+)
+
+
 def create_new_resume(user: UserInfo, resume_data: ResumeCreateModel):
     new_resume = Resume.objects.create(
         user=user,
@@ -240,93 +265,116 @@ def create_new_resume(user: UserInfo, resume_data: ResumeCreateModel):
         education_state=resume_data.education_state,
         introduce=resume_data.introduce,
     )
+    # 경력 / 자격증은 개수와 관계없이 INSERT 한 번씩
     if resume_data.career_list:
-        for career in resume_data.career_list:
-            CareerInfo.objects.create(
-                resume=new_resume,
-                company_name=career.company_name,
-                position=career.position,
-                employment_period_start=career.employment_period_start,
-                employment_period_end=career.employment_period_end,
-            )
-
+        CareerInfo.objects.bulk_create(
+            [
+                CareerInfo(resume=new_resume, **career.model_dump())
+                for career in resume_data.career_list
+            ]
+        )
     if resume_data.certification_list:
-        for certification in resume_data.certification_list:
-            Certification.objects.create(
-                resume=new_resume,
-                certification_name=certification.certification_name,
-                issuing_organization=certification.issuing_organization,
-                date_acquired=certification.date_acquired,
-            )
-    new_resume.save()
+        Certification.objects.bulk_create(
+            [
+                Certification(resume=new_resume, **certification.model_dump())
+                for certification in resume_data.certification_list
+            ]
+        )
     return new_resume
 
 
+def sync_resume_children(
+    resume: Resume,
+    existing: Sequence[Model],
+    items: Sequence[BaseModel],
+    model: type[Model],
+    fields: tuple[str, ...],
+) -> None:
+    """
+    기존 하위 행(경력 / 자격증)과 요청 목록을 값 기준으로 비교해
+    사라진 행은 DELETE 한 번, 새 행은 bulk_create 한 번으로 반영
+    (그대로인 행은 건드리지 않음)
+    """
+    remaining: dict[tuple, list[Model]] = defaultdict(list)
+    for row in existing:
+        remaining[tuple(getattr(row, field) for field in fields)].append(row)
+
+    to_create = []
+    for item in items:
+        key = tuple(getattr(item, field) for field in fields)
+        if remaining.get(key):
+            remaining[key].pop()
+        else:
+            to_create.append(model(resume=resume, **item.model_dump()))
+
+    stale_ids = [row.pk for rows in remaining.values() for row in rows]
+    if stale_ids:
+        model._default_manager.filter(pk__in=stale_ids).delete()
+    if to_create:
+        model._default_manager.bulk_create(to_create)
+
+
 def update_resume(
     resume: Resume, update_data: ResumeUpdateModel
 ) -> ResumeOutputModel:
-    # 기본 정보 수정
-    for field in [
-        "job_category",
-        "resume_title",
-        "education_level",
-        "school_name",
-        "education_state",
-        "introduce",
-    ]:
-        value = getattr(update_data, field, None)
-        if value is not None:
-            setattr(resume, field, value)
-    resume.save()
-
-    # 경력 수정
-    if update_data.career_list is not None:
-        resume.careers.all().delete()
-        for career in update_data.career_list:
-            CareerInfo.objects.create(
-                resume_id=resume.resume_id,
-                company_name=career.company_name,
-                position=career.position,
-                employment_period_start=career.employment_period_start,
-                employment_period_end=career.employment_period_end,
-                # type: ignore
+    """
+    바뀐 컬럼과 하위 행만 저장하고, 다시 조회하지 않고 응답 모델 생성
+
+    resume 은 careers / certifications 를 prefetch 한 상태여야 한다.
+    """
+    careers = list(resume.careers.all())
+    certifications = list(resume.certifications.all())
+
+    with transaction.atomic():
+        # 기본 정보 수정
+        changed_fields = []
+        for field in RESUME_FIELDS:
+            value = getattr(update_data, field, None)
+            if value is not None and value != getattr(resume, field):
+                setattr(resume, field, value)
+                changed_fields.append(field)
+        if changed_fields:
+            resume.save(update_fields=[*changed_fields, "updated_at"])
+
+        # 경력 수정
+        if update_data.career_list is not None:
+            sync_resume_children(
+                resume,
+                careers,
+                update_data.career_list,
+                CareerInfo,
+                CAREER_FIELDS,
             )
 
-    # 자격증 수정
-    if update_data.certification_list is not None:
-        resume.certifications.all().delete()
-        for certification in update_data.certification_list:
-            Certification.objects.create(
-                resume_id=resume.resume_id,
-                certification_name=certification.certification_name,
-                issuing_organization=certification.issuing_organization,
-                date_acquired=certification.date_acquired,
+        # 자격증 수정
+        if update_data.certification_list is not None:
+            sync_resume_children(
+                resume,
+                certifications,
+                update_data.certification_list,
+                Certification,
+                CERTIFICATION_FIELDS,
             )
 
-    updated_resume = (
-        Resume.objects.filter(resume_id=resume.resume_id)
-        .prefetch_related("careers", "certifications")
-        .first()
+    career_models = (
+        update_data.career_list
+        if update_data.career_list is not None
+        else serialize_careers(careers)
     )
-
-    if updated_resume is None:
-        raise Resume.DoesNotExist(
-            f"Resume with id {resume.resume_id} does not exist."
-        )
-    career_models = serialize_careers(list(updated_resume.careers.all()))
-    certification_models = serialize_certifications(
-        list(updated_resume.certifications.all())
+    certification_models = (
+        update_data.certification_list
+        if update_data.certification_list is not None
+        else serialize_certifications(certifications)
     )
-
     return ResumeOutputModel(
-        resume_id=updated_resume.resume_id,
-        job_category=updated_resume.job_category,
-        resume_title=updated_resume.resume_title,
-        education_level=updated_resume.education_level,
-        school_name=updated_resume.school_name,
-        education_state=updated_resume.education_state,
-        introduce=updated_resume.introduce,
-        user=UserInfoModel.model_validate(updated_resume.user),
+        resume_id=resume.resume_id,
+        job_category=resume.job_category,
+        resume_title=resume.resume_title,
+        education_level=resume.education_level,
+        school_name=resume.school_name,
+        education_state=resume.education_state,
+        introduce=resume.introduce,
+        user=UserInfoModel.model_validate(resume.user),
         career_list=career_models,
         certification_list=certification_models,
     )
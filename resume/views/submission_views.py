@@ -1,20 +1,29 @@
 import json
 import uuid
 from http.client import responses
+from typing import Optional, Union
 
-from django.http import HttpRequest, JsonResponse
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_protect
 
-from job_posting.models import JobPosting, JobPostingBookmark
-from resume.models import Resume, Submission
+from job_posting.bookmarks import is_job_posting_bookmarked
+from job_posting.counters import adjust_submission_count
+from job_posting.models import JobPosting
+from job_posting.stats import invalidate_company_stats
+from resume.export import stream_submissions
+from resume.models import Resume, ResumeSnapshot, Submission
 from resume.schemas import (
     CareerInfoModel,
     CertificationInfoModel,
     JobpostingGetListModel,
     JobpostingListOutputModel,
+    JobpostingUnreadCountModel,
     SnapshotResumeModel,
     SubmissionCompanyDetailModel,
     SubmissionCompanyGetListInfoModel,
@@ -22,19 +31,30 @@ from resume.schemas import (
     SubmissionCompanyOutputDetailModel,
     SubmissionDetailResponseModel,
     SubmissionListResponseModel,
+    SubmissionMarkReadModel,
+    SubmissionMarkReadResponseModel,
     SubmissionMemoResponseModel,
     SubmissionMemoUpdateModel,
     SubmissionModel,
     SubmissionOutputModel,
+    SubmissionUnreadCountResponseModel,
 )
+from resume.scoring import score_job_posting
+from resume.search import applicant_search_query
 from resume.serializer import (
     serialize_careers,
     serialize_certifications,
     serialize_submissions,
 )
+from resume.unread import (
+    adjust_unread_count,
+    get_unread_counts,
+    reset_unread_counts,
+)
 from user.models import UserInfo
 from user.schemas import UserInfoModel
 from utils.common import get_valid_company_user, get_valid_normal_user
+from utils.pagination import keyset_page, parse_page_size
 
 # ------------------------
 # 지원 관련 api
@@ -54,12 +74,11 @@ class SubmissionListView(View):
         try:
             token = request.user
             user = get_valid_normal_user(token)
-            submissions: list[Submission] = list(
-                Submission.objects.filter(user=user).all()
+            submission_model = serialize_submissions(
+                Submission.objects.filter(user=user).order_by("-created_at"),
+                user.common_user_id,
             )
 
-            submission_model = serialize_submissions(submissions)
-
             response = SubmissionListResponseModel(
                 message="Successfully loaded submission list",
                 submission_list=submission_model,
@@ -80,7 +99,10 @@ class SubmissionListView(View):
             job_posting_id = data.get("job_posting_id")
             resume_id = data.get("resume_id")
 
-            job_posting = get_object_or_404(JobPosting, pk=job_posting_id)
+            job_posting = get_object_or_404(
+                JobPosting.objects.select_related("company_id"),
+                pk=job_posting_id,
+            )
             resume = (
                 Resume.objects.filter(resume_id=resume_id)
                 .prefetch_related("careers", "certifications")
@@ -110,12 +132,8 @@ class SubmissionListView(View):
                 job_posting_title=job_posting.job_posting_title,
                 summary=job_posting.summary,
                 deadline=job_posting.deadline,
-                is_bookmarked=(
-                    True
-                    if JobPostingBookmark.objects.filter(
-                        job_posting_id=job_posting
-                    ).exists()
-                    else False
+                is_bookmarked=is_job_posting_bookmarked(
+                    user.common_user_id, job_posting.job_posting_id
                 ),
             )
 
@@ -161,9 +179,9 @@ class SubmissionDetailView(View):
             token = request.user
             user = get_valid_normal_user(token)
 
-            submission: Submission = Submission.objects.get(
-                user=user, submission_id=submission_id
-            )
+            submission: Submission = Submission.objects.select_related(
+                "snapshot"
+            ).get(user=user, submission_id=submission_id)
             if submission is None:
                 return JsonResponse(
                     {"errors": "Not found submission data"}, status=404
@@ -178,13 +196,15 @@ class SubmissionDetailView(View):
                 summary=submission.job_posting.summary,
                 deadline=submission.job_posting.deadline,
                 job_posting_title=submission.job_posting.job_posting_title,
-                is_bookmarked=JobPostingBookmark.objects.filter(
-                    user_id=submission.user.user_id
-                ).exists(),
+                is_bookmarked=is_job_posting_bookmarked(
+                    user.common_user_id, submission.job_posting_id
+                ),
             )
             submission_model = SubmissionModel(
                 submission_id=submission.submission_id,
-                snapshot_resume=submission.snapshot_resume,
+                snapshot_resume=SnapshotResumeModel.model_validate(
+                    submission.snapshot_resume
+                ),
                 job_posting=job_posting_model,
                 memo=submission.memo,
                 is_read=submission.is_read,
@@ -216,7 +236,16 @@ class SubmissionDetailView(View):
                 return JsonResponse(
                     {"errors": "Not found submission data"}, status=404
                 )
-            submission.delete()
+            with transaction.atomic():
+                submission.delete()
+                adjust_submission_count(submission.job_posting_id, -1)
+                invalidate_company_stats(submission.job_posting.company_id_id)
+                if not submission.is_read:
+                    adjust_unread_count(
+                        submission.job_posting.company_id.common_user_id,
+                        submission.job_posting_id,
+                        -1,
+                    )
             return JsonResponse(
                 {"message": "Successfully data deleted"}, status=200
             )
@@ -287,6 +316,11 @@ class SubmissionMemoView(View):
             return JsonResponse({"errors": str(e)}, status=400)
 
 
+# 기업 지원자함 최신 지원순 (마지막 키는 유일한 PK)
+COMPANY_INBOX_ORDERING = ("-created_at", "-submission_id")
+COMPANY_INBOX_SCORE_ORDERING = ("-match_score", "-created_at", "-submission_id")
+
+
 class SubmissionCompanyListView(View):
     """
     기업 유저 지원자 목록 조회
@@ -299,30 +333,86 @@ class SubmissionCompanyListView(View):
         try:
             token = request.user
             user = get_valid_company_user(token)
-            submission_list = Submission.objects.filter(
+            submissions = Submission.objects.filter(
                 job_posting__company_id=user.company_id
-            ).all()
+            )
+            # 공고 / 열람 여부 필터
+            job_posting_id = request.GET.get("job_posting_id")
+            if job_posting_id:
+                submissions = submissions.filter(
+                    job_posting_id=uuid.UUID(job_posting_id)
+                )
+            is_read = request.GET.get("is_read")
+            if is_read in ("true", "false"):
+                submissions = submissions.filter(is_read=(is_read == "true"))
+            # 기술 / 학교 / 경력 검색어와 자격증 이름 (스냅샷 GIN 인덱스)
+            q = request.GET.get("q", "").strip()
+            if q:
+                submissions = submissions.filter(
+                    snapshot__search_vector=applicant_search_query(q)
+                )
+            job_category = request.GET.get("job_category", "").strip()
+            if job_category:
+                submissions = submissions.filter(
+                    snapshot__job_category=job_category
+                )
+            certification = request.GET.get("certification", "").strip()
+            if certification:
+                submissions = submissions.filter(
+                    snapshot__certification_names__contains=[certification]
+                )
+
+            # sort=score 이면 적합도순 (공고 필터와 함께 쓰면 인덱스 순서대로 읽음)
+            ordering = (
+                COMPANY_INBOX_SCORE_ORDERING
+                if request.GET.get("sort") == "score"
+                else COMPANY_INBOX_ORDERING
+            )
+
+            # 지원자 이름 / 공고 요약 / 스냅샷 생성 컬럼을 JOIN 으로 한 번에 조회
+            # (이력서 JSON 전체는 읽지 않음)
+            rows, next_cursor = keyset_page(
+                submissions.values(
+                    "submission_id",
+                    "job_posting_id",
+                    "is_read",
+                    "created_at",
+                    "match_score",
+                    name=F("user__name"),
+                    summary=F("job_posting__summary"),
+                    resume_title=F("snapshot__resume_title"),
+                    job_category=F("snapshot__job_category"),
+                    education_level=F("snapshot__education_level"),
+                ),
+                ordering,
+                request.GET.get("cursor"),
+                parse_page_size(request.GET.get("size")),
+            )
+
+            # 필터 드롭다운용 공고 목록 (지원자가 있는 공고만, 공고당 1건)
             job_posting_list_model: list[JobpostingGetListModel] = [
-                JobpostingGetListModel.model_validate(submission.job_posting)
-                for submission in submission_list
+                JobpostingGetListModel.model_validate(posting)
+                for posting in JobPosting.objects.filter(
+                    Exists(
+                        Submission.objects.filter(job_posting=OuterRef("pk"))
+                    ),
+                    company_id=user.company_id,
+                )
+                .order_by("-created_at")
+                .values("job_posting_id", "job_posting_title")
             ]
             submission_list_model: list[SubmissionCompanyGetListInfoModel] = [
                 SubmissionCompanyGetListInfoModel(
-                    submission_id=submission.submission_id,
-                    job_posting_id=submission.job_posting.job_posting_id,
-                    name=submission.user.name,
-                    summary=submission.job_posting.summary,
-                    is_read=submission.is_read,
-                    created_at=submission.created_at.date(),
-                    resume_title=submission.snapshot_resume["resume_title"],
+                    **{**row, "created_at": row["created_at"].date()}
                 )
-                for submission in submission_list
+                for row in rows
             ]
 
             response = SubmissionCompanyGetListOutputModel(
                 message="Successfully loaded submission_list",
                 job_posting_list=job_posting_list_model,
                 submission_list=submission_list_model,
+                next_cursor=next_cursor,
             )
 
             return JsonResponse(response.model_dump(), status=200)
@@ -330,6 +420,57 @@ class SubmissionCompanyListView(View):
             return JsonResponse({"errors": str(e)}, status=400)
 
 
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+class SubmissionCompanyExportView(View):
+    """
+    기업 유저 지원자 목록 스프레드시트 내보내기 (csv / xlsx)
+
+    지원서를 서버 사이드 커서로 읽으며 바로 응답으로 흘려보내므로
+    지원자가 수만 명인 공고도 메모리 사용량이 일정하다.
+    """
+
+    def get(
+        self, request: HttpRequest
+    ) -> Union[StreamingHttpResponse, JsonResponse]:
+        try:
+            token = request.user
+            user = get_valid_company_user(token)
+            export_format = request.GET.get("format", "csv")
+            if export_format not in EXPORT_CONTENT_TYPES:
+                return JsonResponse(
+                    {"errors": "format must be 'csv' or 'xlsx'"}, status=400
+                )
+            job_posting_id: Optional[uuid.UUID] = None
+            if request.GET.get("job_posting_id"):
+                job_posting_id = uuid.UUID(request.GET["job_posting_id"])
+                if not JobPosting.objects.filter(
+                    job_posting_id=job_posting_id, company_id=user.company_id
+                ).exists():
+                    return JsonResponse(
+                        {"errors": "Not found job posting"}, status=404
+                    )
+
+            response = StreamingHttpResponse(
+                stream_submissions(
+                    export_format, user.company_id, job_posting_id
+                ),
+                content_type=EXPORT_CONTENT_TYPES[export_format],
+            )
+            response["Content-Disposition"] = (
+                f'attachment; filename="submissions.{export_format}"'
+            )
+            return response
+        except PermissionDenied as e:
+            return JsonResponse({"errors": str(e)}, status=403)
+        except Exception as e:
+            return JsonResponse({"errors": str(e)}, status=400)
+
+
 class SubmissionCompanyDetialView(View):
     """
     기업회원 지원자 이력서 조회
@@ -341,13 +482,29 @@ class SubmissionCompanyDetialView(View):
         try:
             token = request.user
             user = get_valid_company_user(token)
-            submission = Submission.objects.get(submission_id=submission_id)
+            submission = (
+                Submission.objects.select_related("snapshot", "user")
+                .filter(
+                    submission_id=submission_id,
+                    job_posting__company_id=user.company_id,
+                )
+                .first()
+            )
             if submission is None:
                 return JsonResponse(
                     {"errors": "Not found submission data"}, status=404
                 )
-            submission.is_read = True
-            submission.save()
+            # 처음 열람할 때만 is_read 한 컬럼을 조건부 UPDATE
+            if not submission.is_read:
+                with transaction.atomic():
+                    marked = Submission.objects.filter(
+                        submission_id=submission.submission_id, is_read=False
+                    ).update(is_read=True)
+                    if marked:
+                        invalidate_company_stats(user.company_id)
+                        adjust_unread_count(
+                            user.common_user_id, submission.job_posting_id, -1
+                        )
 
             submission_model = SubmissionCompanyOutputDetailModel(
                 job_category=submission.snapshot_resume["job_category"],
@@ -373,6 +530,50 @@ class SubmissionCompanyDetialView(View):
             return JsonResponse({"errors": str(e)}, status=400)
 
 
+class SubmissionCompanyReadView(View):
+    """
+    기업 유저 지원서 일괄 열람 처리
+    """
+
+    def post(self, request: HttpRequest) -> JsonResponse:
+        """
+        submission_ids 또는 job_posting_id 에 해당하는 미열람 지원서를 읽음 처리
+        """
+        try:
+            token = request.user
+            user = get_valid_company_user(token)
+            payload = SubmissionMarkReadModel(**json.loads(request.body))
+
+            submissions = Submission.objects.filter(
+                job_posting__company_id=user.company_id, is_read=False
+            )
+            if payload.submission_ids is not None:
+                submissions = submissions.filter(
+                    submission_id__in=payload.submission_ids
+                )
+            if payload.job_posting_id is not None:
+                submissions = submissions.filter(
+                    job_posting_id=payload.job_posting_id
+                )
+
+            with transaction.atomic():
+                marked_count = submissions.update(is_read=True)
+                if marked_count:
+                    invalidate_company_stats(user.company_id)
+                    # 공고별 감소량을 모르므로 카운터를 비워 다음 조회 때 다시 채움
+                    reset_unread_counts(user.common_user_id)
+
+            response = SubmissionMarkReadResponseModel(
+                message="Successfully marked submissions as read",
+                marked_count=marked_count,
+            )
+            return JsonResponse(response.model_dump(), status=200)
+        except PermissionDenied as e:
+            return JsonResponse({"errors": str(e)}, status=403)
+        except Exception as e:
+            return JsonResponse({"errors": str(e)}, status=400)
+
+
 def save_submission(
     job_posting: JobPosting, user: UserInfo, resume: Resume
 ) -> Submission:
@@ -394,9 +595,48 @@ def save_submission(
         career_list=career_model,
         certification_list=certification_model,
     )
-    submission = Submission.objects.create(
-        job_posting=job_posting,
-        user=user,
-        snapshot_resume=resume_model.model_dump(mode="json"),
-    )
+    snapshot_resume = resume_model.model_dump(mode="json")
+    with transaction.atomic():
+        submission = Submission.objects.create(
+            job_posting=job_posting,
+            user=user,
+            snapshot=ResumeSnapshot.intern(snapshot_resume),
+            match_score=score_job_posting(job_posting, snapshot_resume),
+        )
+        adjust_submission_count(job_posting.job_posting_id, 1)
+        invalidate_company_stats(job_posting.company_id_id)
+        adjust_unread_count(
+            job_posting.company_id.common_user_id, job_posting.job_posting_id, 1
+        )
     return submission
+
+
+class SubmissionCompanyUnreadView(View):
+    """
+    기업 유저 미열람 지원자 수 조회 (배지 폴링용)
+
+    세션의 기업 계정 ID 로 Redis 카운터만 읽으므로 지원서 테이블을 조회하지 않는다.
+    """
+
+    def get(self, request: HttpRequest) -> JsonResponse:
+        token = request.user
+        if not token.is_authenticated or token.join_type != "company":
+            return JsonResponse(
+                {"errors": "Only 'company' users are allowed."}, status=403
+            )
+        try:
+            total, postings = get_unread_counts(token.common_user_id)
+            response = SubmissionUnreadCountResponseModel(
+                message="Successfully loaded unread count",
+                unread_count=total,
+                job_posting_list=[
+                    JobpostingUnreadCountModel(
+                        job_posting_id=uuid.UUID(job_posting_id),
+                        unread_count=count,
+                    )
+                    for job_posting_id, count in postings.items()
+                ],
+            )
+            return JsonResponse(response.model_dump(), status=200)
+        except Exception as e:
+            return JsonResponse({"errors": str(e)}, status=400)
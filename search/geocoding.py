@@ -0,0 +1,210 @@
+import re
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from functools import lru_cache, reduce
+from operator import or_
+from typing import Iterable, Optional
+
+import requests
+from django.conf import settings
+from django.contrib.gis.db.models.aggregates import Union
+from django.contrib.gis.db.models.functions import Centroid, Transform
+from django.contrib.gis.geos import Point
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from search.models import District, GeocodeCache
+
+DEFAULT_GEOCODING_PROVIDER = "search.geocoding.DistrictCentroidProvider"
+GEOCODE_MISS_TTL = (
+    60 * 60 * 24
+)  # 변환에 실패한 주소를 다시 시도하기까지의 시간 (초)
+
+
+def normalize_address(address: str) -> str:
+    """
+    캐시 키로 쓰기 위해 공백을 정리한 주소
+    """
+    return re.sub(r"\s+", " ", address).strip()
+
+
+class GeocodingError(Exception):
+    """
+    제공자 장애(네트워크 오류, 5xx 응답 등)로 좌표를 변환하지 못함
+    """
+
+
+class GeocodingProvider(ABC):
+    """
+    주소 → 좌표 변환 제공자 인터페이스
+
+    geocode_many 는 정규화된 주소 목록을 받아 찾은 주소만 담은
+    {주소: Point(경도, 위도, srid=4326)} 를 반환하고,
+    제공자 장애로 변환하지 못하면 GeocodingError 를 발생시킨다.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def geocode_many(self, addresses: list[str]) -> dict[str, Point]: ...
+
+
+class DistrictCentroidProvider(GeocodingProvider):
+    """
+    District 경계의 중심점으로 좌표를 근사하는 로컬 제공자 (테스트 / 개발용)
+
+    "시 구 동 ..." 형태의 주소는 읍면동 중심점, 읍면동을 찾지 못하면
+    시군구 전체 경계의 중심점을 사용한다. 외부 API 를 호출하지 않는다.
+    """
+
+    name = "district"
+
+    def geocode_many(self, addresses: list[str]) -> dict[str, Point]:
+        parts = {
+            address: address.split(" ")
+            for address in addresses
+            if len(address.split(" ")) >= 2
+        }
+        if not parts:
+            return {}
+
+        towns: dict[tuple[str, ...], Point] = {
+            (row["city_name"], row["district_name"], row["emd_name"]): row[
+                "center"
+            ]
+            for row in District.objects.filter(
+                reduce(
+                    or_,
+                    [
+                        Q(
+                            city_name=tokens[0],
+                            district_name=tokens[1],
+                            emd_name=tokens[2],
+                        )
+                        for tokens in parts.values()
+                        if len(tokens) >= 3
+                    ],
+                    Q(pk__in=[]),
+                )
+            )
+            .annotate(center=Transform(Centroid("geometry"), 4326))
+            .values("city_name", "district_name", "emd_name", "center")
+        }
+        districts: dict[tuple[str, ...], Point] = {
+            (row["city_name"], row["district_name"]): row["center"]
+            for row in District.objects.filter(
+                reduce(
+                    or_,
+                    [
+                        Q(city_name=tokens[0], district_name=tokens[1])
+                        for tokens in parts.values()
+                    ],
+                )
+            )
+            .values("city_name", "district_name")
+            .annotate(center=Transform(Centroid(Union("geometry")), 4326))
+            .values("city_name", "district_name", "center")
+        }
+
+        points = {}
+        for address, tokens in parts.items():
+            center = towns.get(tuple(tokens[:3])) or districts.get(
+                tuple(tokens[:2])
+            )
+            if center is not None:
+                points[address] = Point(center.x, center.y, srid=4326)
+        return points
+
+
+class KakaoLocalProvider(GeocodingProvider):
+    """
+    카카오 로컬 주소 검색 API 제공자 (운영용)
+    """
+
+    name = "kakao"
+    url = "https://dapi.kakao.com/v2/local/search/address.json"
+    timeout = 3
+
+    def geocode_many(self, addresses: list[str]) -> dict[str, Point]:
+        points = {}
+        with requests.Session() as session:
+            session.headers["Authorization"] = (
+                f"KakaoAK {settings.KAKAO_CLIENT_ID}"
+            )
+            for address in addresses:
+                try:
+                    response = session.get(
+                        self.url,
+                        params={"query": address, "size": "1"},
+                        timeout=self.timeout,
+                    )
+                    response.raise_for_status()
+                    documents = response.json().get("documents") or []
+                except (requests.RequestException, ValueError) as e:
+                    raise GeocodingError(str(e)) from e
+                if documents:
+                    points[address] = Point(
+                        float(documents[0]["x"]),
+                        float(documents[0]["y"]),
+                        srid=4326,
+                    )
+        return points
+
+
+@lru_cache(maxsize=1)
+def get_geocoding_provider() -> GeocodingProvider:
+    """
+    settings.GEOCODING_PROVIDER 에 지정된 제공자 (기본: District 중심점)
+    """
+    path = getattr(settings, "GEOCODING_PROVIDER", DEFAULT_GEOCODING_PROVIDER)
+    return import_string(path)()
+
+
+def geocode_addresses(addresses: Iterable[str]) -> dict[str, Optional[Point]]:
+    """
+    주소 목록을 한 번에 좌표로 변환 ({원래 주소: Point 또는 None})
+
+    현재 제공자의 캐시를 한 번 조회하고, 캐시에 없거나 GEOCODE_MISS_TTL 이
+    지난 실패 주소만 제공자에 넘긴 뒤 결과를 (찾지 못한 주소 포함) 저장한다.
+    제공자 장애 시에는 아무것도 저장하지 않고 GeocodingError 를 그대로 전달한다.
+    """
+    normalized = {address: normalize_address(address) for address in addresses}
+    keys = sorted({key for key in normalized.values() if key})
+    provider = get_geocoding_provider()
+    miss_expired_at = timezone.now() - timedelta(seconds=GEOCODE_MISS_TTL)
+    cached = {
+        entry.address: entry.location
+        for entry in GeocodeCache.objects.filter(
+            Q(location__isnull=False) | Q(updated_at__gte=miss_expired_at),
+            provider=provider.name,
+            address__in=keys,
+        )
+    }
+
+    missing = [key for key in keys if key not in cached]
+    if missing:
+        resolved = provider.geocode_many(missing)
+        GeocodeCache.objects.bulk_create(
+            [
+                GeocodeCache(
+                    provider=provider.name,
+                    address=key,
+                    location=resolved.get(key),
+                )
+                for key in missing
+            ],
+            update_conflicts=True,
+            unique_fields=["provider", "address"],
+            update_fields=["location", "updated_at"],
+        )
+        cached.update({key: resolved.get(key) for key in missing})
+
+    return {
+        address: cached.get(key) if key else None
+        for address, key in normalized.items()
+    }
+
+
+def geocode_address(address: str) -> Optional[Point]:
+    return geocode_addresses([address])[address]
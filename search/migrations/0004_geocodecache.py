@@ -0,0 +1,64 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:04
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0003_district_emd_name_district_emd_no_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GeocodeCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="작성일자"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="작성일자"
+                    ),
+                ),
+                (
+                    "provider",
+                    models.CharField(max_length=20, verbose_name="변환 제공자"),
+                ),
+                (
+                    "address",
+                    models.CharField(
+                        max_length=255, verbose_name="정규화된 주소"
+                    ),
+                ),
+                (
+                    "location",
+                    django.contrib.gis.db.models.fields.PointField(
+                        null=True, srid=4326, verbose_name="좌표"
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("provider", "address"),
+                        name="geocode_cache_provider_address_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
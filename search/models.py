@@ -1,6 +1,8 @@
 from django.contrib.gis.db import models
 from django.db.models.manager import Manager
 
+from utils.models import TimestampModel
+
 
 class District(models.Model):
     city_no = models.CharField(verbose_name="시 고유번호", max_length=10)
@@ -18,3 +20,28 @@ class District(models.Model):
 
     def __str__(self):
         return f"{self.city_name} {self.district_name} {self.emd_name}"
+
+
+class GeocodeCache(TimestampModel):
+    """
+    주소 → 좌표 변환 결과 캐시 (제공자별로 같은 주소는 한 번만 변환)
+    """
+
+    provider = models.CharField(verbose_name="변환 제공자", max_length=20)
+    address = models.CharField(verbose_name="정규화된 주소", max_length=255)
+    location = models.PointField(
+        verbose_name="좌표", srid=4326, null=True
+    )  # 변환에 실패한 주소는 null 로 저장하고 GEOCODE_MISS_TTL 동안만 재사용
+
+    objects = Manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["provider", "address"],
+                name="geocode_cache_provider_address_uniq",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.provider}:{self.address}"
@@ -0,0 +1,105 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.utils import timezone
+
+from search.geocoding import (
+    GEOCODE_MISS_TTL,
+    GeocodingProvider,
+    geocode_addresses,
+)
+from search.models import District, GeocodeCache
+
+
+@pytest.fixture
+def mock_district(db):
+    # 5179 좌표계 기준 약 1km 사각형 경계
+    square = Polygon(
+        (
+            (940000, 1945000),
+            (941000, 1945000),
+            (941000, 1946000),
+            (940000, 1946000),
+            (940000, 1945000),
+        ),
+        srid=5179,
+    )
+    return District.objects.create(
+        city_no="28",
+        city_name="인천광역시",
+        district_no="28237",
+        district_name="부평구",
+        emd_no="2823710100",
+        emd_name="부평동",
+        geometry=MultiPolygon(square, srid=5179),
+    )
+
+
+@pytest.mark.django_db
+def test_geocode_addresses_uses_cache(mock_district):
+    """
+    같은 주소는 한 번만 변환하고 이후에는 캐시 테이블에서 읽음
+    """
+    addresses = [
+        "인천광역시 부평구 부평동 1-1",
+        "인천광역시  부평구 부평동 1-1",
+        "인천광역시 부평구 없는동 3",
+        "알 수 없는 주소",
+    ]
+
+    points = geocode_addresses(addresses)
+
+    assert points[addresses[0]] is not None
+    assert points[addresses[0]] == points[addresses[1]]
+    assert points[addresses[2]] is not None  # 시군구 중심점으로 근사
+    assert points[addresses[3]] is None
+    assert GeocodeCache.objects.count() == 3
+
+    mock_district.delete()
+    assert geocode_addresses(addresses[:1]) == {
+        addresses[0]: points[addresses[0]]
+    }
+
+
+class FixedGeocodingProvider(GeocodingProvider):
+    name = "fixed"
+
+    def __init__(self):
+        self.calls = []
+
+    def geocode_many(self, addresses):
+        self.calls.append(list(addresses))
+        return {"찾는 주소": Point(126.7, 37.5, srid=4326)}
+
+
+@pytest.mark.django_db
+def test_geocode_addresses_cache_per_provider_and_miss_ttl(
+    mock_district, monkeypatch
+):
+    """
+    캐시는 제공자별로 분리되고, 실패한 주소는 GEOCODE_MISS_TTL 이 지나면
+    다시 변환을 시도함
+    """
+    provider = FixedGeocodingProvider()
+    monkeypatch.setattr(
+        "search.geocoding.get_geocoding_provider", lambda: provider
+    )
+    GeocodeCache.objects.create(
+        provider="district", address="찾는 주소", location=None
+    )
+
+    points = geocode_addresses(["찾는 주소", "없는 주소"])
+    assert points["찾는 주소"] == Point(126.7, 37.5, srid=4326)
+    assert points["없는 주소"] is None
+    assert provider.calls == [["없는 주소", "찾는 주소"]]
+
+    geocode_addresses(["찾는 주소", "없는 주소"])
+    assert len(provider.calls) == 1
+
+    GeocodeCache.objects.filter(provider="fixed", address="없는 주소").update(
+        updated_at=timezone.now() - timedelta(seconds=GEOCODE_MISS_TTL + 1)
+    )
+    geocode_addresses(["찾는 주소", "없는 주소"])
+    assert provider.calls[-1] == ["없는 주소"]
+    assert GeocodeCache.objects.filter(provider="fixed").count() == 2
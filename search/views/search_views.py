@@ -8,13 +8,15 @@ from django.http.response import JsonResponse
 from django.views import View
 from pydantic import ValidationError
 
-from job_posting.models import JobPosting, JobPostingBookmark
+from job_posting.bookmarks import get_bookmarked_ids
+from job_posting.models import JobPosting
 from search.models import District
 from search.schemas import (
     JobPostingResultModel,
     JobPostingSearchQueryModel,
     JobPostingSearchResponseModel,
 )
+from user.models import UserInfo
 from utils.common import get_valid_normal_user
 
 
@@ -22,7 +24,8 @@ class SearchView(View):
 
     def get(self, request: HttpRequest) -> JsonResponse:
         token = request.user
-        if token.join_type == "normal":  # type: ignore
+        user: Optional[UserInfo] = None
+        if getattr(token, "join_type", None) == "normal":
             user = get_valid_normal_user(token)
 
         try:
@@ -40,6 +43,9 @@ class SearchView(View):
             return JsonResponse({"errors": e.errors()}, status=400)
 
         qs = JobPosting.objects.all()
+        # 기본은 모집 중인 공고만 검색 (부분 인덱스 사용)
+        if request.GET.get("include_expired") != "true":
+            qs = qs.filter(is_active=True)
         if query.city:
             qs = qs.filter(city__in=query.city)
         if query.district:
@@ -85,6 +91,11 @@ class SearchView(View):
             )
 
         final_qs = JobPosting.objects.filter(job_posting_id__in=job_posting_ids)
+        bookmarked_ids: Set[UUID] = (
+            get_bookmarked_ids(user.common_user_id, job_posting_ids)
+            if user
+            else set()
+        )
 
         results = [
             JobPostingResultModel(
@@ -92,13 +103,7 @@ class SearchView(View):
                 job_posting_title=jp.job_posting_title,
                 city=jp.city,
                 district=jp.district,
-                is_bookmarked=(
-                    JobPostingBookmark.objects.filter(
-                        job_posting=jp, user=user.common_user_id
-                    ).exists()
-                    if user
-                    else False
-                ),
+                is_bookmarked=(jp.job_posting_id in bookmarked_ids),
                 deadline=jp.deadline,
             )
             for jp in final_qs
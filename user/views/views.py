@@ -7,11 +7,13 @@ from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.hashers import make_password
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.views import View
 from pydantic import ValidationError
 
+from job_posting.cards import refresh_company_cards
 from user.models import CommonUser, CompanyInfo, UserInfo
 from user.redis import r
 from user.schemas import (
@@ -381,7 +383,9 @@ class CompanyInfoUpdateView(View):
             ).items():
                 setattr(company_user, field, value)
 
-            company_user.save()
+            with transaction.atomic():
+                company_user.save()
+                refresh_company_cards(company_user)
 
             response_data = CompanyInfoResponse(
                 message="회사 정보가 성공적으로 수정되었습니다.",
@@ -0,0 +1,77 @@
+import base64
+import json
+from typing import Any, Optional, Sequence
+
+from django.db.models import Q, QuerySet
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def parse_page_size(value: Optional[str]) -> int:
+    """
+    쿼리스트링 size 값을 1 ~ MAX_PAGE_SIZE 범위로 보정
+    """
+    if not value:
+        return DEFAULT_PAGE_SIZE
+    size = int(value)
+    if size < 1:
+        raise ValueError("size must be a positive integer.")
+    return min(size, MAX_PAGE_SIZE)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    마지막 행의 정렬 키 값을 불투명한 커서 문자열로 인코딩
+    """
+    raw = json.dumps([str(value) for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list[str]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor.")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor.")
+    return values
+
+
+def keyset_page(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    cursor: Optional[str],
+    size: int,
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """
+    keyset(seek) 방식 페이지네이션
+
+    ordering 은 ("-created_at", "-pk컬럼") 처럼 같은 방향의 정렬 키 목록이며
+    마지막 키는 유일해야 한다. queryset 은 ordering 의 필드를 포함한
+    .values() 쿼리셋이어야 한다. OFFSET 없이 인덱스를 따라 size + 1 행만
+    읽으므로 응답 비용이 테이블 크기가 아닌 페이지 크기에 비례한다.
+    """
+    descending = ordering[0].startswith("-")
+    fields = [field.lstrip("-") for field in ordering]
+    lookup = "lt" if descending else "gt"
+
+    if cursor:
+        values = decode_cursor(cursor)
+        if len(values) != len(fields):
+            raise ValueError("Invalid cursor.")
+        condition = Q()
+        for index, field in enumerate(fields):
+            term = Q(**{f"{field}__{lookup}": values[index]})
+            for prev_field, prev_value in zip(fields[:index], values[:index]):
+                term &= Q(**{prev_field: prev_value})
+            condition |= term
+        queryset = queryset.filter(condition)
+
+    rows = list(queryset.order_by(*ordering)[: size + 1])
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]
+        next_cursor = encode_cursor([last[field] for field in fields])
+    return rows, next_cursor